@@ -0,0 +1,42 @@
+"""Add per-user and per-account lookup indexes
+
+Revision ID: 3f1c2a7b9d10
+Revises: 7c3e1f9a5d24
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "3f1c2a7b9d10"
+down_revision = "7c3e1f9a5d24"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_backtests_user_id_id", "backtests", ["user_id", "id"]),
+    ("ix_backtests_user_id_created_at", "backtests", ["user_id", "created_at"]),
+    ("ix_strategies_user_id_id", "strategies", ["user_id", "id"]),
+    ("ix_strategies_user_id_created_at", "strategies", ["user_id", "created_at"]),
+    ("ix_trading_accounts_user_id_created_at", "trading_accounts", ["user_id", "created_at"]),
+    ("ix_orders_trading_account_id_status", "orders", ["trading_account_id", "status"]),
+    ("ix_orders_trading_account_id_symbol", "orders", ["trading_account_id", "symbol"]),
+    ("ix_orders_trading_account_id_created_at", "orders", ["trading_account_id", "created_at"]),
+    ("ix_positions_trading_account_id_symbol", "positions", ["trading_account_id", "symbol"]),
+]
+
+def _existing_indexes(table):
+    inspector = sa.inspect(op.get_bind())
+    return {index["name"] for index in inspector.get_indexes(table)}
+
+def upgrade():
+    # Skip indexes that already exist (e.g. databases created with create_all)
+    for name, table, columns in INDEXES:
+        if name not in _existing_indexes(table):
+            op.create_index(name, table, columns)
+
+def downgrade():
+    for name, table, columns in reversed(INDEXES):
+        if name in _existing_indexes(table):
+            op.drop_index(name, table_name=table)
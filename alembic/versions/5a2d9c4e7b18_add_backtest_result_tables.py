@@ -0,0 +1,62 @@
+"""Add normalized backtest result tables
+
+Revision ID: 5a2d9c4e7b18
+Revises:
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "5a2d9c4e7b18"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+def _existing_tables():
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+def _existing_columns(table):
+    return {column["name"] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+def upgrade():
+    # Skip objects that already exist (e.g. databases created with create_all)
+    if "metrics" not in _existing_columns("backtests"):
+        op.add_column("backtests", sa.Column("metrics", sa.JSON(), nullable=True))
+
+    tables = _existing_tables()
+    if "backtest_equity_points" not in tables:
+        op.create_table(
+            "backtest_equity_points",
+            sa.Column("backtest_id", sa.Integer(), sa.ForeignKey("backtests.id", ondelete="CASCADE"), primary_key=True),
+            sa.Column("seq", sa.Integer(), primary_key=True),
+            sa.Column("date", sa.DateTime()),
+            sa.Column("equity", sa.Float()),
+        )
+
+    if "backtest_trades" not in tables:
+        op.create_table(
+            "backtest_trades",
+            sa.Column("backtest_id", sa.Integer(), sa.ForeignKey("backtests.id", ondelete="CASCADE"), primary_key=True),
+            sa.Column("seq", sa.Integer(), primary_key=True),
+            sa.Column("date", sa.DateTime()),
+            sa.Column("symbol", sa.String()),
+            sa.Column("action", sa.String()),
+            sa.Column("quantity", sa.Float()),
+            sa.Column("price", sa.Float()),
+            sa.Column("commission", sa.Float()),
+        )
+        op.create_index("ix_backtest_trades_backtest_id_date", "backtest_trades", ["backtest_id", "date"])
+
+def downgrade():
+    tables = _existing_tables()
+    if "backtest_trades" in tables:
+        op.drop_index("ix_backtest_trades_backtest_id_date", table_name="backtest_trades")
+        op.drop_table("backtest_trades")
+    if "backtest_equity_points" in tables:
+        op.drop_table("backtest_equity_points")
+
+    if "metrics" in _existing_columns("backtests"):
+        with op.batch_alter_table("backtests") as batch_op:
+            batch_op.drop_column("metrics")
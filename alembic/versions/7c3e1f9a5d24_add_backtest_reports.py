@@ -0,0 +1,33 @@
+"""Add stored backtest reports
+
+Revision ID: 7c3e1f9a5d24
+Revises: 5a2d9c4e7b18
+Create Date: 2026-10-19 11:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "7c3e1f9a5d24"
+down_revision = "5a2d9c4e7b18"
+branch_labels = None
+depends_on = None
+
+def _existing_tables():
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+def upgrade():
+    # Skip the table if it already exists (e.g. databases created with create_all)
+    if "backtest_reports" not in _existing_tables():
+        op.create_table(
+            "backtest_reports",
+            sa.Column("backtest_id", sa.Integer(), sa.ForeignKey("backtests.id", ondelete="CASCADE"), primary_key=True),
+            sa.Column("content", sa.LargeBinary()),
+            sa.Column("etag", sa.String()),
+            sa.Column("created_at", sa.DateTime()),
+        )
+
+def downgrade():
+    if "backtest_reports" in _existing_tables():
+        op.drop_table("backtest_reports")
@@ -0,0 +1,31 @@
+"""Add position lookup index for broker sync
+
+Revision ID: 8b4e6d2f0a31
+Revises: 3f1c2a7b9d10
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "8b4e6d2f0a31"
+down_revision = "3f1c2a7b9d10"
+branch_labels = None
+depends_on = None
+
+def _existing_indexes(table):
+    inspector = sa.inspect(op.get_bind())
+    return {index["name"] for index in inspector.get_indexes(table)}
+
+def upgrade():
+    if "ix_positions_trading_account_id_external_id" not in _existing_indexes("positions"):
+        op.create_index(
+            "ix_positions_trading_account_id_external_id",
+            "positions",
+            ["trading_account_id", "external_id"],
+        )
+
+def downgrade():
+    if "ix_positions_trading_account_id_external_id" in _existing_indexes("positions"):
+        op.drop_index("ix_positions_trading_account_id_external_id", table_name="positions")
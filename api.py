@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
 from app.api.endpoints import auth, users, strategies, backtests, trading
+from app.api.endpoints import auth_async, strategies_async, backtests_async, bulk_trading, trading_stream
 
 api_router = APIRouter()
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
@@ -8,4 +9,10 @@ api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(strategies.router, prefix="/strategies", tags=["strategies"])
 api_router.include_router(backtests.router, prefix="/backtests", tags=["backtests"])
 api_router.include_router(trading.router, prefix="/trading", tags=["trading"])
+api_router.include_router(bulk_trading.router, prefix="/trading", tags=["trading"])
+api_router.include_router(trading_stream.router, prefix="/trading", tags=["trading"])
 
+# Async variants of the CRUD endpoints, served without the threadpool
+api_router.include_router(auth_async.router, prefix="/async/auth", tags=["auth"])
+api_router.include_router(strategies_async.router, prefix="/async/strategies", tags=["strategies"])
+api_router.include_router(backtests_async.router, prefix="/async/backtests", tags=["backtests"])
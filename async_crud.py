@@ -0,0 +1,162 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, List, Optional
+
+from app.core.security import get_password_hash_async, pwd_context, verify_password_async
+from app.db.models.backtest import Backtest
+from app.db.models.strategy import Strategy
+from app.db.models.user import User
+
+class AsyncCRUDService:
+    """
+    Create, read, update and delete user-owned rows with an async session.
+    """
+    
+    def __init__(self, model: Any):
+        """
+        Initialize the service.
+        
+        Args:
+            model: The SQLAlchemy model (must have id and user_id columns)
+        """
+        self.model = model
+    
+    async def get(self, db: AsyncSession, id: int) -> Optional[Any]:
+        """
+        Get a row by ID.
+        
+        Args:
+            db: The async database session
+            id: The row ID
+            
+        Returns:
+            The row, or None if it does not exist
+        """
+        return await db.get(self.model, id)
+    
+    async def get_multi(self, db: AsyncSession, user_id: int, skip: int = 0, limit: int = 100) -> List[Any]:
+        """
+        Get the rows of a user.
+        
+        Args:
+            db: The async database session
+            user_id: The user ID
+            skip: The number of rows to skip
+            limit: The maximum number of rows to return
+            
+        Returns:
+            A list of rows
+        """
+        result = await db.execute(
+            select(self.model)
+            .where(self.model.user_id == user_id)
+            .order_by(self.model.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        return result.scalars().all()
+    
+    async def create(self, db: AsyncSession, obj_in: Any, user_id: int) -> Any:
+        """
+        Create a row.
+        
+        Args:
+            db: The async database session
+            obj_in: The input schema
+            user_id: The owner's user ID
+            
+        Returns:
+            The created row
+        """
+        db_obj = self.model(**obj_in.dict(), user_id=user_id)
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+    
+    async def update(self, db: AsyncSession, db_obj: Any, obj_in: Any) -> Any:
+        """
+        Update a row with the fields set in the input schema.
+        
+        Args:
+            db: The async database session
+            db_obj: The row
+            obj_in: The input schema
+            
+        Returns:
+            The updated row
+        """
+        for field, value in obj_in.dict(exclude_unset=True).items():
+            setattr(db_obj, field, value)
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+    
+    async def delete(self, db: AsyncSession, db_obj: Any) -> Any:
+        """
+        Delete a row.
+        
+        Args:
+            db: The async database session
+            db_obj: The row
+            
+        Returns:
+            The deleted row
+        """
+        await db.delete(db_obj)
+        await db.commit()
+        return db_obj
+
+class AsyncUserService:
+    """
+    Look up and authenticate users with an async session.
+    """
+    
+    async def get_by_email(self, db: AsyncSession, email: str) -> Optional[User]:
+        """
+        Get a user by email.
+        
+        Args:
+            db: The async database session
+            email: The email address
+            
+        Returns:
+            The user, or None if no user has the email
+        """
+        result = await db.execute(select(User).where(User.email == email))
+        return result.scalars().first()
+    
+    async def authenticate(self, db: AsyncSession, email: str, password: str) -> Optional[User]:
+        """
+        Authenticate a user, hashing on the password hashing pool.
+        
+        Hashes made with an outdated scheme or cost factor are replaced
+        after a successful login.
+        
+        Args:
+            db: The async database session
+            email: The email address
+            password: The plain password
+            
+        Returns:
+            The user, or None if the email or password is wrong
+            
+        Raises:
+            PasswordHasherBusy: If the hashing queue is full
+        """
+        user = await self.get_by_email(db, email)
+        if user is None:
+            return None
+        
+        if not await verify_password_async(password, user.hashed_password):
+            return None
+        
+        if pwd_context.needs_update(user.hashed_password):
+            user.hashed_password = await get_password_hash_async(password)
+            await db.commit()
+        
+        return user
+
+strategy_async_service = AsyncCRUDService(Strategy)
+backtest_async_service = AsyncCRUDService(Backtest)
+user_async_service = AsyncUserService()
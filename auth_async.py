@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import get_async_db
+from app.core.security import create_access_token
+from app.schemas.auth import Token
+from app.services.async_crud import user_async_service
+
+router = APIRouter()
+
+@router.post("/login", response_model=Token)
+async def login(
+    db: AsyncSession = Depends(get_async_db),
+    form_data: OAuth2PasswordRequestForm = Depends(),
+):
+    """
+    Get an access token, verifying the password off the event loop.
+    """
+    # Raises PasswordHasherBusy (429) when too many logins are queued
+    user = await user_async_service.authenticate(db, form_data.username, form_data.password)
+    if not user:
+        raise HTTPException(status_code=400, detail="Incorrect email or password")
+    if not user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    
+    return {
+        "access_token": create_access_token(user.id),
+        "token_type": "bearer",
+    }
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, JSON, Float
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, JSON, Index, Float
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -21,10 +21,29 @@ class Backtest(Base):
     slippage = Column(Float, default=0.0)
     status = Column(String)  # "pending", "running", "completed", "failed"
     error = Column(String, nullable=True)
-    results = Column(JSON, nullable=True)
+    results = Column(JSON, nullable=True)  # Legacy; results are stored in backtest_equity_points/backtest_trades
+    metrics = Column(JSON, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     user = relationship("User", back_populates="backtests")
     strategy = relationship("Strategy", back_populates="backtests")
+    equity_points = relationship(
+        "BacktestEquityPoint",
+        back_populates="backtest",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="noload",
+    )
+    trades = relationship(
+        "BacktestTrade",
+        back_populates="backtest",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="noload",
+    )
 
+    __table_args__ = (
+        Index("ix_backtests_user_id_id", "user_id", "id"),
+        Index("ix_backtests_user_id_created_at", "user_id", "created_at"),
+    )
@@ -0,0 +1,41 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Float, Index, LargeBinary
+from sqlalchemy.orm import relationship
+from datetime import datetime
+
+from app.db.session import Base
+
+class BacktestEquityPoint(Base):
+    __tablename__ = "backtest_equity_points"
+
+    backtest_id = Column(Integer, ForeignKey("backtests.id", ondelete="CASCADE"), primary_key=True)
+    seq = Column(Integer, primary_key=True)  # Position in the equity curve
+    date = Column(DateTime)
+    equity = Column(Float)
+    
+    backtest = relationship("Backtest", back_populates="equity_points")
+
+class BacktestTrade(Base):
+    __tablename__ = "backtest_trades"
+
+    backtest_id = Column(Integer, ForeignKey("backtests.id", ondelete="CASCADE"), primary_key=True)
+    seq = Column(Integer, primary_key=True)  # Position in the trade list
+    date = Column(DateTime)
+    symbol = Column(String)
+    action = Column(String)  # "buy", "sell"
+    quantity = Column(Float)
+    price = Column(Float)
+    commission = Column(Float)
+    
+    backtest = relationship("Backtest", back_populates="trades")
+
+    __table_args__ = (
+        Index("ix_backtest_trades_backtest_id_date", "backtest_id", "date"),
+    )
+
+class BacktestReport(Base):
+    __tablename__ = "backtest_reports"
+
+    backtest_id = Column(Integer, ForeignKey("backtests.id", ondelete="CASCADE"), primary_key=True)
+    content = Column(LargeBinary)  # gzip-compressed HTML
+    etag = Column(String)
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,390 @@
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from typing import Dict, Iterator, List, Optional, Union
+import math
+
+from app.db.models.backtest import Backtest
+from app.db.models.backtest_result import BacktestEquityPoint, BacktestTrade, BacktestReport
+
+EQUITY_FIELDS = ["date", "equity"]
+TRADE_FIELDS = ["date", "symbol", "action", "quantity", "price", "commission"]
+MAX_TRADES_PAGE = 10000
+
+def _to_records(data, fields: List[str]) -> List[Dict]:
+    """
+    Convert engine output to plain records with the given fields.
+
+    Args:
+        data: A DataFrame or a list of dicts
+        fields: The fields to keep
+
+    Returns:
+        A list of dicts
+    """
+    import pandas as pd
+
+    frame = pd.DataFrame(data)
+    if frame.empty:
+        return []
+
+    frame = frame.reindex(columns=fields)
+    if "date" in frame.columns:
+        frame["date"] = pd.to_datetime(frame["date"]).dt.to_pydatetime()
+
+    return frame.astype(object).where(frame.notna(), None).to_dict(orient="records")
+
+def _to_columns(records: List[Dict], fields: Optional[List[str]] = None) -> Dict[str, List]:
+    """
+    Convert records to a dictionary of columns.
+
+    Args:
+        records: The records
+        fields: The fields to include (defaults to all fields of the first record)
+
+    Returns:
+        A dictionary mapping each field to a list of values
+    """
+    keys = list(records[0].keys()) if records else []
+    if fields:
+        keys = [key for key in keys if key in fields]
+    return {key: [record.get(key) for record in records] for key in keys}
+
+def _rows_to_columns(rows: List, fields: List[str]) -> Dict[str, List]:
+    """
+    Convert query rows to a dictionary of columns.
+
+    Args:
+        rows: The rows, with values in the order of `fields`
+        fields: The fields
+
+    Returns:
+        A dictionary mapping each field to a list of values
+    """
+    if not rows:
+        return {field: [] for field in fields}
+    return {field: list(values) for field, values in zip(fields, zip(*rows))}
+
+def _to_builtin(value):
+    """
+    Convert NumPy scalars to Python builtins so they can be stored as JSON.
+
+    Args:
+        value: The value
+
+    Returns:
+        The converted value
+    """
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+class BacktestResultsService:
+    def save(self, db: Session, backtest: Backtest, results: Dict):
+        """
+        Store backtest results in the normalized result tables.
+
+        Args:
+            db: The database session
+            backtest: The backtest
+            results: The backtest results with equity curve, trades and metrics
+        """
+        # Replace any previous results and invalidate the rendered report
+        db.query(BacktestEquityPoint).filter(BacktestEquityPoint.backtest_id == backtest.id).delete(synchronize_session=False)
+        db.query(BacktestTrade).filter(BacktestTrade.backtest_id == backtest.id).delete(synchronize_session=False)
+        # A report loaded in this session is removed from it too, so it can be rendered again
+        db.query(BacktestReport).filter(BacktestReport.backtest_id == backtest.id).delete(synchronize_session="evaluate")
+
+        equity_points = _to_records(results.get("equity_curve"), EQUITY_FIELDS)
+        for seq, point in enumerate(equity_points):
+            point["backtest_id"] = backtest.id
+            point["seq"] = seq
+
+        trades = _to_records(results.get("trades"), TRADE_FIELDS)
+        for seq, trade in enumerate(trades):
+            trade["backtest_id"] = backtest.id
+            trade["seq"] = seq
+
+        # Bulk insert without building ORM objects
+        if equity_points:
+            db.execute(BacktestEquityPoint.__table__.insert(), equity_points)
+        if trades:
+            db.execute(BacktestTrade.__table__.insert(), trades)
+
+        backtest.metrics = {key: _to_builtin(value) for key, value in (results.get("metrics") or {}).items()}
+        backtest.results = None
+
+    def has_results(self, backtest: Backtest) -> bool:
+        """
+        Check whether a backtest has stored results.
+
+        Args:
+            backtest: The backtest
+
+        Returns:
+            True if results are stored, False otherwise
+        """
+        return backtest.metrics is not None or bool(backtest.results)
+
+    def count(self, db: Session, backtest_id: int) -> Dict[str, int]:
+        """
+        Count the stored equity points and trades of a backtest.
+
+        Args:
+            db: The database session
+            backtest_id: The backtest ID
+
+        Returns:
+            A dictionary with the equity point and trade counts
+        """
+        return {
+            "equity_points": db.query(func.count(BacktestEquityPoint.seq)).filter(BacktestEquityPoint.backtest_id == backtest_id).scalar(),
+            "trades": db.query(func.count(BacktestTrade.seq)).filter(BacktestTrade.backtest_id == backtest_id).scalar(),
+        }
+
+    def get_equity_curve(
+        self,
+        db: Session,
+        backtest_id: int,
+        skip: int = 0,
+        limit: Optional[int] = None,
+        max_points: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        columnar: bool = False,
+    ) -> Union[List[Dict], Dict[str, List]]:
+        """
+        Get a page of the equity curve.
+
+        Args:
+            db: The database session
+            backtest_id: The backtest ID
+            skip: The number of points to skip
+            limit: The maximum number of points to return
+            max_points: Down-sample the page to at most this many points
+            fields: The fields to return
+            columnar: Return a dictionary of columns instead of a list of points
+
+        Returns:
+            A list of equity points, or a dictionary of columns
+        """
+        fields = [field for field in (fields or EQUITY_FIELDS) if field in EQUITY_FIELDS]
+        if not fields:
+            return {} if columnar else []
+        query = db.query(*[getattr(BacktestEquityPoint, field) for field in fields]).filter(
+            BacktestEquityPoint.backtest_id == backtest_id,
+            BacktestEquityPoint.seq >= skip,
+        )
+
+        if limit is not None:
+            query = query.filter(BacktestEquityPoint.seq < skip + limit)
+
+        # Down-sample with a fixed stride over the primary key
+        if max_points:
+            total = self.count(db, backtest_id)["equity_points"] - skip
+            if limit is not None:
+                total = min(total, limit)
+            step = max(1, math.ceil(total / max_points))
+            if step > 1:
+                query = query.filter((BacktestEquityPoint.seq - skip) % step == 0)
+
+        rows = query.order_by(BacktestEquityPoint.seq).all()
+        if columnar:
+            return _rows_to_columns(rows, fields)
+        return [dict(zip(fields, row)) for row in rows]
+
+    def get_trades(
+        self,
+        db: Session,
+        backtest_id: int,
+        skip: int = 0,
+        limit: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        columnar: bool = False,
+    ) -> Union[List[Dict], Dict[str, List]]:
+        """
+        Get a page of the trade list.
+
+        Args:
+            db: The database session
+            backtest_id: The backtest ID
+            skip: The number of trades to skip
+            limit: The maximum number of trades to return
+            fields: The fields to return
+            columnar: Return a dictionary of columns instead of a list of trades
+
+        Returns:
+            A list of trades, or a dictionary of columns
+        """
+        fields = [field for field in (fields or TRADE_FIELDS) if field in TRADE_FIELDS]
+        if not fields:
+            return {} if columnar else []
+        query = db.query(*[getattr(BacktestTrade, field) for field in fields]).filter(
+            BacktestTrade.backtest_id == backtest_id,
+            BacktestTrade.seq >= skip,
+        )
+
+        if limit is not None:
+            query = query.filter(BacktestTrade.seq < skip + limit)
+
+        rows = query.order_by(BacktestTrade.seq).all()
+        if columnar:
+            return _rows_to_columns(rows, fields)
+        return [dict(zip(fields, row)) for row in rows]
+
+    def get_trades_page(self, db: Session, backtest: Backtest, skip: int = 0, limit: int = 1000) -> List[Dict]:
+        """
+        Get a page of the trade list without loading the equity curve.
+
+        Args:
+            db: The database session
+            backtest: The backtest
+            skip: The number of trades to skip
+            limit: The maximum number of trades to return
+
+        Returns:
+            A list of trades
+        """
+        if backtest.results:
+            trades = backtest.results.get("trades") or []
+            return trades[skip:skip + limit]
+        return self.get_trades(db, backtest.id, skip=skip, limit=limit)
+
+    def iter_trades(self, db: Session, backtest: Backtest, batch_size: int = 5000) -> Iterator[List[Dict]]:
+        """
+        Iterate over the complete trade list in batches.
+
+        Args:
+            db: The database session
+            backtest: The backtest
+            batch_size: The number of trades per batch
+
+        Returns:
+            An iterator over lists of trades
+        """
+        if backtest.results:
+            trades = backtest.results.get("trades") or []
+            for start in range(0, len(trades), batch_size):
+                yield trades[start:start + batch_size]
+            return
+
+        # Keyset pagination over the primary key keeps each batch query cheap
+        skip = 0
+        while True:
+            batch = self.get_trades(db, backtest.id, skip=skip, limit=batch_size)
+            if not batch:
+                return
+            yield batch
+            skip += batch_size
+
+    def get_page(
+        self,
+        db: Session,
+        backtest: Backtest,
+        skip: int = 0,
+        limit: Optional[int] = None,
+        trades_skip: int = 0,
+        trades_limit: Optional[int] = None,
+        max_points: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        columnar: bool = False,
+    ) -> Dict:
+        """
+        Get a page of backtest results.
+
+        Args:
+            db: The database session
+            backtest: The backtest
+            skip: The number of equity points to skip
+            limit: The maximum number of equity points to return
+            trades_skip: The number of trades to skip
+            trades_limit: The maximum number of trades to return
+            max_points: Down-sample the equity page to at most this many points
+            fields: The fields to return for equity points and trades
+            columnar: Return the equity curve and trades as dictionaries of columns
+
+        Returns:
+            A dictionary with the equity curve page, trades page and metrics
+        """
+        if backtest.results:
+            # Legacy JSON results are paged in memory
+            equity_curve = list(backtest.results.get("equity_curve") or [])
+            trades = list(backtest.results.get("trades") or [])
+            equity_curve = equity_curve[skip:None if limit is None else skip + limit]
+            trades = trades[trades_skip:None if trades_limit is None else trades_skip + trades_limit]
+            if max_points and len(equity_curve) > max_points:
+                equity_curve = equity_curve[::math.ceil(len(equity_curve) / max_points)]
+            if columnar:
+                equity_curve = _to_columns(equity_curve, fields)
+                trades = _to_columns(trades, fields)
+            elif fields:
+                equity_curve = [{k: v for k, v in point.items() if k in fields} for point in equity_curve]
+                trades = [{k: v for k, v in trade.items() if k in fields} for trade in trades]
+
+            return {
+                "equity_curve": equity_curve,
+                "trades": trades,
+                "metrics": backtest.results.get("metrics") or {},
+            }
+
+        return {
+            "equity_curve": self.get_equity_curve(db, backtest.id, skip, limit, max_points, fields, columnar),
+            "trades": self.get_trades(db, backtest.id, trades_skip, trades_limit, fields, columnar),
+            "metrics": backtest.metrics or {},
+        }
+
+    def load_for_report(self, db: Session, backtest: Backtest, max_trades: int) -> Dict:
+        """
+        Load the results of a backtest needed to render its report.
+
+        The trade list is only loaded if it is short enough to be listed in
+        full; longer lists are read in batches with `iter_trades`.
+
+        Args:
+            db: The database session
+            backtest: The backtest
+            max_trades: The maximum number of trades to load
+
+        Returns:
+            A dictionary with the equity curve, metrics, total number of
+            trades and the trades (None if there are more than `max_trades`)
+        """
+        if backtest.results:
+            trades = backtest.results.get("trades") or []
+            return {
+                "equity_curve": backtest.results.get("equity_curve") or [],
+                "trades": trades if len(trades) <= max_trades else None,
+                "total_trades": len(trades),
+                "metrics": backtest.results.get("metrics") or {},
+            }
+
+        total_trades = self.count(db, backtest.id)["trades"]
+        return {
+            "equity_curve": self.get_equity_curve(db, backtest.id),
+            "trades": self.get_trades(db, backtest.id) if total_trades <= max_trades else None,
+            "total_trades": total_trades,
+            "metrics": backtest.metrics or {},
+        }
+
+    def load(self, db: Session, backtest: Backtest) -> Dict:
+        """
+        Load the complete results of a backtest.
+
+        Args:
+            db: The database session
+            backtest: The backtest
+
+        Returns:
+            A dictionary with the equity curve, trades and metrics
+        """
+        # Backtests run before the result tables existed keep their JSON results
+        if backtest.results:
+            return backtest.results
+
+        return {
+            "equity_curve": self.get_equity_curve(db, backtest.id),
+            "trades": self.get_trades(db, backtest.id),
+            "metrics": backtest.metrics or {},
+        }
+
+backtest_results_service = BacktestResultsService()
@@ -1,26 +1,86 @@
 from sqlalchemy.orm import Session
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 from datetime import datetime
+import functools
+import gzip
+import hashlib
+import logging
+import zlib
 
 from app.db.models.backtest import Backtest
+from app.db.models.backtest_result import BacktestReport
 from app.db.models.strategy import Strategy
 from app.schemas.backtest import BacktestCreate
-from app.backtester.data.fetcher import DataFetcher
-from app.backtester.strategies.factory import StrategyFactory
-from app.backtester.engine.backtest import Backtest as BacktestEngine
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.backtest_results import backtest_results_service
+
+# The backtester stack (pandas, yfinance, the engine) is imported on first
+# use so that it stays out of the API's cold start
+if TYPE_CHECKING:
+    import pandas as pd
+    from app.backtester.engine.result_cache import ResultCache
+
+logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=16)
+def _fetch_market_data(symbol: str, start_date: datetime, end_date: datetime) -> "pd.DataFrame":
+    """
+    Fetch market data, keeping recent ranges in memory.
+
+    Args:
+        symbol: The symbol
+        start_date: The start date
+        end_date: The end date
+
+    Returns:
+        The market data
+    """
+    from app.backtester.data.fetcher import DataFetcher
+    return DataFetcher().fetch_data(symbol, start_date, end_date)
 
 class BacktesterService:
+    def __init__(self):
+        self._result_cache = None
+    
+    @property
+    def result_cache(self) -> Optional["ResultCache"]:
+        """
+        Get the result cache, opening it on first use.
+        
+        Returns:
+            The result cache, or None if caching is disabled
+        """
+        if not settings.RESULT_CACHE_ENABLED:
+            return None
+        
+        if self._result_cache is None:
+            from app.backtester.engine.result_cache import ResultCache
+            self._result_cache = ResultCache(
+                db_path=settings.RESULT_CACHE_PATH,
+                max_size_bytes=settings.RESULT_CACHE_MAX_SIZE_MB * 1024 * 1024,
+                max_entries=settings.RESULT_CACHE_MAX_ENTRIES,
+            )
+        
+        return self._result_cache
+    
     def run_backtest(
         self,
         db: Session,
         backtest_id: int,
+        use_cache: bool = True,
     ) -> Dict:
         """
         Run a backtest.
         
+        Results are cached by strategy version, parameters, backtest
+        settings and a fingerprint of the input data, so identical
+        requests return the stored results without re-running.
+        
         Args:
             db: The database session
             backtest_id: The backtest ID
+            use_cache: Whether to read and write the result cache
             
         Returns:
             The backtest results
@@ -35,6 +95,15 @@ class BacktesterService:
         if not strategy:
             raise ValueError(f"Strategy not found: {backtest.strategy_id}")
         
+        from app.backtester.data.fetcher import DataFetcher
+        from app.backtester.strategies.factory import StrategyFactory
+        from app.backtester.engine.backtest import Backtest as BacktestEngine
+        from app.backtester.engine.result_cache import (
+            fingerprint_data,
+            make_cache_key,
+            strategy_version,
+        )
+        
         # Update backtest status
         backtest.status = "running"
         db.commit()
@@ -49,11 +118,35 @@ class BacktesterService:
             )
             
             # Create strategy
+            parameters = {**strategy.parameters, **backtest.parameters}
             strategy_instance = StrategyFactory.create_strategy(
                 strategy.type,
-                {**strategy.parameters, **backtest.parameters},
+                parameters,
             )
             
+            # Return stored results for identical inputs
+            result_cache = self.result_cache if use_cache else None
+            if result_cache is not None:
+                cache_key = make_cache_key(
+                    strategy.type,
+                    strategy_version(strategy_instance, strategy.code),
+                    parameters,
+                    fingerprint_data(data),
+                    symbol=backtest.symbol,
+                    start_date=backtest.start_date,
+                    end_date=backtest.end_date,
+                    initial_capital=backtest.initial_capital,
+                    commission=backtest.commission,
+                    slippage=backtest.slippage,
+                )
+                results = result_cache.get(cache_key)
+                if results is not None:
+                    backtest_results_service.save(db, backtest, results)
+                    backtest.status = "completed"
+                    db.commit()
+                    
+                    return results
+            
             # Run backtest
             backtest_engine = BacktestEngine(
                 strategy=strategy_instance,
@@ -65,8 +158,11 @@ class BacktesterService:
             
             results = backtest_engine.run()
             
+            if result_cache is not None:
+                result_cache.set(cache_key, results)
+            
             # Update backtest
-            backtest.results = results
+            backtest_results_service.save(db, backtest, results)
             backtest.status = "completed"
             db.commit()
             
@@ -79,6 +175,150 @@ class BacktesterService:
             
             raise
 
+    def run_walk_forward(
+        self,
+        db: Session,
+        backtest_id: int,
+        parameter_grid: Dict[str, List],
+        in_sample_days: int,
+        out_of_sample_days: int,
+        step_days: Optional[int] = None,
+        anchored: bool = False,
+        objective: str = "sharpe_ratio",
+        n_jobs: int = 1,
+    ) -> Dict:
+        """
+        Run a walk-forward optimization over a backtest's date range.
+        
+        Args:
+            db: The database session
+            backtest_id: The backtest ID
+            parameter_grid: A dictionary mapping parameter names to candidate values
+            in_sample_days: The length of each in-sample window in days
+            out_of_sample_days: The length of each out-of-sample window in days
+            step_days: The distance between consecutive windows in days
+            anchored: Whether every in-sample window starts at the start date
+            objective: The performance metric to maximize in-sample
+            n_jobs: The number of worker processes for the optimization
+            
+        Returns:
+            The walk-forward results
+        """
+        from app.backtester.data.fetcher import DataFetcher
+        from app.backtester.engine.walk_forward import WalkForward
+        
+        # Get backtest
+        backtest = db.query(Backtest).filter(Backtest.id == backtest_id).first()
+        if not backtest:
+            raise ValueError(f"Backtest not found: {backtest_id}")
+        
+        # Get strategy
+        strategy = db.query(Strategy).filter(Strategy.id == backtest.strategy_id).first()
+        if not strategy:
+            raise ValueError(f"Strategy not found: {backtest.strategy_id}")
+        
+        # Fetch data once for the whole range
+        data_fetcher = DataFetcher()
+        data = data_fetcher.fetch_data(
+            backtest.symbol,
+            backtest.start_date,
+            backtest.end_date,
+        )
+        
+        # Parameters not being optimized keep their configured values
+        base_parameters = {**strategy.parameters, **backtest.parameters}
+        parameter_grid = {
+            **{name: [value] for name, value in base_parameters.items()},
+            **parameter_grid,
+        }
+        
+        walk_forward = WalkForward(
+            strategy_type=strategy.type,
+            parameter_grid=parameter_grid,
+            data=data,
+            in_sample_days=in_sample_days,
+            out_of_sample_days=out_of_sample_days,
+            step_days=step_days,
+            anchored=anchored,
+            initial_capital=backtest.initial_capital,
+            commission=backtest.commission,
+            slippage=backtest.slippage,
+            objective=objective,
+            n_jobs=n_jobs,
+        )
+        
+        return walk_forward.run()
+
+    def get_market_data(self, backtest: Backtest) -> Optional["pd.DataFrame"]:
+        """
+        Get the market data a backtest ran on, for charts.
+        
+        The data is fetched like it is for the run and the most recent
+        ranges are kept in memory, so repeated chart requests do not
+        download it again.
+        
+        Args:
+            backtest: The backtest
+            
+        Returns:
+            The market data, or None if it cannot be fetched
+        """
+        if not backtest.symbol or backtest.start_date is None or backtest.end_date is None:
+            return None
+        
+        try:
+            return _fetch_market_data(backtest.symbol, backtest.start_date, backtest.end_date)
+        except Exception:
+            logger.exception(f"Failed to fetch market data for backtest {backtest.id}")
+            return None
+
+    def run_monte_carlo(
+        self,
+        db: Session,
+        backtest_id: int,
+        method: str = "trades",
+        n_paths: int = 10000,
+        confidence: float = 0.95,
+        block_size: int = 20,
+        seed: Optional[int] = None,
+        n_jobs: int = 1,
+    ) -> Dict:
+        """
+        Run a Monte Carlo robustness analysis on a backtest's stored results.
+
+        Args:
+            db: The database session
+            backtest_id: The backtest ID
+            method: The resampling method ("trades" or "bootstrap")
+            n_paths: The number of paths to simulate
+            confidence: The confidence level of the reported intervals
+            block_size: The block size for the bootstrap
+            seed: The random seed
+            n_jobs: The number of worker processes
+
+        Returns:
+            The Monte Carlo results
+        """
+        from app.backtester.engine.monte_carlo import run_monte_carlo
+
+        # Get backtest
+        backtest = db.query(Backtest).filter(Backtest.id == backtest_id).first()
+        if not backtest:
+            raise ValueError(f"Backtest not found: {backtest_id}")
+
+        if not backtest_results_service.has_results(backtest):
+            raise ValueError(f"Backtest results not found: {backtest_id}")
+
+        return run_monte_carlo(
+            backtest_results_service.load(db, backtest),
+            method=method,
+            n_paths=n_paths,
+            confidence=confidence,
+            block_size=block_size,
+            n_jobs=n_jobs,
+            seed=seed,
+        )
+
     def generate_report(
         self,
         db: Session,
@@ -94,19 +334,95 @@ class BacktesterService:
         Returns:
             The backtest report as HTML
         """
+        report = self.get_report(db, backtest_id)
+        
+        return gzip.decompress(report.content).decode("utf-8")
+
+    def get_report(
+        self,
+        db: Session,
+        backtest_id: int,
+    ) -> BacktestReport:
+        """
+        Get the stored report of a backtest, rendering it if needed.
+        
+        Args:
+            db: The database session
+            backtest_id: The backtest ID
+            
+        Returns:
+            The stored report with gzip-compressed HTML
+        """
         # Get backtest
         backtest = db.query(Backtest).filter(Backtest.id == backtest_id).first()
         if not backtest:
             raise ValueError(f"Backtest not found: {backtest_id}")
         
-        if not backtest.results:
+        if not backtest_results_service.has_results(backtest):
             raise ValueError(f"Backtest results not found: {backtest_id}")
         
-        # Generate report
-        from app.backtester.visualization.reports import create_performance_report
-        report = create_performance_report(backtest.results)
+        report = db.query(BacktestReport).filter(BacktestReport.backtest_id == backtest_id).first()
+        if report is None:
+            report = self.render_report(db, backtest)
         
         return report
 
+    def render_report(
+        self,
+        db: Session,
+        backtest: Backtest,
+    ) -> BacktestReport:
+        """
+        Render a backtest report and store it compressed.
+        
+        Args:
+            db: The database session
+            backtest: The backtest
+            
+        Returns:
+            The stored report
+        """
+        from app.backtester.visualization.reports import MAX_REPORT_TRADES, stream_performance_report
+        
+        # Long trade lists are read in batches instead of loaded in full
+        chunks = stream_performance_report(
+            backtest_results_service.load_for_report(db, backtest, MAX_REPORT_TRADES),
+            max_trades=MAX_REPORT_TRADES,
+            trades_url=f"{settings.API_V1_STR}/backtests/{backtest.id}/trades?format=csv",
+            trade_batches=backtest_results_service.iter_trades(db, backtest),
+        )
+        
+        # Compress the report as it is rendered
+        compressor = zlib.compressobj(wbits=31)
+        content = b"".join(compressor.compress(chunk.encode("utf-8")) for chunk in chunks) + compressor.flush()
+        report = db.merge(BacktestReport(
+            backtest_id=backtest.id,
+            content=content,
+            etag=hashlib.sha256(content).hexdigest()[:32],
+            created_at=datetime.utcnow(),
+        ))
+        db.commit()
+        
+        return report
+
+    def render_report_in_background(self, backtest_id: int):
+        """
+        Render a backtest report with its own database session.
+        
+        Args:
+            backtest_id: The backtest ID
+        """
+        db = SessionLocal()
+        try:
+            backtest = db.query(Backtest).filter(Backtest.id == backtest_id).first()
+            if backtest and backtest_results_service.has_results(backtest):
+                self.render_report(db, backtest)
+        except Exception:
+            # The report is rendered on demand if background rendering fails
+            logger.exception(f"Failed to render report for backtest {backtest_id}")
+            db.rollback()
+        finally:
+            db.close()
+
 backtester_service = BacktesterService()
 
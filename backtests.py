@@ -1,15 +1,50 @@
-from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Callable, Iterator, List, Optional
+from email.utils import format_datetime, parsedate_to_datetime
+from datetime import timezone
+import csv
+import gzip
+import io
 
 from app.api.dependencies import get_db, get_current_active_user
+from app.api.responses import FastJSONResponse
+from app.core.compression import accepts_encoding
+from app.db.session import SessionLocal
+from app.db.models.backtest import Backtest as BacktestModel
 from app.db.models.user import User
 from app.schemas.backtest import Backtest, BacktestCreate, BacktestResults
+from app.schemas.summary import BacktestSummaryPage
 from app.services.backtest import backtest_service
 from app.services.backtester import backtester_service
+from app.services.backtest_results import MAX_TRADES_PAGE, TRADE_FIELDS, backtest_results_service
+from app.services.result_export import EXPORT_FORMATS, EXPORT_TABLES, result_export_service
+from app.services.summaries import MAX_SUMMARY_LIMIT, summary_service
 
 router = APIRouter()
 
+def stream_with_session(backtest_id: int, generate: Callable[[Session, BacktestModel], Iterator]) -> Iterator:
+    """
+    Produce a streaming response body with its own database session.
+    
+    The request's session is closed once the endpoint returns, so the
+    generator must not keep reading from it while the body is streamed.
+    
+    Args:
+        backtest_id: The backtest ID
+        generate: A function returning the body chunks for a session and backtest
+        
+    Returns:
+        An iterator over the body chunks
+    """
+    db = SessionLocal()
+    try:
+        backtest = backtest_service.get(db=db, backtest_id=backtest_id)
+        yield from generate(db, backtest)
+    finally:
+        db.close()
+
 @router.get("/", response_model=List[Backtest])
 def read_backtests(
     db: Session = Depends(get_db),
@@ -25,6 +60,22 @@ def read_backtests(
     )
     return backtests
 
+@router.get("/summary", response_model=BacktestSummaryPage)
+def read_backtest_summaries(
+    db: Session = Depends(get_db),
+    after_id: Optional[int] = None,
+    limit: int = Query(100, ge=1, le=MAX_SUMMARY_LIMIT),
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Retrieve backtest summaries for list views.
+    
+    Pass the returned `next_after_id` as `after_id` to get the next page.
+    """
+    return summary_service.get_backtests(
+        db=db, user_id=current_user.id, after_id=after_id, limit=limit
+    )
+
 @router.post("/", response_model=Backtest)
 def create_backtest(
     *,
@@ -80,10 +131,13 @@ def run_backtest(
     *,
     db: Session = Depends(get_db),
     backtest_id: int,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_active_user),
 ):
     """
     Run a backtest.
+    
+    The HTML report is rendered in the background once the run completes.
     """
     backtest = backtest_service.get(db=db, backtest_id=backtest_id)
     if not backtest:
@@ -93,40 +147,247 @@ def run_backtest(
     
     try:
         results = backtester_service.run_backtest(db=db, backtest_id=backtest_id)
+        background_tasks.add_task(backtester_service.render_report_in_background, backtest_id)
         return results
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/{backtest_id}/results", response_model=BacktestResults)
+@router.get("/{backtest_id}/results")
 def read_backtest_results(
     *,
     db: Session = Depends(get_db),
     backtest_id: int,
+    skip: int = 0,
+    limit: Optional[int] = None,
+    trades_skip: int = 0,
+    trades_limit: Optional[int] = None,
+    max_points: Optional[int] = None,
+    fields: Optional[str] = None,
+    layout: str = "records",
     current_user: User = Depends(get_current_active_user),
 ):
     """
     Get backtest results.
+    
+    The equity curve and trades can be paged independently, the equity
+    curve can be down-sampled to `max_points`, and `fields` selects a
+    comma-separated subset of columns. With `layout=columns` the equity
+    curve and trades are returned as one array per field instead of a
+    list of objects. The response is not validated against a model as it
+    takes either layout.
     """
+    if layout not in ("records", "columns"):
+        raise HTTPException(status_code=400, detail=f"Unsupported layout: {layout}")
+    
     backtest = backtest_service.get(db=db, backtest_id=backtest_id)
     if not backtest:
         raise HTTPException(status_code=404, detail="Backtest not found")
     if backtest.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
     
+    if not backtest_results_service.has_results(backtest):
+        raise HTTPException(status_code=404, detail="Backtest results not found")
+    
+    headers = {}
     if not backtest.results:
+        counts = backtest_results_service.count(db, backtest_id)
+        headers["X-Total-Equity-Points"] = str(counts["equity_points"])
+        headers["X-Total-Trades"] = str(counts["trades"])
+    
+    results = backtest_results_service.get_page(
+        db,
+        backtest,
+        skip=skip,
+        limit=limit,
+        trades_skip=trades_skip,
+        trades_limit=trades_limit,
+        max_points=max_points,
+        fields=fields.split(",") if fields else None,
+        columnar=layout == "columns",
+    )
+    
+    # The results are built by the service, so skip response-model validation
+    return FastJSONResponse(results, headers=headers)
+
+@router.get("/{backtest_id}/trades")
+def read_backtest_trades(
+    *,
+    db: Session = Depends(get_db),
+    backtest_id: int,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(1000, ge=1, le=MAX_TRADES_PAGE),
+    format: str = "json",
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Get the backtest trade list, paged as JSON or streamed in full as CSV.
+    """
+    backtest = backtest_service.get(db=db, backtest_id=backtest_id)
+    if not backtest:
+        raise HTTPException(status_code=404, detail="Backtest not found")
+    if backtest.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    if not backtest_results_service.has_results(backtest):
         raise HTTPException(status_code=404, detail="Backtest results not found")
     
-    return backtest.results
+    if format == "json":
+        return backtest_results_service.get_trades_page(db, backtest, skip=skip, limit=limit)
+    
+    if format != "csv":
+        raise HTTPException(status_code=400, detail=f"Unsupported format: {format}")
+    
+    def generate_csv(db: Session, backtest: BacktestModel) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=TRADE_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        for batch in backtest_results_service.iter_trades(db, backtest):
+            writer.writerows(batch)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        yield buffer.getvalue()
+    
+    return StreamingResponse(
+        stream_with_session(backtest_id, generate_csv),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="backtest_{backtest_id}_trades.csv"'},
+    )
+
+@router.get("/{backtest_id}/export")
+def export_backtest_results(
+    *,
+    db: Session = Depends(get_db),
+    backtest_id: int,
+    table: str = "equity",
+    format: str = "arrow",
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Stream the equity curve or trades as an Arrow IPC stream or a Parquet file.
+    
+    The file is produced batch by batch, so exports run in constant memory
+    and can be loaded with `pyarrow` or `pandas.read_parquet` directly.
+    """
+    backtest = backtest_service.get(db=db, backtest_id=backtest_id)
+    if not backtest:
+        raise HTTPException(status_code=404, detail="Backtest not found")
+    if backtest.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    if not backtest_results_service.has_results(backtest):
+        raise HTTPException(status_code=404, detail="Backtest results not found")
+    
+    if table not in EXPORT_TABLES:
+        raise HTTPException(status_code=400, detail=f"Unknown table: {table}")
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported format: {format}")
+    if not result_export_service.is_available():
+        raise HTTPException(status_code=501, detail="Binary exports require pyarrow")
+    
+    media_type, extension = EXPORT_FORMATS[format]
+    return StreamingResponse(
+        stream_with_session(
+            backtest_id,
+            lambda db, backtest: result_export_service.iter_export(db, backtest, table, format),
+        ),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="backtest_{backtest_id}_{table}.{extension}"'},
+    )
+
+@router.get("/{backtest_id}/monte-carlo")
+def read_backtest_monte_carlo(
+    *,
+    db: Session = Depends(get_db),
+    backtest_id: int,
+    method: str = "trades",
+    n_paths: int = Query(10000, ge=1, le=100000),
+    confidence: float = Query(0.95, gt=0, lt=1),
+    block_size: int = Query(20, ge=1),
+    seed: Optional[int] = None,
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Get a Monte Carlo robustness analysis of the backtest results.
+    
+    With `method=trades` the round-trip trade P&L is resampled; with
+    `method=bootstrap` the equity curve returns are block-bootstrapped.
+    """
+    backtest = backtest_service.get(db=db, backtest_id=backtest_id)
+    if not backtest:
+        raise HTTPException(status_code=404, detail="Backtest not found")
+    if backtest.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    if not backtest_results_service.has_results(backtest):
+        raise HTTPException(status_code=404, detail="Backtest results not found")
+    
+    try:
+        return backtester_service.run_monte_carlo(
+            db=db,
+            backtest_id=backtest_id,
+            method=method,
+            n_paths=n_paths,
+            confidence=confidence,
+            block_size=block_size,
+            seed=seed,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/{backtest_id}/chart-data")
+def read_backtest_chart_data(
+    *,
+    db: Session = Depends(get_db),
+    backtest_id: int,
+    max_points: int = 1000,
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Get down-sampled chart series for interactive rendering.
+    
+    The equity, drawdown and price series are each reduced to at most
+    `max_points` points; the price series is empty if the market data
+    cannot be fetched.
+    """
+    backtest = backtest_service.get(db=db, backtest_id=backtest_id)
+    if not backtest:
+        raise HTTPException(status_code=404, detail="Backtest not found")
+    if backtest.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    if not backtest_results_service.has_results(backtest):
+        raise HTTPException(status_code=404, detail="Backtest results not found")
+    
+    import pandas as pd
+    from app.backtester.visualization.chart_data import (
+        create_equity_chart_data,
+        create_trades_chart_data,
+    )
+    
+    results = backtest_results_service.load(db, backtest)
+    chart_data = create_equity_chart_data(pd.DataFrame(results["equity_curve"]), max_points)
+    chart_data.update(create_trades_chart_data(
+        pd.DataFrame(results["trades"]),
+        backtester_service.get_market_data(backtest),
+        max_points,
+    ))
+    
+    return chart_data
 
 @router.get("/{backtest_id}/report")
 def read_backtest_report(
     *,
     db: Session = Depends(get_db),
     backtest_id: int,
+    request: Request,
     current_user: User = Depends(get_current_active_user),
 ):
     """
     Get backtest report.
+    
+    Reports are rendered once and served from storage with ETag and
+    Last-Modified validators, gzip-encoded when the client accepts it.
     """
     backtest = backtest_service.get(db=db, backtest_id=backtest_id)
     if not backtest:
@@ -134,12 +395,38 @@ def read_backtest_report(
     if backtest.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
     
-    if not backtest.results:
+    if not backtest_results_service.has_results(backtest):
         raise HTTPException(status_code=404, detail="Backtest results not found")
     
     try:
-        report = backtester_service.generate_report(db=db, backtest_id=backtest_id)
-        return Response(content=report, media_type="text/html")
+        report = backtester_service.get_report(db=db, backtest_id=backtest_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-
+    
+    etag = f'"{report.etag}"'
+    last_modified = report.created_at.replace(tzinfo=timezone.utc, microsecond=0)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": format_datetime(last_modified, usegmt=True),
+        "Cache-Control": "private, no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    
+    # Answer conditional requests without sending the report
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_none_match is not None:
+        if etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+            return Response(status_code=304, headers=headers)
+    elif if_modified_since is not None:
+        try:
+            if last_modified <= parsedate_to_datetime(if_modified_since):
+                return Response(status_code=304, headers=headers)
+        except (TypeError, ValueError):
+            pass
+    
+    if accepts_encoding(request.headers.get("accept-encoding", ""), "gzip"):
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=report.content, media_type="text/html", headers=headers)
+    
+    return Response(content=gzip.decompress(report.content), media_type="text/html", headers=headers)
@@ -0,0 +1,60 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from app.api.dependencies import get_async_db, get_current_active_user_async
+from app.db.models.user import User
+from app.schemas.backtest import Backtest
+from app.services.async_crud import backtest_async_service
+
+router = APIRouter()
+
+@router.get("/", response_model=List[Backtest])
+async def read_backtests(
+    db: AsyncSession = Depends(get_async_db),
+    skip: int = 0,
+    limit: int = 100,
+    current_user: User = Depends(get_current_active_user_async),
+):
+    """
+    Retrieve backtests.
+    """
+    backtests = await backtest_async_service.get_multi(
+        db=db, user_id=current_user.id, skip=skip, limit=limit
+    )
+    return backtests
+
+@router.get("/{backtest_id}", response_model=Backtest)
+async def read_backtest(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    backtest_id: int,
+    current_user: User = Depends(get_current_active_user_async),
+):
+    """
+    Get backtest by ID.
+    """
+    backtest = await backtest_async_service.get(db=db, id=backtest_id)
+    if not backtest:
+        raise HTTPException(status_code=404, detail="Backtest not found")
+    if backtest.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return backtest
+
+@router.delete("/{backtest_id}", response_model=Backtest)
+async def delete_backtest(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    backtest_id: int,
+    current_user: User = Depends(get_current_active_user_async),
+):
+    """
+    Delete a backtest.
+    """
+    backtest = await backtest_async_service.get(db=db, id=backtest_id)
+    if not backtest:
+        raise HTTPException(status_code=404, detail="Backtest not found")
+    if backtest.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    backtest = await backtest_async_service.delete(db=db, db_obj=backtest)
+    return backtest
@@ -4,6 +4,7 @@ from app.db.session import Base
 from app.db.models.user import User
 from app.db.models.strategy import Strategy
 from app.db.models.backtest import Backtest
+from app.db.models.backtest_result import BacktestEquityPoint, BacktestTrade, BacktestReport
 from app.db.models.trading_account import TradingAccount
 from app.db.models.order import Order
 from app.db.models.position import Position
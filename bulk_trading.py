@@ -0,0 +1,63 @@
+from anyio import from_thread
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.api.dependencies import get_db, get_current_active_user
+from app.core.config import settings
+from app.db.models.user import User
+from app.schemas.trading import BulkResult, OrderBulkCreate, PositionSync
+from app.services.position_stream import get_open_positions, position_stream_hub
+from app.services.trading_bulk import trading_bulk_service
+
+router = APIRouter()
+
+@router.post("/orders/bulk", response_model=BulkResult)
+def create_orders_bulk(
+    *,
+    db: Session = Depends(get_db),
+    orders_in: OrderBulkCreate,
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Create many orders in one request.
+    
+    Each order gets its own status in the response; invalid orders do not
+    prevent the others from being created.
+    """
+    # Keeps a single transaction reasonably small
+    if len(orders_in.orders) > settings.TRADING_BULK_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"At most {settings.TRADING_BULK_MAX_ITEMS} orders per request")
+    
+    return trading_bulk_service.create_orders(
+        db=db, orders=orders_in.orders, user_id=current_user.id
+    )
+
+@router.post("/positions/sync", response_model=BulkResult)
+def sync_positions(
+    *,
+    db: Session = Depends(get_db),
+    sync_in: PositionSync,
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Synchronize the positions of a trading account with the broker.
+    
+    Positions are matched on `external_id`: known ones are updated, new
+    ones are created and, with `remove_missing`, positions the broker no
+    longer reports are deleted.
+    """
+    if len(sync_in.positions) > settings.TRADING_BULK_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"At most {settings.TRADING_BULK_MAX_ITEMS} positions per request")
+    
+    result = trading_bulk_service.sync_positions(
+        db=db, sync=sync_in, user_id=current_user.id
+    )
+    if result is None:
+        raise HTTPException(status_code=404, detail="Trading account not found")
+    
+    # Refresh the positions of any open stream, on the event loop that runs it
+    if position_stream_hub.has_channel(sync_in.trading_account_id):
+        positions = get_open_positions(db, sync_in.trading_account_id)
+        from_thread.run_sync(position_stream_hub.set_positions, sync_in.trading_account_id, positions)
+    
+    return result
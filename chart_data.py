@@ -0,0 +1,161 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, Optional
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Select points with the Largest-Triangle-Three-Buckets algorithm.
+
+    LTTB keeps the first and last points and, for each bucket in between,
+    the point forming the largest triangle with the previously selected
+    point and the average of the next bucket. This preserves peaks and
+    troughs much better than a fixed stride.
+
+    Args:
+        x: The x values (must be increasing)
+        y: The y values
+        threshold: The number of points to keep
+
+    Returns:
+        The indices of the selected points
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # Bucket boundaries for the points between the first and the last
+    every = (n - 2) / (threshold - 2)
+    edges = np.floor(np.arange(threshold - 1) * every).astype(np.int64) + 1
+    edges = np.append(edges, n)
+    edges[-2] = n - 1
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = edges[i + 1], edges[i + 2]
+
+        # Average of the next bucket is the third vertex of the triangle
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.nanargmax(area)) if not np.isnan(area).all() else start
+        selected[i + 1] = a
+
+    return selected
+
+def _dates_to_numbers(dates: pd.Series) -> np.ndarray:
+    """
+    Convert dates to nanoseconds since the epoch.
+
+    Args:
+        dates: The dates
+
+    Returns:
+        A float array usable as LTTB x values
+    """
+    return pd.to_datetime(dates).to_numpy().astype("datetime64[ns]").astype(np.int64).astype(np.float64)
+
+def _format_dates(dates: np.ndarray) -> list:
+    """
+    Format dates as ISO 8601 strings.
+
+    Args:
+        dates: The dates
+
+    Returns:
+        A list of strings
+    """
+    return np.datetime_as_string(dates.astype("datetime64[s]"), unit="s").tolist()
+
+def create_equity_chart_data(equity_curve: pd.DataFrame, max_points: int = 1000) -> Dict:
+    """
+    Create down-sampled equity and drawdown series.
+
+    The drawdown is computed once on the full-resolution equity curve and
+    each series is then reduced independently with LTTB.
+
+    Args:
+        equity_curve: The equity curve with date and equity columns
+        max_points: The maximum number of points per series
+
+    Returns:
+        A dictionary with columnar "equity" and "drawdown" series
+    """
+    if len(equity_curve) == 0:
+        return {
+            "equity": {"date": [], "equity": []},
+            "drawdown": {"date": [], "drawdown": []},
+            "total_points": 0,
+        }
+
+    dates = pd.to_datetime(equity_curve["date"]).to_numpy()
+    x = _dates_to_numbers(equity_curve["date"])
+    equity = equity_curve["equity"].to_numpy(dtype=np.float64)
+
+    # Calculate drawdown
+    drawdown = 1 - equity / np.maximum.accumulate(equity)
+
+    equity_indices = lttb_indices(x, equity, max_points)
+    drawdown_indices = lttb_indices(x, drawdown, max_points)
+
+    return {
+        "equity": {
+            "date": _format_dates(dates[equity_indices]),
+            "equity": equity[equity_indices].tolist(),
+        },
+        "drawdown": {
+            "date": _format_dates(dates[drawdown_indices]),
+            "drawdown": drawdown[drawdown_indices].tolist(),
+        },
+        "total_points": len(equity),
+    }
+
+def create_trades_chart_data(
+    trades: pd.DataFrame,
+    data: Optional[pd.DataFrame] = None,
+    max_points: int = 1000,
+) -> Dict:
+    """
+    Create a down-sampled price series with trade markers.
+
+    Args:
+        trades: The trades
+        data: The market data, if available
+        max_points: The maximum number of price points
+
+    Returns:
+        A dictionary with a columnar "price" series and "buy"/"sell" markers
+    """
+    chart_data = {"price": {"date": [], "close": []}}
+
+    if data is not None and len(data) > 0:
+        dates = pd.to_datetime(data["date"]).to_numpy()
+        close = data["close"].to_numpy(dtype=np.float64)
+        indices = lttb_indices(_dates_to_numbers(data["date"]), close, max_points)
+        chart_data["price"] = {
+            "date": _format_dates(dates[indices]),
+            "close": close[indices].tolist(),
+        }
+
+    for action in ("buy", "sell"):
+        if len(trades) > 0:
+            selected = trades[trades["action"] == action]
+            chart_data[action] = {
+                "date": _format_dates(pd.to_datetime(selected["date"]).to_numpy()),
+                "price": selected["price"].astype(float).tolist(),
+            }
+        else:
+            chart_data[action] = {"date": [], "price": []}
+
+    return chart_data
@@ -1,4 +1,6 @@
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import seaborn as sns
 from typing import Dict, Optional
@@ -6,7 +8,35 @@ import io
 import base64
 from datetime import datetime
 
-def create_equity_curve_chart(equity_curve: pd.DataFrame) -> str:
+def _figure_to_png() -> bytes:
+    """
+    Save the current figure as PNG and close it.
+    
+    Returns:
+        The PNG image bytes
+    """
+    # Save the figure to a buffer
+    buf = io.BytesIO()
+    plt.savefig(buf, format="png")
+    
+    # Close the figure
+    plt.close()
+    
+    return buf.getvalue()
+
+def _encode(png: bytes) -> str:
+    """
+    Encode a PNG image as base64.
+    
+    Args:
+        png: The PNG image bytes
+        
+    Returns:
+        A base64-encoded PNG image
+    """
+    return base64.b64encode(png).decode("utf-8")
+
+def equity_curve_png(equity_curve: pd.DataFrame) -> bytes:
     """
     Create an equity curve chart.
     
@@ -14,7 +44,7 @@ def create_equity_curve_chart(equity_curve: pd.DataFrame) -> str:
         equity_curve: The equity curve
         
     Returns:
-        A base64-encoded PNG image
+        The PNG image bytes
     """
     # Convert date strings to datetime if needed
     if isinstance(equity_curve["date"].iloc[0], str):
@@ -37,20 +67,9 @@ def create_equity_curve_chart(equity_curve: pd.DataFrame) -> str:
     # Format x-axis dates
     plt.gcf().autofmt_xdate()
     
-    # Save the figure to a buffer
-    buf = io.BytesIO()
-    plt.savefig(buf, format="png")
-    buf.seek(0)
-    
-    # Encode the buffer as base64
-    img_str = base64.b64encode(buf.read()).decode("utf-8")
-    
-    # Close the figure
-    plt.close()
-    
-    return img_str
+    return _figure_to_png()
 
-def create_drawdown_chart(equity_curve: pd.DataFrame) -> str:
+def drawdown_png(equity_curve: pd.DataFrame) -> bytes:
     """
     Create a drawdown chart.
     
@@ -58,7 +77,7 @@ def create_drawdown_chart(equity_curve: pd.DataFrame) -> str:
         equity_curve: The equity curve
         
     Returns:
-        A base64-encoded PNG image
+        The PNG image bytes
     """
     # Convert date strings to datetime if needed
     if isinstance(equity_curve["date"].iloc[0], str):
@@ -84,20 +103,9 @@ def create_drawdown_chart(equity_curve: pd.DataFrame) -> str:
     # Format x-axis dates
     plt.gcf().autofmt_xdate()
     
-    # Save the figure to a buffer
-    buf = io.BytesIO()
-    plt.savefig(buf, format="png")
-    buf.seek(0)
-    
-    # Encode the buffer as base64
-    img_str = base64.b64encode(buf.read()).decode("utf-8")
-    
-    # Close the figure
-    plt.close()
-    
-    return img_str
+    return _figure_to_png()
 
-def create_returns_distribution_chart(equity_curve: pd.DataFrame) -> str:
+def returns_distribution_png(equity_curve: pd.DataFrame) -> bytes:
     """
     Create a returns distribution chart.
     
@@ -105,7 +113,7 @@ def create_returns_distribution_chart(equity_curve: pd.DataFrame) -> str:
         equity_curve: The equity curve
         
     Returns:
-        A base64-encoded PNG image
+        The PNG image bytes
     """
     # Convert date strings to datetime if needed
     if isinstance(equity_curve["date"].iloc[0], str):
@@ -128,20 +136,9 @@ def create_returns_distribution_chart(equity_curve: pd.DataFrame) -> str:
     # Add grid
     plt.grid(True)
     
-    # Save the figure to a buffer
-    buf = io.BytesIO()
-    plt.savefig(buf, format="png")
-    buf.seek(0)
-    
-    # Encode the buffer as base64
-    img_str = base64.b64encode(buf.read()).decode("utf-8")
-    
-    # Close the figure
-    plt.close()
-    
-    return img_str
+    return _figure_to_png()
 
-def create_trades_chart(data: pd.DataFrame, trades: pd.DataFrame) -> str:
+def trades_png(data: pd.DataFrame, trades: pd.DataFrame) -> bytes:
     """
     Create a chart showing trades on price data.
     
@@ -150,7 +147,7 @@ def create_trades_chart(data: pd.DataFrame, trades: pd.DataFrame) -> str:
         trades: The trades
         
     Returns:
-        A base64-encoded PNG image
+        The PNG image bytes
     """
     # Convert date strings to datetime if needed
     if isinstance(data["date"].iloc[0], str):
@@ -186,16 +183,53 @@ def create_trades_chart(data: pd.DataFrame, trades: pd.DataFrame) -> str:
     # Format x-axis dates
     plt.gcf().autofmt_xdate()
     
-    # Save the figure to a buffer
-    buf = io.BytesIO()
-    plt.savefig(buf, format="png")
-    buf.seek(0)
+    return _figure_to_png()
+
+def create_equity_curve_chart(equity_curve: pd.DataFrame) -> str:
+    """
+    Create an equity curve chart.
     
-    # Encode the buffer as base64
-    img_str = base64.b64encode(buf.read()).decode("utf-8")
+    Args:
+        equity_curve: The equity curve
+        
+    Returns:
+        A base64-encoded PNG image
+    """
+    return _encode(equity_curve_png(equity_curve))
+
+def create_drawdown_chart(equity_curve: pd.DataFrame) -> str:
+    """
+    Create a drawdown chart.
     
-    # Close the figure
-    plt.close()
+    Args:
+        equity_curve: The equity curve
+        
+    Returns:
+        A base64-encoded PNG image
+    """
+    return _encode(drawdown_png(equity_curve))
+
+def create_returns_distribution_chart(equity_curve: pd.DataFrame) -> str:
+    """
+    Create a returns distribution chart.
     
-    return img_str
+    Args:
+        equity_curve: The equity curve
+        
+    Returns:
+        A base64-encoded PNG image
+    """
+    return _encode(returns_distribution_png(equity_curve))
 
+def create_trades_chart(data: pd.DataFrame, trades: pd.DataFrame) -> str:
+    """
+    Create a chart showing trades on price data.
+    
+    Args:
+        data: The market data
+        trades: The trades
+        
+    Returns:
+        A base64-encoded PNG image
+    """
+    return _encode(trades_png(data, trades))
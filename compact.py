@@ -0,0 +1,99 @@
+import pandas as pd
+import numpy as np
+from typing import List, Optional
+
+PRICE_COLUMNS = ["open", "high", "low", "close", "adj_close"]
+VOLUME_COLUMNS = ["volume", "tick_volume", "real_volume", "spread"]
+
+def float32_columns(data: pd.DataFrame, columns: List[str], decimals: int = 5) -> List[str]:
+    """
+    Find the columns whose values survive a round trip through float32.
+
+    A column qualifies when every value, rounded to the given number of
+    decimals, is unchanged after conversion to float32 and back.
+
+    Args:
+        data: The market data
+        columns: The candidate columns
+        decimals: The number of decimals that must be preserved
+
+    Returns:
+        The columns that can be stored as float32
+    """
+    safe = []
+    for column in columns:
+        if column not in data.columns:
+            continue
+        values = data[column].to_numpy(dtype=np.float64)
+        restored = values.astype(np.float32).astype(np.float64)
+        if np.array_equal(np.round(restored, decimals), np.round(values, decimals), equal_nan=True):
+            safe.append(column)
+    return safe
+
+def compact_bars(
+    data: pd.DataFrame,
+    time_column: str = "date",
+    decimals: int = 5,
+    symbol_column: Optional[str] = "symbol",
+) -> pd.DataFrame:
+    """
+    Convert bar data to a compact representation.
+
+    Prices become float32 where that preserves `decimals` decimals (other
+    price columns stay float64), volumes are downcast to the narrowest
+    integer type that holds them, the time column becomes int64 seconds
+    since the epoch and the symbol column becomes categorical. Code that
+    accumulates over prices (returns, indicators, P&L) should cast to
+    float64 first.
+
+    Args:
+        data: The market data
+        time_column: The name of the time column
+        decimals: The number of price decimals that must be preserved
+        symbol_column: The name of the symbol column, if any
+
+    Returns:
+        A compact copy of the market data
+    """
+    data = data.copy()
+
+    for column in float32_columns(data, PRICE_COLUMNS, decimals):
+        data[column] = data[column].astype(np.float32)
+
+    for column in VOLUME_COLUMNS:
+        if column in data.columns and pd.api.types.is_numeric_dtype(data[column]):
+            values = data[column]
+            # Only whole volumes can be stored as integers
+            if values.notna().all() and (values % 1 == 0).all():
+                data[column] = pd.to_numeric(values.astype(np.int64), downcast="integer")
+
+    if time_column in data.columns and not pd.api.types.is_integer_dtype(data[time_column]):
+        times = pd.to_datetime(data[time_column]).to_numpy().astype("datetime64[s]")
+        data[time_column] = times.astype(np.int64)
+
+    if symbol_column and symbol_column in data.columns:
+        data[symbol_column] = data[symbol_column].astype("category")
+
+    return data
+
+def expand_bars(data: pd.DataFrame, time_column: str = "date") -> pd.DataFrame:
+    """
+    Convert compact bar data back to the standard representation.
+
+    Args:
+        data: The compact market data
+        time_column: The name of the time column
+
+    Returns:
+        A copy of the market data with float64 prices and datetime times
+    """
+    data = data.copy()
+
+    for column in PRICE_COLUMNS:
+        if column in data.columns:
+            data[column] = data[column].astype(np.float64)
+
+    if time_column in data.columns and pd.api.types.is_integer_dtype(data[time_column]):
+        data[time_column] = pd.to_datetime(data[time_column], unit="s")
+
+    return data
@@ -0,0 +1,204 @@
+import zlib
+from typing import Dict, Optional
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+# Only these content types are worth compressing
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "image/svg+xml")
+
+class _GzipEncoder:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+class _BrotliEncoder:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+def parse_accept_encoding(accept_encoding: str) -> Dict[str, float]:
+    """
+    Parse an Accept-Encoding header.
+
+    Args:
+        accept_encoding: The Accept-Encoding header
+
+    Returns:
+        A dictionary mapping each listed coding to its quality value
+    """
+    qualities = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        if not coding.strip():
+            continue
+
+        quality = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        qualities[coding.strip()] = quality
+
+    return qualities
+
+def accepts_encoding(accept_encoding: str, coding: str) -> bool:
+    """
+    Check whether an Accept-Encoding header allows a content coding.
+
+    A coding that is not listed is allowed by "*", and "q=0" rules it out.
+
+    Args:
+        accept_encoding: The Accept-Encoding header
+        coding: The content coding (e.g. "gzip")
+
+    Returns:
+        True if the client accepts the coding
+    """
+    qualities = parse_accept_encoding(accept_encoding)
+    return qualities.get(coding, qualities.get("*", 0.0)) > 0
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Choose a content encoding from an Accept-Encoding header.
+
+    Args:
+        accept_encoding: The Accept-Encoding header
+
+    Returns:
+        "br", "gzip" or None
+    """
+    qualities = parse_accept_encoding(accept_encoding)
+    if brotli is not None and qualities.get("br", 0.0) > 0:
+        return "br"
+    if accepts_encoding(accept_encoding, "gzip"):
+        return "gzip"
+    return None
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing responses with brotli or gzip.
+
+    Brotli is used when the `brotli` package is installed and the client
+    accepts it. Streaming responses are compressed chunk by chunk, and
+    responses that already have a Content-Encoding are passed through.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The ASGI application
+            minimum_size: Smaller responses are sent uncompressed
+            gzip_level: The gzip compression level
+            brotli_quality: The brotli quality (low values favour speed)
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        encoding = choose_encoding(headers.get(b"accept-encoding", b"").decode("latin-1"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        encoder = None
+
+        async def send_compressed(message):
+            nonlocal start_message, encoder
+
+            if message["type"] == "http.response.start":
+                # Hold the headers until the first body chunk shows the size
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if start_message is not None:
+                start, start_message = start_message, None
+                response_headers = {key.lower(): value for key, value in start["headers"]}
+                content_type = response_headers.get(b"content-type", b"").decode("latin-1")
+
+                if (
+                    b"content-encoding" in response_headers
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                    or (not more_body and len(body) < self.minimum_size)
+                ):
+                    await send(start)
+                    await send(message)
+                    encoder = False
+                    return
+
+                if encoding == "br":
+                    encoder = _BrotliEncoder(self.brotli_quality)
+                else:
+                    encoder = _GzipEncoder(self.gzip_level)
+
+                start_headers = [
+                    (key, value) for key, value in start["headers"]
+                    if key.lower() not in (b"content-length", b"vary")
+                ]
+                vary = response_headers.get(b"vary")
+                if vary is None:
+                    vary = b"Accept-Encoding"
+                elif b"accept-encoding" not in vary.lower():
+                    vary += b", Accept-Encoding"
+                start_headers.append((b"content-encoding", encoding.encode("latin-1")))
+                start_headers.append((b"vary", vary))
+
+                if not more_body:
+                    # Compress the whole body at once and set its length
+                    body = encoder.compress(body) + encoder.finish()
+                    start_headers.append((b"content-length", str(len(body)).encode("latin-1")))
+                    await send({**start, "headers": start_headers})
+                    await send({"type": "http.response.body", "body": body})
+                    return
+
+                await send({**start, "headers": start_headers})
+
+            if not encoder:
+                await send(message)
+                return
+
+            if more_body:
+                # Flush each chunk so streamed data reaches the client promptly
+                chunk = encoder.compress(body) + encoder.flush()
+            else:
+                chunk = encoder.compress(body) + encoder.finish()
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
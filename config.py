@@ -21,9 +21,39 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = os.getenv("POSTGRES_PASSWORD", "postgres")
     POSTGRES_DB: str = os.getenv("POSTGRES_DB", "tradingbot")
     SQLALCHEMY_DATABASE_URI: Optional[Union[str, PostgresDsn]] = None
+    SQLALCHEMY_ASYNC_DATABASE_URI: Optional[str] = os.getenv("SQLALCHEMY_ASYNC_DATABASE_URI")
+    
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
     
     CORS_ORIGINS: List[str] = ["http://localhost:3000"]
     
+    RESULT_CACHE_ENABLED: bool = os.getenv("RESULT_CACHE_ENABLED", "true").lower() == "true"
+    RESULT_CACHE_PATH: Optional[str] = os.getenv("RESULT_CACHE_PATH")
+    RESULT_CACHE_MAX_SIZE_MB: int = int(os.getenv("RESULT_CACHE_MAX_SIZE_MB", "512"))
+    RESULT_CACHE_MAX_ENTRIES: int = int(os.getenv("RESULT_CACHE_MAX_ENTRIES", "1000"))
+    
+    INDICATOR_CACHE_MAX_ENTRIES: int = int(os.getenv("INDICATOR_CACHE_MAX_ENTRIES", "256"))
+    INDICATOR_CACHE_PATH: Optional[str] = os.getenv("INDICATOR_CACHE_PATH")
+    INDICATOR_CACHE_MAX_BYTES: int = int(os.getenv("INDICATOR_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+    
+    CHART_RENDER_WORKERS: int = int(os.getenv("CHART_RENDER_WORKERS", "3"))
+    
+    USER_CACHE_TTL_SECONDS: int = int(os.getenv("USER_CACHE_TTL_SECONDS", "30"))
+    
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "4"))
+    PASSWORD_HASH_MAX_QUEUE: int = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "32"))
+    
+    COMPRESSION_MINIMUM_SIZE: int = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+    
+    TRADING_BULK_MAX_ITEMS: int = int(os.getenv("TRADING_BULK_MAX_ITEMS", "1000"))
+    
+    POSITION_STREAM_FRAME_RATE: float = float(os.getenv("POSITION_STREAM_FRAME_RATE", "4"))
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -34,6 +64,15 @@ class Settings(BaseSettings):
         # Build database URI
         if not self.SQLALCHEMY_DATABASE_URI:
             self.SQLALCHEMY_DATABASE_URI = f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}/{self.POSTGRES_DB}"
+        
+        # Build async database URI with the matching asyncio driver
+        if not self.SQLALCHEMY_ASYNC_DATABASE_URI:
+            uri = str(self.SQLALCHEMY_DATABASE_URI)
+            if uri.startswith("postgresql://"):
+                uri = uri.replace("postgresql://", "postgresql+asyncpg://", 1)
+            elif uri.startswith("sqlite://"):
+                uri = uri.replace("sqlite://", "sqlite+aiosqlite://", 1)
+            self.SQLALCHEMY_ASYNC_DATABASE_URI = uri
 
 settings = Settings()
 
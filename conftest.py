@@ -1,15 +1,22 @@
+import os
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
+
+# Render charts in process instead of starting workers for every client
+os.environ.setdefault("CHART_RENDER_WORKERS", "0")
 
 from app.main import app
 from app.db.base import Base
-from app.db.session import get_db
+from app.api.dependencies import get_async_db, get_db
 from app.core.security import create_access_token
 from app.db.models.user import User
 from app.db.models.strategy import Strategy
+from app.services.user_cache import user_cache
 
 # Create test database
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
@@ -56,6 +63,51 @@ def client(db):
         yield test_client
     
     app.dependency_overrides.clear()
+    # Cached users would outlive the rolled back test data
+    user_cache.clear()
+
+@pytest.fixture
+def stream_sessions(db, monkeypatch):
+    """
+    Open the sessions of streamed responses in the test transaction.
+    
+    Returns the list of sessions opened, like SessionLocal in the API.
+    """
+    from app.api.endpoints import backtests
+    
+    sessions = []
+    def session_local():
+        session = db.__class__(bind=db.get_bind())
+        sessions.append(session)
+        return session
+    
+    monkeypatch.setattr(backtests, "SessionLocal", session_local)
+    return sessions
+
+@pytest.fixture
+def async_session_local(tmp_path):
+    """
+    Return an async session factory on a fresh database file.
+    
+    The async endpoints use sessions from the same factory. Connections are
+    not pooled, so each event loop (asyncio.run or the test client's) opens
+    its own.
+    """
+    path = tmp_path / "async.db"
+    sync_engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=sync_engine)
+    sync_engine.dispose()
+    
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+    session_local = sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+    
+    async def override_get_async_db():
+        async with session_local() as db:
+            yield db
+    
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    yield session_local
+    app.dependency_overrides.pop(get_async_db, None)
 
 @pytest.fixture
 def test_user(db):
@@ -89,6 +141,6 @@ def test_strategy(db, test_user):
 @pytest.fixture
 def auth_headers(test_user):
     """Return authorization headers for the test user."""
-    access_token = create_access_token(data={"sub": str(test_user.id)})
+    access_token = create_access_token(test_user.id)
     return {"Authorization": f"Bearer {access_token}"}
 
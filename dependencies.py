@@ -1,13 +1,15 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 from app.core.config import settings
 from app.core.security import verify_password
-from app.db.session import SessionLocal
+from app.db.session import AsyncSessionLocal, SessionLocal
 from app.db.models.user import User
+from app.services.user_cache import user_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
@@ -21,9 +23,34 @@ def get_db() -> Generator:
     finally:
         db.close()
 
+async def get_async_db() -> AsyncGenerator:
+    """
+    Get an async database session.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def get_token_payload(token: str = Depends(oauth2_scheme)) -> dict:
+    """
+    Decode the access token.
+    
+    FastAPI caches dependencies per request, so the token is decoded once
+    however many dependencies need it.
+    """
+    try:
+        return jwt.decode(
+            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+        )
+    except JWTError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
 def get_current_user(
     db: Session = Depends(get_db),
-    token: str = Depends(oauth2_scheme),
+    payload: dict = Depends(get_token_payload),
 ) -> User:
     """
     Get the current user from the token.
@@ -33,17 +60,12 @@ def get_current_user(
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
+    user_id: str = payload.get("sub")
+    if user_id is None:
         raise credentials_exception
     
-    user = db.query(User).filter(User.id == user_id).first()
+    # Served from a short-lived cache to skip the query on hot endpoints
+    user = user_cache.get(db, user_id)
     if user is None:
         raise credentials_exception
     
@@ -73,3 +95,35 @@ def get_current_active_superuser(
     
     return current_user
 
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_db),
+    payload: dict = Depends(get_token_payload),
+) -> User:
+    """
+    Get the current user from the token in an async session.
+    """
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    user_id: str = payload.get("sub")
+    if user_id is None:
+        raise credentials_exception
+    
+    user = await user_cache.get_async(db, user_id)
+    if user is None:
+        raise credentials_exception
+    
+    return user
+
+async def get_current_active_user_async(
+    current_user: User = Depends(get_current_user_async),
+) -> User:
+    """
+    Get the current active user in an async session.
+    """
+    if not current_user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    
+    return current_user
@@ -1,8 +1,9 @@
 import pandas as pd
-import yfinance as yf
 from typing import Dict, List, Optional
 from datetime import datetime
 
+from app.backtester.data.compact import compact_bars
+
 class DataFetcher:
     """
     Fetches historical market data from various sources.
@@ -14,6 +15,7 @@ class DataFetcher:
         start_date: datetime,
         end_date: datetime,
         interval: str = "1d",
+        compact: bool = False,
     ) -> pd.DataFrame:
         """
         Fetch historical data for a symbol.
@@ -23,10 +25,14 @@ class DataFetcher:
             start_date: The start date
             end_date: The end date
             interval: The data interval (e.g., "1d", "1h", "5m")
+            compact: Whether to return the compact representation
             
         Returns:
             A pandas DataFrame with the historical data
         """
+        # yfinance is slow to import and only needed when downloading
+        import yfinance as yf
+        
         data = yf.download(symbol, start=start_date, end=end_date, interval=interval)
         
         # Reset index to make Date a column
@@ -43,6 +49,9 @@ class DataFetcher:
             "Volume": "volume"
         })
         
+        if compact:
+            data = compact_bars(data)
+        
         return data
 
     def fetch_multiple_data(
@@ -51,6 +60,7 @@ class DataFetcher:
         start_date: datetime,
         end_date: datetime,
         interval: str = "1d",
+        compact: bool = False,
     ) -> Dict[str, pd.DataFrame]:
         """
         Fetch historical data for multiple symbols.
@@ -60,12 +70,13 @@ class DataFetcher:
             start_date: The start date
             end_date: The end date
             interval: The data interval (e.g., "1d", "1h", "5m")
+            compact: Whether to return the compact representation
             
         Returns:
             A dictionary mapping symbols to pandas DataFrames
         """
         data = {}
         for symbol in symbols:
-            data[symbol] = self.fetch_data(symbol, start_date, end_date, interval)
+            data[symbol] = self.fetch_data(symbol, start_date, end_date, interval, compact)
         return data
 
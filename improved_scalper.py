@@ -8,27 +8,66 @@ Based on the original scalper.py with enhancements for:
 - Flexibility: More customizable parameters
 """
 
-import MetaTrader5 as mt5
-import pandas as pd
-import requests
 from datetime import datetime
 import time as t
+import importlib
 import json
 import os
 import logging
 from dotenv import load_dotenv
 
-# === SETUP LOGGING ===
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("trading_bot.log"),
-        logging.StreamHandler()
-    ]
+from scalper_core import (
+    TIMEFRAME_M1,
+    TIMEFRAME_M5,
+    TIMEFRAME_M15,
+    TIMEFRAME_M30,
+    TIMEFRAME_H1,
+    TIMEFRAME_H4,
+    TIMEFRAME_D1,
+    TIMEFRAME_MINUTES,
+    PerformanceTracker,
+    TradingStrategies,
+    calculate_lot_size,
+    resample_rates,
 )
+
 logger = logging.getLogger("TradingBot")
 
+# === SETUP LOGGING ===
+def setup_logging(log_file="trading_bot.log"):
+    """Log to the console and a file; called when the bot starts, not on import"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_file),
+            logging.StreamHandler()
+        ]
+    )
+
+# === LAZY IMPORTS ===
+class _LazyModule:
+    """Module proxy that imports the module on first attribute access
+    
+    MetaTrader5 only exists on Windows, and it and requests are only
+    needed once the bot talks to a broker or Myfxbook.
+    """
+    
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+    
+    def __getattr__(self, attr):
+        # Introspection (e.g. by unittest.mock) must not trigger the import
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+mt5 = _LazyModule("MetaTrader5")
+requests = _LazyModule("requests")
+
 # === CONFIGURATION ===
 class Config:
     def __init__(self, config_file=None):
@@ -48,12 +87,13 @@ class Config:
             },
             "trading": {
                 "symbols": os.getenv("SYMBOLS", "GBPUSD,USDJPY,GBPJPY,EURUSD").split(","),
-                "timeframe": mt5.TIMEFRAME_M5,
-                "htf_timeframe": mt5.TIMEFRAME_M15,
+                "timeframe": TIMEFRAME_M5,
+                "htf_timeframe": TIMEFRAME_M15,
                 "risk_percent": float(os.getenv("RISK_PERCENT", "1.0")),
                 "max_spread_pips": float(os.getenv("MAX_SPREAD_PIPS", "3.0")),
                 "min_sentiment_threshold": float(os.getenv("MIN_SENTIMENT_THRESHOLD", "60.0")),
-                "scan_interval": int(os.getenv("SCAN_INTERVAL", "60"))
+                "scan_interval": int(os.getenv("SCAN_INTERVAL", "60")),
+                "compact_data": os.getenv("COMPACT_DATA", "false").lower() == "true"
             }
         }
         
@@ -200,25 +240,57 @@ class MT5Handler:
             logger.error(f"Error getting pip value for {symbol}: {str(e)}")
             return None
     
-    def get_data(self, symbol, timeframe, bars=500):
-        """Get historical price data"""
+    def get_data(self, symbol, timeframe, bars=500, compact=None):
+        """Get historical price data
+        
+        With compact data (COMPACT_DATA=true), time stays in epoch seconds,
+        prices are float32 where the symbol's digits survive the conversion
+        and volumes use the narrowest integer type.
+        """
         if not self.connected:
             logger.warning("Not connected to MT5")
             return None
             
+        if compact is None:
+            compact = self.config.get("trading", "compact_data")
+            
         try:
             rates = mt5.copy_rates_from_pos(symbol, timeframe, 0, bars)
             if rates is None or len(rates) == 0:
                 logger.warning(f"No data returned for {symbol} on timeframe {timeframe}")
                 return None
                 
+            import pandas as pd
+            
             df = pd.DataFrame(rates)
+            if compact:
+                return self._compact_rates(symbol, df)
             df['time'] = pd.to_datetime(df['time'], unit='s')
             return df
         except Exception as e:
             logger.error(f"Error getting data for {symbol}: {str(e)}")
             return None
     
+    def _compact_rates(self, symbol, df):
+        """Convert rates to compact dtypes, verifying price precision"""
+        import pandas as pd
+        
+        symbol_info = mt5.symbol_info(symbol)
+        digits = symbol_info.digits if symbol_info else 5
+        
+        for column in ['open', 'high', 'low', 'close']:
+            narrow = df[column].astype('float32')
+            # Keep float64 if float32 would change a quoted digit
+            if narrow.astype('float64').round(digits).equals(df[column].round(digits)):
+                df[column] = narrow
+        
+        for column in ['tick_volume', 'real_volume', 'spread']:
+            if column in df.columns:
+                df[column] = pd.to_numeric(df[column].astype('int64'), downcast='integer')
+        
+        df['time'] = df['time'].astype('int64')
+        return df
+    
     def calculate_position_size(self, symbol, risk_percent, stop_loss_pips):
         """Calculate position size based on risk percentage"""
         try:
@@ -230,43 +302,23 @@ class MT5Handler:
             if not symbol_info:
                 return 0.01
                 
-            # Get account balance and calculate risk amount
-            balance = account_info["balance"]
-            risk_amount = balance * (risk_percent / 100)
-            
             # Calculate pip value
             pip_value = self.get_pip(symbol)
             if not pip_value:
                 return 0.01
                 
-            # Get contract size and current price
-            contract_size = symbol_info.trade_contract_size
-            current_price = (symbol_info.bid + symbol_info.ask) / 2
-            
-            # Calculate position size
-            if symbol_info.digits >= 4:  # Forex pairs typically have 4 or 5 digits
-                pip_value_in_account_currency = (pip_value * contract_size) / current_price
-            else:  # For other instruments
-                pip_value_in_account_currency = pip_value * contract_size
-                
-            if stop_loss_pips <= 0 or pip_value_in_account_currency <= 0:
-                return 0.01
-                
-            position_size = risk_amount / (stop_loss_pips * pip_value_in_account_currency)
-            
-            # Round down to nearest 0.01
-            position_size = max(0.01, round(position_size * 100) / 100)
-            
-            # Ensure position size is within allowed limits
-            min_volume = symbol_info.volume_min
-            max_volume = symbol_info.volume_max
-            step = symbol_info.volume_step
-            
-            # Adjust to step size
-            position_size = round(position_size / step) * step
-            
-            # Ensure within limits
-            position_size = max(min_volume, min(position_size, max_volume))
+            position_size = calculate_lot_size(
+                account_info["balance"],
+                risk_percent,
+                stop_loss_pips,
+                pip_value,
+                symbol_info.trade_contract_size,
+                (symbol_info.bid + symbol_info.ask) / 2,
+                symbol_info.digits,
+                symbol_info.volume_min,
+                symbol_info.volume_max,
+                symbol_info.volume_step,
+            )
             
             logger.info(f"Calculated position size for {symbol}: {position_size} lots (Risk: {risk_percent}%, SL: {stop_loss_pips} pips)")
             return position_size
@@ -315,7 +367,8 @@ class MT5Handler:
             if not pip:
                 return False
                 
-            ob_low, ob_high = ob_zone[1], ob_zone[2]
+            # Order prices are computed in float64 (compact bars hold float32)
+            ob_low, ob_high = float(ob_zone[1]), float(ob_zone[2])
             
             # Calculate entry, stop loss and take profit
             entry = round(ob_low + pip, info.digits) if direction == "buy" else round(ob_high - pip, info.digits)
@@ -323,9 +376,9 @@ class MT5Handler:
             
             # Calculate take profit based on recent highs/lows
             if direction == "buy":
-                tp = round(df['high'][-20:-1].max() + 5 * pip, info.digits)
+                tp = round(float(df['high'][-20:-1].max()) + 5 * pip, info.digits)
             else:
-                tp = round(df['low'][-20:-1].min() - 5 * pip, info.digits)
+                tp = round(float(df['low'][-20:-1].min()) - 5 * pip, info.digits)
             
             # Calculate stop loss in pips
             sl_pips = abs(entry - sl) / pip
@@ -365,256 +418,6 @@ class MT5Handler:
             logger.error(f"Error placing order for {symbol}: {str(e)}")
             return False
 
-# === TRADING STRATEGIES ===
-class TradingStrategies:
-    @staticmethod
-    def get_htf_bias(mt5_handler, symbol, htf=mt5.TIMEFRAME_M15):
-        """Get higher timeframe bias"""
-        df = mt5_handler.get_data(symbol, htf, 150)
-        if df is None or len(df) < 30:
-            return None
-            
-        highs = []
-        lows = []
-        
-        # Find swing highs and lows
-        for i in range(2, len(df) - 2):
-            if df['high'].iloc[i] > df['high'].iloc[i - 1] and df['high'].iloc[i] > df['high'].iloc[i + 1]:
-                highs.append(df['high'].iloc[i])
-            if df['low'].iloc[i] < df['low'].iloc[i - 1] and df['low'].iloc[i] < df['low'].iloc[i + 1]:
-                lows.append(df['low'].iloc[i])
-                
-        if len(highs) < 2 or len(lows) < 2:
-            return None
-            
-        # Get the last two highs and lows
-        hh1, hh2 = highs[-1], highs[-2]
-        ll1, ll2 = lows[-1], lows[-2]
-        
-        # Determine market structure
-        if hh1 > hh2 and ll1 > ll2:
-            return "bullish"
-        elif hh1 < hh2 and ll1 < ll2:
-            return "bearish"
-        elif hh1 > hh2 and ll1 < ll2:
-            return "choch_bullish"  # Change of character bullish
-        elif hh1 < hh2 and ll1 > ll2:
-            return "choch_bearish"  # Change of character bearish
-            
-        return None
-    
-    @staticmethod
-    def has_fvg(df, i):
-        """Check for fair value gap"""
-        if i < 2 or i + 1 >= len(df):
-            return False
-            
-        prev = df.iloc[i - 1]
-        next_candle = df.iloc[i + 1]
-        
-        # Check for bullish or bearish FVG
-        return next_candle['low'] > prev['high'] or next_candle['high'] < prev['low']
-    
-    @staticmethod
-    def detect_order_block(df):
-        """Detect order blocks"""
-        for i in range(len(df) - 3, 2, -1):
-            c = df.iloc[i]
-            next_c = df.iloc[i + 1]
-            
-            # Bullish order block
-            if c['close'] < c['open'] and next_c['close'] > next_c['open'] and TradingStrategies.has_fvg(df, i):
-                return ('bullish', c['low'], c['high'], c['time'])
-                
-            # Bearish order block
-            if c['close'] > c['open'] and next_c['close'] < next_c['open'] and TradingStrategies.has_fvg(df, i):
-                return ('bearish', c['low'], c['high'], c['time'])
-                
-        return None
-    
-    @staticmethod
-    def detect_turtle_soup(df):
-        """Detect turtle soup pattern"""
-        if len(df) < 21:
-            return None
-            
-        prev = df.iloc[-2]
-        last = df.iloc[-1]
-        swing_low = df['low'][-21:-1].min()
-        swing_high = df['high'][-21:-1].max()
-        
-        if prev['low'] < swing_low and last['low'] > prev['low']:
-            return "buy"
-        elif prev['high'] > swing_high and last['high'] < prev['high']:
-            return "sell"
-            
-        return None
-    
-    @staticmethod
-    def detect_sh_bms_rto(df):
-        """Detect swing high break market structure return to origin"""
-        if len(df) < 10:
-            return None
-            
-        prev = df.iloc[-2]
-        last = df.iloc[-1]
-        
-        if prev['low'] < df['low'][-10:-2].min() and last['close'] > prev['high']:
-            return "buy"
-        elif prev['high'] > df['high'][-10:-2].max() and last['close'] < prev['low']:
-            return "sell"
-            
-        return None
-    
-    @staticmethod
-    def detect_sms_bms_rto(df):
-        """Detect swing market structure break market structure return to origin"""
-        if len(df) < 10:
-            return None
-            
-        highs = df['high']
-        lows = df['low']
-        prev = df.iloc[-2]
-        last = df.iloc[-1]
-        
-        if prev['high'] > highs[-10:-2].max() and last['close'] < prev['low']:
-            return "sell"
-        elif prev['low'] < lows[-10:-2].min() and last['close'] > prev['high']:
-            return "buy"
-            
-        return None
-    
-    @staticmethod
-    def detect_stop_hunt(df):
-        """Detect stop hunt pattern"""
-        if len(df) < 20:
-            return None
-            
-        recent_high = df['high'][-20:-2].max()
-        recent_low = df['low'][-20:-2].min()
-        prev = df.iloc[-2]
-        last = df.iloc[-1]
-        
-        if prev['high'] > recent_high and last['close'] < prev['low']:
-            return "sell"
-        if prev['low'] < recent_low and last['close'] > prev['high']:
-            return "buy"
-            
-        return None
-    
-    @staticmethod
-    def detect_retail_trap(df):
-        """Detect retail trap pattern"""
-        if len(df) < 10:
-            return None
-            
-        high = df['high'][-10:-2].max()
-        low = df['low'][-10:-2].min()
-        last = df.iloc[-1]
-        prev = df.iloc[-2]
-        
-        if last['high'] > high and last['close'] < prev['low']:
-            return "sell"
-        if last['low'] < low and last['close'] > prev['high']:
-            return "buy"
-            
-        return None
-
-# === PERFORMANCE TRACKING ===
-class PerformanceTracker:
-    def __init__(self, file_path="performance.json"):
-        self.file_path = file_path
-        self.data = self._load_data()
-    
-    def _load_data(self):
-        """Load performance data from file"""
-        if os.path.exists(self.file_path):
-            try:
-                with open(self.file_path, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.error(f"Error loading performance data: {str(e)}")
-        
-        # Default structure
-        return {
-            "trades": [],
-            "stats": {
-                "total_trades": 0,
-                "winning_trades": 0,
-                "losing_trades": 0,
-                "win_rate": 0,
-                "profit_factor": 0,
-                "total_profit": 0,
-                "max_drawdown": 0
-            }
-        }
-    
-    def _save_data(self):
-        """Save performance data to file"""
-        try:
-            with open(self.file_path, 'w') as f:
-                json.dump(self.data, f, indent=4)
-        except Exception as e:
-            logger.error(f"Error saving performance data: {str(e)}")
-    
-    def add_trade(self, trade_info):
-        """Add a new trade to the performance tracker"""
-        self.data["trades"].append(trade_info)
-        self._update_stats()
-        self._save_data()
-    
-    def _update_stats(self):
-        """Update performance statistics"""
-        trades = self.data["trades"]
-        stats = self.data["stats"]
-        
-        stats["total_trades"] = len(trades)
-        
-        if not trades:
-            return
-            
-        # Calculate basic stats
-        winning_trades = [t for t in trades if t.get("profit", 0) > 0]
-        losing_trades = [t for t in trades if t.get("profit", 0) <= 0]
-        
-        stats["winning_trades"] = len(winning_trades)
-        stats["losing_trades"] = len(losing_trades)
-        
-        if stats["total_trades"] > 0:
-            stats["win_rate"] = stats["winning_trades"] / stats["total_trades"] * 100
-        
-        # Calculate profit factor
-        total_profit = sum(t.get("profit", 0) for t in winning_trades)
-        total_loss = abs(sum(t.get("profit", 0) for t in losing_trades))
-        
-        stats["total_profit"] = total_profit - total_loss
-        
-        if total_loss > 0:
-            stats["profit_factor"] = total_profit / total_loss
-        else:
-            stats["profit_factor"] = total_profit if total_profit > 0 else 0
-        
-        # Calculate drawdown (simplified)
-        balance_curve = []
-        current_balance = 0
-        
-        for trade in trades:
-            current_balance += trade.get("profit", 0)
-            balance_curve.append(current_balance)
-        
-        if balance_curve:
-            peak = 0
-            max_dd = 0
-            
-            for balance in balance_curve:
-                if balance > peak:
-                    peak = balance
-                dd = peak - balance
-                if dd > max_dd:
-                    max_dd = dd
-            
-            stats["max_drawdown"] = max_dd
-
 # === MAIN TRADING BOT ===
 class TradingBot:
     def __init__(self, config_file=None):
@@ -700,7 +503,7 @@ class TradingBot:
                         continue
                     
                     # Get higher timeframe bias
-                    bias = TradingStrategies.get_htf_bias(self.mt5_handler, symbol, htf_timeframe)
+                    bias = TradingStrategies.get_htf_bias(self.mt5_handler, symbol, htf_timeframe, df, timeframe)
                     choch = bias and bias.startswith("choch")
                     
                     if bias:
@@ -766,7 +569,7 @@ class TradingBot:
                                 "order_block": {
                                     "low": ob[1],
                                     "high": ob[2],
-                                    "time": ob[3].isoformat() if isinstance(ob[3], pd.Timestamp) else ob[3]
+                                    "time": ob[3].isoformat() if hasattr(ob[3], "isoformat") else ob[3]
                                 }
                             }
                             self.performance_tracker.add_trade(trade_info)
@@ -786,6 +589,8 @@ class TradingBot:
 
 # === ENTRY POINT ===
 if __name__ == "__main__":
+    setup_logging()
+    
     # Create .env file template if it doesn't exist
     if not os.path.exists(".env"):
         with open(".env", "w") as f:
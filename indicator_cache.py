@@ -0,0 +1,260 @@
+import pandas as pd
+import numpy as np
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+import os
+
+from app.core.config import settings
+
+def fingerprint_series(values) -> str:
+    """
+    Compute a content fingerprint of a price series.
+
+    Args:
+        values: The prices (Series or array)
+
+    Returns:
+        A hex digest that changes whenever any value or the length changes
+    """
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(len(values)).encode("utf-8"))
+    digest.update(values.tobytes())
+    return digest.hexdigest()
+
+class IndicatorCache:
+    """
+    LRU cache of indicator values keyed by (data fingerprint, indicator, params).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        disk_path: Optional[str] = None,
+        max_size_bytes: int = 256 * 1024 * 1024,
+    ):
+        """
+        Initialize the indicator cache.
+
+        Args:
+            max_entries: The maximum number of indicators kept in memory
+            disk_path: A directory to persist indicators in, if any
+            max_size_bytes: The maximum total size of the indicators kept in memory
+        """
+        self.max_entries = max_entries
+        self.max_size_bytes = max_size_bytes
+        self.disk_path = disk_path
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        if disk_path:
+            os.makedirs(disk_path, exist_ok=True)
+
+    def _disk_file(self, key: Tuple) -> str:
+        """
+        Get the file an indicator is persisted in.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The file path
+        """
+        name = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.disk_path, f"{name}.npy")
+
+    def get_or_compute(
+        self,
+        fingerprint: str,
+        indicator: str,
+        params: Tuple,
+        compute: Callable[[], np.ndarray],
+    ) -> np.ndarray:
+        """
+        Get an indicator, computing and caching it on a miss.
+
+        Args:
+            fingerprint: The fingerprint of the input data
+            indicator: The indicator name
+            params: The indicator parameters
+            compute: A function computing the indicator values
+
+        Returns:
+            The indicator values (read-only)
+        """
+        key = (fingerprint, indicator, tuple(params))
+
+        with self._lock:
+            values = self._entries.get(key)
+            if values is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return values
+
+        # Fall back to the disk cache before recomputing
+        values = None
+        if self.disk_path and os.path.exists(self._disk_file(key)):
+            try:
+                values = np.load(self._disk_file(key))
+            except (OSError, ValueError):
+                values = None
+
+        with self._lock:
+            if values is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if values is None:
+            values = np.asarray(compute(), dtype=np.float64)
+            if self.disk_path:
+                np.save(self._disk_file(key), values)
+
+        values.setflags(write=False)
+
+        # Indicators larger than the whole budget are returned without being kept
+        if values.nbytes > self.max_size_bytes:
+            return values
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size_bytes -= previous.nbytes
+            self._entries[key] = values
+            self.size_bytes += values.nbytes
+            while len(self._entries) > self.max_entries or self.size_bytes > self.max_size_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size_bytes -= evicted.nbytes
+
+        return values
+
+    def stats(self) -> Dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            A dictionary with entry count, memory size, hits and misses
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self.size_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def clear(self):
+        """
+        Remove all indicators from memory and reset the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+indicator_cache = IndicatorCache(
+    settings.INDICATOR_CACHE_MAX_ENTRIES,
+    settings.INDICATOR_CACHE_PATH,
+    settings.INDICATOR_CACHE_MAX_BYTES,
+)
+
+def _cached(close, fingerprint: Optional[str], indicator: str, params: Tuple, compute: Callable) -> np.ndarray:
+    """
+    Look up an indicator of a close series in the shared cache.
+
+    Args:
+        close: The close prices
+        fingerprint: The fingerprint of the close prices, if already known
+        indicator: The indicator name
+        params: The indicator parameters
+        compute: A function computing the indicator from a float Series
+
+    Returns:
+        The indicator values
+    """
+    close = pd.Series(np.asarray(close, dtype=np.float64))
+    fingerprint = fingerprint or fingerprint_series(close)
+    return indicator_cache.get_or_compute(fingerprint, indicator, params, lambda: compute(close).to_numpy())
+
+def sma(close, window: int, fingerprint: Optional[str] = None) -> np.ndarray:
+    """
+    Simple moving average.
+
+    Args:
+        close: The close prices
+        window: The window length
+        fingerprint: The fingerprint of the close prices, if already known
+
+    Returns:
+        The moving average
+    """
+    return _cached(close, fingerprint, "sma", (window,), lambda c: c.rolling(window=window).mean())
+
+def rolling_std(close, window: int, fingerprint: Optional[str] = None) -> np.ndarray:
+    """
+    Rolling standard deviation.
+
+    Args:
+        close: The close prices
+        window: The window length
+        fingerprint: The fingerprint of the close prices, if already known
+
+    Returns:
+        The rolling standard deviation
+    """
+    return _cached(close, fingerprint, "std", (window,), lambda c: c.rolling(window=window).std())
+
+def ema(close, span: int, fingerprint: Optional[str] = None) -> np.ndarray:
+    """
+    Exponential moving average.
+
+    Args:
+        close: The close prices
+        span: The span of the average
+        fingerprint: The fingerprint of the close prices, if already known
+
+    Returns:
+        The exponential moving average
+    """
+    return _cached(close, fingerprint, "ema", (span,), lambda c: c.ewm(span=span, adjust=False).mean())
+
+def calculate_rsi(close: pd.Series, window: int) -> pd.Series:
+    """
+    Calculate the RSI with simple moving averages of gains and losses.
+
+    Args:
+        close: The close prices
+        window: The window length
+
+    Returns:
+        The RSI
+    """
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+
+    avg_gain = gain.rolling(window=window).mean()
+    avg_loss = loss.rolling(window=window).mean()
+
+    rs = avg_gain / avg_loss
+    return 100 - (100 / (1 + rs))
+
+def rsi(close, window: int, fingerprint: Optional[str] = None) -> np.ndarray:
+    """
+    Relative Strength Index.
+
+    Args:
+        close: The close prices
+        window: The window length
+        fingerprint: The fingerprint of the close prices, if already known
+
+    Returns:
+        The RSI
+    """
+    return _cached(close, fingerprint, "rsi", (window,), lambda c: calculate_rsi(c, window))
@@ -0,0 +1,94 @@
+"""
+Load test comparing the sync and async CRUD endpoints.
+
+Start the API with a fixed number of workers, create a user and a few
+strategies, then run:
+
+    python load_test.py --url http://localhost:8000 --token <access token>
+
+Each endpoint receives the same number of requests at the same
+concurrency, and throughput, latency percentiles and errors are reported.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+async def run(client: httpx.AsyncClient, path: str, requests: int, concurrency: int) -> dict:
+    """
+    Send requests to one endpoint.
+
+    Args:
+        client: The HTTP client
+        path: The endpoint path
+        requests: The number of requests
+        concurrency: The number of concurrent requests
+
+    Returns:
+        A dictionary with the load test results
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    errors = 0
+
+    async def request():
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                response = await client.get(path)
+                if response.status_code != 200:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[request() for _ in range(requests)])
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "path": path,
+        "requests_per_second": requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "errors": errors,
+    }
+
+async def main(url: str, token: str, requests: int, concurrency: int, paths: list):
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=url,
+        headers={"Authorization": f"Bearer {token}"},
+        limits=limits,
+        timeout=60,
+    ) as client:
+        for path in paths:
+            # Warm up connections and caches
+            await run(client, path, concurrency, concurrency)
+
+            results = await run(client, path, requests, concurrency)
+            print(
+                f"{results['path']:<32} {results['requests_per_second']:8.1f} req/s, "
+                f"p50 {results['p50_ms']:7.1f} ms, p95 {results['p95_ms']:7.1f} ms, "
+                f"{results['errors']} errors"
+            )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--token", required=True)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument(
+        "--paths",
+        nargs="+",
+        default=["/api/v1/strategies/", "/api/v1/async/strategies/"],
+    )
+    args = parser.parse_args()
+
+    asyncio.run(main(args.url, args.token, args.requests, args.concurrency, args.paths))
@@ -1,14 +1,20 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from app.api.api import api_router
+from app.api.responses import FastJSONResponse
+from app.backtester.visualization import render_pool
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
+from app.core.security import PasswordHasherBusy
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description=settings.PROJECT_DESCRIPTION,
     version=settings.PROJECT_VERSION,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=FastJSONResponse,
 )
 
 # Set up CORS middleware
@@ -20,6 +26,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON and text responses with brotli or gzip
+app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MINIMUM_SIZE)
+
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    # Reject quickly instead of queueing more bcrypt work
+    return JSONResponse(
+        status_code=429,
+        content={"detail": "Too many authentication requests, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
+@app.on_event("startup")
+def start_chart_workers():
+    # Workers import the plotting stack now instead of on the first report
+    render_pool.start_pool()
+
+@app.on_event("shutdown")
+def stop_chart_workers():
+    render_pool.shutdown_pool()
+
 # Include routers
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
@@ -0,0 +1,261 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Union
+from concurrent.futures import ProcessPoolExecutor
+
+from app.backtester.engine.trade_analytics import match_round_trips
+
+def resample_trades(
+    pnl: np.ndarray,
+    n_paths: int,
+    n_trades: Optional[int] = None,
+    initial_capital: float = 10000.0,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    Build equity paths by resampling trade P&L with replacement.
+
+    Args:
+        pnl: The P&L of each round-trip trade
+        n_paths: The number of paths to simulate
+        n_trades: The number of trades per path (defaults to len(pnl))
+        initial_capital: The initial capital
+        rng: The random number generator
+
+    Returns:
+        A (n_paths, n_trades + 1) array of equity values
+    """
+    rng = rng or np.random.default_rng()
+    n_trades = n_trades or len(pnl)
+
+    # Draw all trade indices for the batch at once
+    indices = rng.integers(0, len(pnl), size=(n_paths, n_trades))
+
+    equity = np.empty((n_paths, n_trades + 1))
+    equity[:, 0] = initial_capital
+    np.cumsum(pnl[indices], axis=1, out=equity[:, 1:])
+    equity[:, 1:] += initial_capital
+
+    return equity
+
+def block_bootstrap_returns(
+    returns: np.ndarray,
+    n_paths: int,
+    block_size: int = 20,
+    n_bars: Optional[int] = None,
+    initial_capital: float = 10000.0,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    Build equity paths with a circular moving-block bootstrap of bar returns.
+
+    Sampling contiguous blocks keeps the short-term autocorrelation and
+    volatility clustering of the original returns.
+
+    Args:
+        returns: The bar returns
+        n_paths: The number of paths to simulate
+        block_size: The number of consecutive bars per block
+        n_bars: The number of bars per path (defaults to len(returns))
+        initial_capital: The initial capital
+        rng: The random number generator
+
+    Returns:
+        A (n_paths, n_bars + 1) array of equity values
+    """
+    rng = rng or np.random.default_rng()
+    n_bars = n_bars or len(returns)
+    block_size = max(1, min(block_size, len(returns)))
+    n_blocks = -(-n_bars // block_size)
+
+    # Expand random block starts into a wrapped index matrix
+    starts = rng.integers(0, len(returns), size=(n_paths, n_blocks, 1))
+    indices = (starts + np.arange(block_size)).reshape(n_paths, -1)[:, :n_bars]
+    indices %= len(returns)
+
+    equity = np.empty((n_paths, n_bars + 1))
+    equity[:, 0] = initial_capital
+    np.cumprod(1 + returns[indices], axis=1, out=equity[:, 1:])
+    equity[:, 1:] *= initial_capital
+
+    return equity
+
+def calculate_path_statistics(equity: np.ndarray, periods_per_year: float = 252) -> Dict[str, np.ndarray]:
+    """
+    Calculate final equity, max drawdown and Sharpe ratio for each path.
+
+    Args:
+        equity: A (n_paths, n_steps) array of equity values
+        periods_per_year: The number of steps per year, used to annualize
+            the Sharpe ratio
+
+    Returns:
+        A dictionary mapping metric names to arrays with one value per path
+    """
+    # Calculate drawdown
+    peak = np.maximum.accumulate(equity, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        max_drawdown = np.nanmax(1 - equity / peak, axis=1)
+
+        # Sharpe ratio (assuming risk-free rate of 0)
+        returns = equity[:, 1:] / equity[:, :-1] - 1
+        if returns.shape[1] < 2:
+            # A single step has no volatility to measure
+            sharpe_ratio = np.zeros(len(equity))
+        else:
+            mean = returns.mean(axis=1)
+            std = returns.std(axis=1, ddof=1)
+            sharpe_ratio = np.where(std > 0, mean / std * np.sqrt(periods_per_year), 0.0)
+
+    return {
+        "final_equity": equity[:, -1].copy(),
+        "max_drawdown": max_drawdown,
+        "sharpe_ratio": sharpe_ratio,
+    }
+
+def _simulate_batch(
+    method: str,
+    samples: np.ndarray,
+    n_paths: int,
+    length: int,
+    block_size: int,
+    initial_capital: float,
+    periods_per_year: float,
+    seed: np.random.SeedSequence,
+) -> Dict[str, np.ndarray]:
+    """
+    Simulate one batch of paths and reduce it to per-path statistics.
+
+    Args:
+        method: "trades" or "bootstrap"
+        samples: The trade P&L or bar returns to resample
+        n_paths: The number of paths in the batch
+        length: The number of steps per path
+        block_size: The block size for the bootstrap
+        initial_capital: The initial capital
+        periods_per_year: The number of steps per year
+        seed: The seed for this batch
+
+    Returns:
+        A dictionary with the path statistics of the batch
+    """
+    rng = np.random.default_rng(seed)
+
+    if method == "trades":
+        equity = resample_trades(samples, n_paths, length, initial_capital, rng)
+    else:
+        equity = block_bootstrap_returns(samples, n_paths, block_size, length, initial_capital, rng)
+
+    return calculate_path_statistics(equity, periods_per_year)
+
+def _confidence_interval(values: np.ndarray, confidence: float) -> Dict:
+    """
+    Summarize a distribution with its mean, median and confidence bounds.
+
+    Args:
+        values: The simulated values
+        confidence: The confidence level (e.g., 0.95)
+
+    Returns:
+        A dictionary with the summary statistics
+    """
+    tail = (1 - confidence) / 2 * 100
+    lower, median, upper = np.nanpercentile(values, [tail, 50, 100 - tail])
+
+    return {
+        "mean": float(np.nanmean(values)),
+        "median": float(median),
+        "lower": float(lower),
+        "upper": float(upper),
+    }
+
+def run_monte_carlo(
+    results: Dict,
+    method: str = "trades",
+    n_paths: int = 10000,
+    confidence: float = 0.95,
+    block_size: int = 20,
+    ruin_threshold: float = 0.5,
+    periods_per_year: Optional[float] = None,
+    batch_size: int = 1000,
+    n_jobs: int = 1,
+    seed: Optional[int] = None,
+) -> Dict:
+    """
+    Run a Monte Carlo robustness analysis on backtest results.
+
+    With method "trades" the round-trip trade P&L is resampled with
+    replacement; with method "bootstrap" the bar returns of the equity curve
+    are block-bootstrapped. Paths are simulated in batches of NumPy matrices
+    to bound memory, optionally across a process pool.
+
+    Args:
+        results: The backtest results with "equity_curve" and "trades"
+        method: The resampling method ("trades" or "bootstrap")
+        n_paths: The number of paths to simulate
+        confidence: The confidence level of the reported intervals
+        block_size: The block size for the bootstrap
+        ruin_threshold: The drawdown at which a path counts as ruined
+        periods_per_year: The number of steps per year for the Sharpe ratio
+            (defaults to 252 for bars and the observed trade frequency for trades)
+        batch_size: The number of paths simulated per matrix
+        n_jobs: The number of worker processes (1 runs in-process)
+        seed: The random seed
+
+    Returns:
+        A dictionary with confidence intervals for final equity, max drawdown
+        and Sharpe ratio, plus the probabilities of loss and ruin
+    """
+    equity_curve = pd.DataFrame(results["equity_curve"])
+    if equity_curve.empty:
+        raise ValueError("Monte Carlo requires an equity curve")
+    initial_capital = float(equity_curve["equity"].iloc[0])
+
+    if method == "trades":
+        round_trips = match_round_trips(results["trades"])
+        if round_trips.empty:
+            raise ValueError("Monte Carlo by trades requires at least one round-trip trade")
+        samples = round_trips["pnl"].to_numpy(dtype=np.float64)
+
+        if periods_per_year is None:
+            # Annualize by the number of trades per year observed in the backtest
+            dates = pd.to_datetime(equity_curve["date"])
+            years = max((dates.iloc[-1] - dates.iloc[0]).days / 365.25, 1 / 365.25)
+            periods_per_year = len(samples) / years
+    elif method == "bootstrap":
+        samples = equity_curve["equity"].pct_change().dropna().to_numpy(dtype=np.float64)
+        if len(samples) == 0:
+            raise ValueError("Monte Carlo bootstrap requires at least two equity points")
+        periods_per_year = periods_per_year or 252
+    else:
+        raise ValueError(f"Unknown Monte Carlo method: {method}")
+
+    # Split the paths into batches with independent random streams
+    batch_sizes = [min(batch_size, n_paths - i) for i in range(0, n_paths, batch_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(batch_sizes))
+    args = [
+        (method, samples, size, len(samples), block_size, initial_capital, periods_per_year, batch_seed)
+        for size, batch_seed in zip(batch_sizes, seeds)
+    ]
+
+    if n_jobs > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            batches = list(executor.map(_simulate_batch, *zip(*args)))
+    else:
+        batches = [_simulate_batch(*batch_args) for batch_args in args]
+
+    statistics = {
+        key: np.concatenate([batch[key] for batch in batches])
+        for key in ("final_equity", "max_drawdown", "sharpe_ratio")
+    }
+
+    return {
+        "method": method,
+        "n_paths": n_paths,
+        "confidence": confidence,
+        "final_equity": _confidence_interval(statistics["final_equity"], confidence),
+        "max_drawdown": _confidence_interval(statistics["max_drawdown"], confidence),
+        "sharpe_ratio": _confidence_interval(statistics["sharpe_ratio"], confidence),
+        "probability_of_loss": float((statistics["final_equity"] < initial_capital).mean()),
+        "risk_of_ruin": float((statistics["max_drawdown"] >= ruin_threshold).mean()),
+    }
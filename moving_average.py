@@ -41,13 +41,23 @@ class MovingAverageStrategy(Strategy):
         short_window = self.parameters.get("short_window", 50)
         long_window = self.parameters.get("long_window", 200)
         
-        # Check if we have enough data
-        if len(data) < long_window:
-            return signals
-        
-        # Calculate moving averages
-        short_ma = data["close"].rolling(window=short_window).mean()
-        long_ma = data["close"].rolling(window=long_window).mean()
+        # Use precomputed moving averages when available
+        short_column = f"sma_{short_window}"
+        long_column = f"sma_{long_window}"
+        if short_column in data.columns and long_column in data.columns:
+            if len(data) < 2:
+                return signals
+            short_ma = data[short_column]
+            long_ma = data[long_column]
+        else:
+            # Check if we have enough data
+            if len(data) < long_window:
+                return signals
+            
+            # Calculate moving averages over the last bars only
+            close = data["close"].iloc[-(max(short_window, long_window) + 1):]
+            short_ma = close.rolling(window=short_window).mean()
+            long_ma = close.rolling(window=long_window).mean()
         
         # Generate signals
         if short_ma.iloc[-1] > long_ma.iloc[-1] and short_ma.iloc[-2] <= long_ma.iloc[-2]:
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Float
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Float, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -21,3 +21,9 @@ class Order(Base):
     
     trading_account = relationship("TradingAccount", back_populates="orders")
 
+    __table_args__ = (
+        Index("ix_orders_trading_account_id_status", "trading_account_id", "status"),
+        Index("ix_orders_trading_account_id_symbol", "trading_account_id", "symbol"),
+        Index("ix_orders_trading_account_id_created_at", "trading_account_id", "created_at"),
+    )
+
@@ -1,13 +1,25 @@
 import pandas as pd
 import numpy as np
-from typing import Dict
+from typing import Dict, Optional
 
-def calculate_performance(equity_curve: pd.DataFrame) -> Dict:
+from app.backtester.engine.trade_analytics import match_round_trips, calculate_trade_metrics
+
+def calculate_performance(
+    equity_curve: pd.DataFrame,
+    trades: Optional[pd.DataFrame] = None,
+    data: Optional[pd.DataFrame] = None,
+) -> Dict:
     """
     Calculate performance metrics from an equity curve.
     
+    When trades are given, win rate and profit factor are computed from
+    round-trip trades instead of bar returns, and trade-level metrics are
+    included.
+    
     Args:
         equity_curve: The equity curve
+        trades: The trades recorded by the portfolio
+        data: The market data, used for trade excursions
         
     Returns:
         A dictionary with performance metrics
@@ -41,7 +53,7 @@ def calculate_performance(equity_curve: pd.DataFrame) -> Dict:
     gross_loss = abs(returns[returns < 0].sum())
     profit_factor = gross_profit / gross_loss if gross_loss != 0 else float("inf")
     
-    return {
+    metrics = {
         "total_return": total_return,
         "annual_return": annual_return,
         "volatility": volatility,
@@ -50,4 +62,12 @@ def calculate_performance(equity_curve: pd.DataFrame) -> Dict:
         "win_rate": win_rate,
         "profit_factor": profit_factor,
     }
+    
+    # Use round-trip trades for trade statistics when available
+    if trades is not None and len(trades) > 0:
+        trade_metrics = calculate_trade_metrics(match_round_trips(trades, data))
+        if trade_metrics["total_trades"] > 0:
+            metrics.update(trade_metrics)
+    
+    return metrics
 
@@ -3,6 +3,8 @@ import numpy as np
 from typing import Dict, List, Optional
 from datetime import datetime
 
+from app.backtester.engine.trade_analytics import match_round_trips
+
 class Portfolio:
     """
     Manages a simulated portfolio for backtesting.
@@ -134,4 +136,15 @@ class Portfolio:
             A pandas DataFrame with the trades
         """
         return pd.DataFrame(self.trades)
-
+    
+    def get_round_trips(self, data: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        Get the round-trip trades.
+        
+        Args:
+            data: The market data, used for trade excursions
+            
+        Returns:
+            A pandas DataFrame with one row per closed trade
+        """
+        return match_round_trips(self.trades, data)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Float
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Float, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -21,3 +21,8 @@ class Position(Base):
     
     trading_account = relationship("TradingAccount", back_populates="positions")
 
+    __table_args__ = (
+        Index("ix_positions_trading_account_id_symbol", "trading_account_id", "symbol"),
+        Index("ix_positions_trading_account_id_external_id", "trading_account_id", "external_id"),
+    )
+
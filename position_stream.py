@@ -0,0 +1,319 @@
+import asyncio
+import time
+from sqlalchemy.orm import Session
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set
+
+from app.core.config import settings
+from app.db.models.position import Position
+
+# numpy is imported on first use to keep it out of the API's cold start
+if TYPE_CHECKING:
+    import numpy as np
+
+def get_open_positions(db: Session, account_id: int) -> List[Position]:
+    """
+    Get the open positions of a trading account.
+
+    Args:
+        db: The database session
+        account_id: The trading account ID
+
+    Returns:
+        The positions
+    """
+    return db.query(Position).filter(Position.trading_account_id == account_id).all()
+
+def compute_unrealized_pnl(
+    direction: "np.ndarray",
+    quantity: "np.ndarray",
+    entry_price: "np.ndarray",
+    bid: "np.ndarray",
+    ask: "np.ndarray",
+) -> "np.ndarray":
+    """
+    Compute the unrealized P&L of many positions at once.
+
+    Long positions are valued at the bid and short positions at the ask,
+    the prices they would be closed at.
+
+    Args:
+        direction: 1 for long positions, -1 for short positions
+        quantity: The position quantities
+        entry_price: The entry prices
+        bid: The current bid price of each position's symbol
+        ask: The current ask price of each position's symbol
+
+    Returns:
+        The unrealized P&L of each position
+    """
+    import numpy as np
+
+    exit_price = np.where(direction > 0, bid, ask)
+    return (exit_price - entry_price) * quantity * direction
+
+class AccountChannel:
+    """
+    Open positions and subscribers of one trading account.
+    """
+
+    def __init__(self, account_id: int, positions: Iterable[Position]):
+        """
+        Initialize the channel.
+
+        Args:
+            account_id: The trading account ID
+            positions: The account's open positions
+        """
+        self.account_id = account_id
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.set_positions(positions)
+
+    def set_positions(self, positions: Iterable[Position]):
+        """
+        Replace the positions, e.g. after a broker sync.
+
+        Args:
+            positions: The account's open positions
+        """
+        import numpy as np
+
+        positions = list(positions)
+        self.ids = np.array([position.id for position in positions], dtype=np.int64)
+        self.symbols = [position.symbol for position in positions]
+        self.direction = np.array([1.0 if position.side == "long" else -1.0 for position in positions])
+        self.quantity = np.array([position.quantity for position in positions], dtype=np.float64)
+        self.entry_price = np.array([position.entry_price for position in positions], dtype=np.float64)
+
+        # Start from the last stored price until the first tick arrives
+        current_price = np.array(
+            [position.current_price if position.current_price is not None else position.entry_price for position in positions],
+            dtype=np.float64,
+        )
+        self.bid = current_price.copy()
+        self.ask = current_price.copy()
+
+        self.symbol_index: Dict[str, "np.ndarray"] = {}
+        for symbol in set(self.symbols):
+            self.symbol_index[symbol] = np.array(
+                [i for i, position_symbol in enumerate(self.symbols) if position_symbol == symbol],
+                dtype=np.int64,
+            )
+
+        # Ticks received before a resync are newer than the stored prices
+        previous_prices = getattr(self, "prices", {})
+        self.prices: Dict[str, dict] = {}
+        for symbol, price in previous_prices.items():
+            if symbol in self.symbol_index:
+                self.update_price(symbol, price["bid"], price["ask"], price["time"])
+
+        self.dirty = True
+
+    def update_price(self, symbol: str, bid: float, ask: float, timestamp: float) -> bool:
+        """
+        Apply a price tick.
+
+        Args:
+            symbol: The symbol
+            bid: The bid price
+            ask: The ask price
+            timestamp: The tick time (epoch seconds)
+
+        Returns:
+            True if the account holds a position in the symbol
+        """
+        index = self.symbol_index.get(symbol)
+        if index is None:
+            return False
+
+        self.bid[index] = bid
+        self.ask[index] = ask
+        self.prices[symbol] = {"bid": bid, "ask": ask, "time": timestamp}
+        self.dirty = True
+        return True
+
+    def frame(self) -> dict:
+        """
+        Build an update for the subscribers.
+
+        Returns:
+            A dictionary with the latest prices and the positions' P&L
+        """
+        import numpy as np
+
+        pnl = compute_unrealized_pnl(self.direction, self.quantity, self.entry_price, self.bid, self.ask)
+        current_price = np.where(self.direction > 0, self.bid, self.ask)
+
+        return {
+            "trading_account_id": self.account_id,
+            "time": time.time(),
+            "prices": self.prices,
+            "positions": {
+                "id": self.ids.tolist(),
+                "current_price": current_price.tolist(),
+                "unrealized_pnl": pnl.tolist(),
+            },
+            "unrealized_pnl": float(pnl.sum()),
+        }
+
+class PositionStreamHub:
+    """
+    Pushes price ticks and unrealized P&L to WebSocket subscribers.
+
+    Ticks only update in-memory price arrays; a single loop recomputes the
+    P&L of changed accounts at a fixed frame rate. Each subscriber has a
+    one-slot queue holding the latest frame, so a slow client skips frames
+    instead of accumulating a backlog.
+
+    The hub is process-local. A tick published to one worker only reaches
+    the WebSocket clients connected to that worker, and a position sync
+    only refreshes that worker's channels. Serve the streaming endpoints
+    from a single worker process, or have the price feed publish every
+    tick to each worker.
+    """
+
+    def __init__(self, frame_rate: float = 4):
+        """
+        Initialize the hub.
+
+        Args:
+            frame_rate: The maximum number of updates per second per account
+        """
+        self.frame_rate = frame_rate
+        self.channels: Dict[int, AccountChannel] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def has_channel(self, account_id: int) -> bool:
+        """
+        Check whether an account has subscribers.
+
+        Args:
+            account_id: The trading account ID
+
+        Returns:
+            True if the account has a channel
+        """
+        return account_id in self.channels
+
+    def subscribe(self, account_id: int, positions: Iterable[Position]) -> asyncio.Queue:
+        """
+        Subscribe to the updates of a trading account.
+
+        Args:
+            account_id: The trading account ID
+            positions: The account's open positions, used if the channel is new
+
+        Returns:
+            The queue the subscriber's frames are delivered to
+        """
+        channel = self.channels.get(account_id)
+        if channel is None:
+            channel = self.channels[account_id] = AccountChannel(account_id, positions)
+
+        queue = asyncio.Queue(maxsize=1)
+        channel.subscribers.add(queue)
+
+        # Send the current state straight away
+        self._offer(queue, channel.frame())
+        self._ensure_running()
+
+        return queue
+
+    def unsubscribe(self, account_id: int, queue: asyncio.Queue):
+        """
+        Remove a subscriber, dropping the channel once it has none left.
+
+        Args:
+            account_id: The trading account ID
+            queue: The subscriber's queue
+        """
+        channel = self.channels.get(account_id)
+        if channel is None:
+            return
+
+        channel.subscribers.discard(queue)
+        if not channel.subscribers:
+            del self.channels[account_id]
+
+    def set_positions(self, account_id: int, positions: Iterable[Position]):
+        """
+        Replace the positions of a subscribed account.
+
+        Args:
+            account_id: The trading account ID
+            positions: The account's open positions
+        """
+        channel = self.channels.get(account_id)
+        if channel is not None:
+            channel.set_positions(positions)
+
+    def publish_tick(self, symbol: str, bid: float, ask: Optional[float] = None, timestamp: Optional[float] = None) -> int:
+        """
+        Publish a price tick to all accounts holding the symbol.
+
+        Args:
+            symbol: The symbol
+            bid: The bid price (or the last price if no ask is given)
+            ask: The ask price
+            timestamp: The tick time (defaults to now)
+
+        Returns:
+            The number of accounts updated
+        """
+        ask = bid if ask is None else ask
+        timestamp = time.time() if timestamp is None else timestamp
+
+        updated = 0
+        for channel in self.channels.values():
+            if channel.update_price(symbol, bid, ask, timestamp):
+                updated += 1
+        return updated
+
+    def flush(self) -> int:
+        """
+        Send a frame to the subscribers of every changed account.
+
+        Returns:
+            The number of accounts a frame was sent for
+        """
+        flushed = 0
+        for channel in list(self.channels.values()):
+            if not channel.dirty:
+                continue
+
+            frame = channel.frame()
+            channel.dirty = False
+            for queue in channel.subscribers:
+                self._offer(queue, frame)
+            flushed += 1
+
+        return flushed
+
+    def _offer(self, queue: asyncio.Queue, frame: dict):
+        """
+        Put a frame in a subscriber's queue, replacing an unsent one.
+
+        Args:
+            queue: The subscriber's queue
+            frame: The frame
+        """
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(frame)
+
+    def _ensure_running(self):
+        """
+        Start the frame loop if it is not running.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        """
+        Flush changed accounts at the frame rate while there are subscribers.
+        """
+        interval = 1 / self.frame_rate
+        while self.channels:
+            await asyncio.sleep(interval)
+            self.flush()
+
+position_stream_hub = PositionStreamHub(settings.POSITION_STREAM_FRAME_RATE)
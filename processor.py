@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from app.backtester.data.indicator_cache import fingerprint_series, sma, rolling_std, ema, rsi
 
 class DataProcessor:
     """
@@ -21,10 +23,7 @@ class DataProcessor:
         processed_data = data.copy()
         
         # Ensure required columns exist
-        required_columns = ["date", "open", "high", "low", "close", "volume"]
-        for column in required_columns:
-            if column not in processed_data.columns:
-                raise ValueError(f"Required column {column} not found in data")
+        _check_columns(processed_data)
         
         # Ensure data is sorted by date
         processed_data = processed_data.sort_values("date")
@@ -33,61 +32,230 @@ class DataProcessor:
         processed_data = processed_data.drop_duplicates(subset=["date"])
         
         # Fill missing values
-        processed_data = processed_data.fillna(method="ffill")
+        processed_data = processed_data.ffill()
         
-        # Calculate additional features
-        processed_data["returns"] = processed_data["close"].pct_change()
+        # Calculate additional features (in float64, prices may be compact float32)
+        processed_data["returns"] = processed_data["close"].astype(np.float64).pct_change()
         
         return processed_data
     
-    def add_technical_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
+    def process_data_chunks(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """
+        Process raw market data chunk by chunk.
+        
+        The chunks must be in time order (bars within a chunk may be
+        unsorted). The last bar date, the last valid value of every column
+        and the last close are carried across chunk boundaries, so the
+        concatenated output matches `process_data` on the full history
+        while only one chunk is held in memory at a time.
+        
+        Args:
+            chunks: The raw market data chunks (e.g., from
+                `DataStorage.iter_data` or `pd.read_csv(..., chunksize=...)`)
+            
+        Returns:
+            An iterator over the processed chunks
+        """
+        last_date = None
+        last_values = None
+        
+        for chunk in chunks:
+            _check_columns(chunk)
+            
+            # Sort and de-duplicate within the chunk
+            chunk = chunk.sort_values("date").drop_duplicates(subset=["date"])
+            
+            if last_date is not None:
+                if (chunk["date"] < last_date).any():
+                    raise ValueError("Chunks must be in time order")
+                
+                # Drop bars already emitted at the chunk boundary
+                chunk = chunk[chunk["date"] > last_date]
+            
+            if chunk.empty:
+                continue
+            
+            # Fill missing values, continuing from the previous chunk
+            chunk = chunk.ffill()
+            if last_values is not None:
+                chunk = chunk.fillna(last_values)
+            
+            # Calculate additional features
+            close = chunk["close"].astype(np.float64)
+            returns = close.pct_change()
+            if last_values is not None and pd.notna(last_values.get("close")):
+                returns.iloc[0] = close.iloc[0] / float(last_values["close"]) - 1
+            chunk["returns"] = returns
+            
+            last_date = chunk["date"].iloc[-1]
+            last_values = chunk.iloc[-1].drop("returns")
+            
+            yield chunk
+    
+    def add_technical_indicators(
+        self,
+        data: pd.DataFrame,
+        indicators: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
         """
         Add technical indicators to the data.
         
+        Indicators are requested by name: "sma_<window>", "ema_<span>",
+        "bb_<window>" (Bollinger Bands, 2 standard deviations),
+        "rsi_<window>" and "macd" or "macd_<fast>_<slow>_<signal>".
+        Intermediates shared between indicators (rolling means, EMAs) are
+        computed once and cached, and all columns are written into one
+        preallocated array that is joined to the data in a single step.
+        
         Args:
             data: The market data
+            indicators: The indicators to add (defaults to DEFAULT_INDICATORS)
             
         Returns:
             The market data with technical indicators
         """
-        # Make a copy of the data
-        processed_data = data.copy()
+        indicators = DEFAULT_INDICATORS if indicators is None else indicators
+        intermediates = _Intermediates(data["close"])
         
-        # Simple Moving Averages
-        processed_data["sma_5"] = processed_data["close"].rolling(window=5).mean()
-        processed_data["sma_10"] = processed_data["close"].rolling(window=10).mean()
-        processed_data["sma_20"] = processed_data["close"].rolling(window=20).mean()
-        processed_data["sma_50"] = processed_data["close"].rolling(window=50).mean()
-        processed_data["sma_200"] = processed_data["close"].rolling(window=200).mean()
-        
-        # Exponential Moving Averages
-        processed_data["ema_5"] = processed_data["close"].ewm(span=5, adjust=False).mean()
-        processed_data["ema_10"] = processed_data["close"].ewm(span=10, adjust=False).mean()
-        processed_data["ema_20"] = processed_data["close"].ewm(span=20, adjust=False).mean()
-        processed_data["ema_50"] = processed_data["close"].ewm(span=50, adjust=False).mean()
-        processed_data["ema_200"] = processed_data["close"].ewm(span=200, adjust=False).mean()
-        
-        # Bollinger Bands
-        processed_data["bb_middle"] = processed_data["close"].rolling(window=20).mean()
-        processed_data["bb_std"] = processed_data["close"].rolling(window=20).std()
-        processed_data["bb_upper"] = processed_data["bb_middle"] + 2 * processed_data["bb_std"]
-        processed_data["bb_lower"] = processed_data["bb_middle"] - 2 * processed_data["bb_std"]
-        
-        # RSI
-        delta = processed_data["close"].diff()
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
-        
-        avg_gain = gain.rolling(window=14).mean()
-        avg_loss = loss.rolling(window=14).mean()
-        
-        rs = avg_gain / avg_loss
-        processed_data["rsi"] = 100 - (100 / (1 + rs))
-        
-        # MACD
-        processed_data["macd"] = processed_data["ema_12"] - processed_data["ema_26"]
-        processed_data["macd_signal"] = processed_data["macd"].ewm(span=9, adjust=False).mean()
-        processed_data["macd_histogram"] = processed_data["macd"] - processed_data["macd_signal"]
+        columns = []
+        for spec in indicators:
+            columns.extend(_indicator_columns(spec))
         
-        return processed_data
+        # Preallocate one block for every requested column
+        values = np.empty((len(data), len(columns)), dtype=np.float64)
+        position = 0
+        for spec in indicators:
+            for series in _compute_indicator(spec, intermediates):
+                values[:, position] = series
+                position += 1
+        
+        indicator_data = pd.DataFrame(values, columns=columns, index=data.index)
+        return pd.concat([data.drop(columns=columns, errors="ignore"), indicator_data], axis=1)
+
+REQUIRED_COLUMNS = ["date", "open", "high", "low", "close", "volume"]
 
+def _check_columns(data: pd.DataFrame):
+    """
+    Ensure the required columns exist.
+    
+    Args:
+        data: The market data
+    """
+    for column in REQUIRED_COLUMNS:
+        if column not in data.columns:
+            raise ValueError(f"Required column {column} not found in data")
+
+DEFAULT_INDICATORS = [
+    "sma_5", "sma_10", "sma_20", "sma_50", "sma_200",
+    "ema_5", "ema_10", "ema_20", "ema_50", "ema_200",
+    "bb_20",
+    "rsi_14",
+    "macd",
+]
+
+def _parse_indicator(spec: str):
+    """
+    Split an indicator spec into its name and integer parameters.
+    
+    Args:
+        spec: The indicator spec (e.g., "sma_20")
+        
+    Returns:
+        A tuple of (name, parameters)
+    """
+    name, *parameters = spec.split("_")
+    try:
+        return name, [int(parameter) for parameter in parameters]
+    except ValueError:
+        raise ValueError(f"Invalid indicator: {spec}")
+
+def _indicator_columns(spec: str) -> List[str]:
+    """
+    Get the column names produced by an indicator.
+    
+    Args:
+        spec: The indicator spec
+        
+    Returns:
+        The column names
+    """
+    name, parameters = _parse_indicator(spec)
+    
+    if name in ("sma", "ema") and len(parameters) == 1:
+        return [spec]
+    if name == "bb" and len(parameters) == 1:
+        # The default 20-period bands keep their historical column names
+        suffix = "" if parameters[0] == 20 else f"_{parameters[0]}"
+        return [f"bb_middle{suffix}", f"bb_std{suffix}", f"bb_upper{suffix}", f"bb_lower{suffix}"]
+    if name == "rsi" and len(parameters) == 1:
+        return ["rsi" if parameters[0] == 14 else spec]
+    if name == "macd" and len(parameters) in (0, 3):
+        suffix = "" if parameters in ([], [12, 26, 9]) else "_" + "_".join(map(str, parameters))
+        return [f"macd{suffix}", f"macd_signal{suffix}", f"macd_histogram{suffix}"]
+    
+    raise ValueError(f"Unknown indicator: {spec}")
+
+def _compute_indicator(spec: str, intermediates: "_Intermediates") -> List[np.ndarray]:
+    """
+    Compute the columns of an indicator.
+    
+    Args:
+        spec: The indicator spec
+        intermediates: The shared intermediate results
+        
+    Returns:
+        The column values, in the order of `_indicator_columns`
+    """
+    name, parameters = _parse_indicator(spec)
+    
+    if name == "sma":
+        return [intermediates.sma(parameters[0])]
+    if name == "ema":
+        return [intermediates.ema(parameters[0])]
+    if name == "bb":
+        window = parameters[0]
+        middle = intermediates.sma(window)
+        std = intermediates.std(window)
+        return [middle, std, middle + 2 * std, middle - 2 * std]
+    if name == "rsi":
+        return [intermediates.rsi(parameters[0])]
+    
+    # MACD
+    fast, slow, signal = parameters or [12, 26, 9]
+    macd = intermediates.ema(fast) - intermediates.ema(slow)
+    macd_signal = pd.Series(macd).ewm(span=signal, adjust=False).mean().to_numpy()
+    return [macd, macd_signal, macd - macd_signal]
+
+class _Intermediates:
+    """
+    Intermediate series shared by the indicators of one call.
+    
+    Values come from the shared indicator cache, so they are also reused
+    across calls, strategies and backtests on the same close series.
+    """
+    
+    def __init__(self, close: pd.Series):
+        """
+        Initialize the intermediates.
+        
+        Args:
+            close: The close prices
+        """
+        self.close = close.to_numpy(dtype=np.float64)
+        self.fingerprint = fingerprint_series(self.close)
+    
+    def sma(self, window: int) -> np.ndarray:
+        """Rolling mean of the close prices."""
+        return sma(self.close, window, self.fingerprint)
+    
+    def std(self, window: int) -> np.ndarray:
+        """Rolling standard deviation of the close prices."""
+        return rolling_std(self.close, window, self.fingerprint)
+    
+    def ema(self, span: int) -> np.ndarray:
+        """Exponential moving average of the close prices."""
+        return ema(self.close, span, self.fingerprint)
+    
+    def rsi(self, window: int) -> np.ndarray:
+        """Relative Strength Index of the close prices."""
+        return rsi(self.close, window, self.fingerprint)
@@ -0,0 +1,136 @@
+import atexit
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def _init_worker():
+    """
+    Import the plotting stack and render a throwaway figure in a worker.
+    
+    This moves the matplotlib/seaborn import and font cache setup out of the
+    first real render and out of the API process entirely.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import seaborn  # noqa: F401
+    from app.backtester.visualization import charts  # noqa: F401
+    
+    plt.figure(figsize=(1, 1))
+    plt.plot([0, 1], [0, 1])
+    charts._figure_to_png()
+
+def _ping() -> int:
+    """
+    No-op task used to start every worker up front.
+    
+    Returns:
+        The worker process ID
+    """
+    return os.getpid()
+
+def _render(chart: str, args: Tuple) -> bytes:
+    """
+    Render one chart in a worker.
+    
+    Args:
+        chart: The name of a PNG chart function in the charts module
+        args: The chart function arguments
+        
+    Returns:
+        The PNG image bytes
+    """
+    from app.backtester.visualization import charts
+    return getattr(charts, chart)(*args)
+
+def get_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Get the chart worker pool, starting and pre-warming it if needed.
+    
+    The pool is started from the application's startup hook, so this only
+    starts it after a broken pool was discarded or outside the API.
+    
+    Returns:
+        The process pool, or None if chart workers are disabled
+    """
+    global _pool
+    
+    workers = settings.CHART_RENDER_WORKERS
+    if workers <= 0:
+        return None
+    
+    with _pool_lock:
+        if _pool is None:
+            # Spawned workers do not inherit the API process's threads or sockets
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+            for _ in range(workers):
+                _pool.submit(_ping)
+    
+    return _pool
+
+def start_pool():
+    """
+    Start and pre-warm the chart worker pool.
+    
+    The workers import the plotting stack in the background, so this
+    returns without waiting for them.
+    """
+    get_pool()
+
+def shutdown_pool(pool: Optional[ProcessPoolExecutor] = None):
+    """
+    Stop the chart worker pool.
+    
+    Args:
+        pool: Only stop the pool if it is still this one
+    """
+    global _pool
+    
+    with _pool_lock:
+        if _pool is not None and (pool is None or _pool is pool):
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+atexit.register(shutdown_pool)
+
+def render_charts(charts: Dict[str, Tuple]) -> Dict[str, bytes]:
+    """
+    Render several charts concurrently.
+    
+    If a worker died and broke the pool, the pool is discarded (the next
+    render starts a new one) and the charts are rendered in this process.
+    
+    Args:
+        charts: A dictionary mapping result keys to (chart_function_name, args)
+        
+    Returns:
+        A dictionary mapping result keys to PNG image bytes
+    """
+    pool = get_pool()
+    
+    if pool is None:
+        return {key: _render(chart, args) for key, (chart, args) in charts.items()}
+    
+    try:
+        futures = {key: pool.submit(_render, chart, args) for key, (chart, args) in charts.items()}
+        return {key: future.result() for key, future in futures.items()}
+    except BrokenProcessPool:
+        logger.warning("Chart worker pool is broken, rendering in process")
+        shutdown_pool(pool)
+    
+    return {key: _render(chart, args) for key, (chart, args) in charts.items()}
@@ -1,33 +1,17 @@
 import pandas as pd
-from typing import Dict, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import jinja2
 import os
+import base64
 from datetime import datetime
 
-def create_performance_report(results: Dict) -> str:
-    """
-    Create a performance report.
-    
-    Args:
-        results: The backtest results
-        
-    Returns:
-        An HTML report
-    """
-    # Extract data
-    equity_curve = pd.DataFrame(results["equity_curve"])
-    trades = pd.DataFrame(results["trades"])
-    metrics = results["metrics"]
-    
-    # Create Jinja2 environment
-    template_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), "templates")
-    os.makedirs(template_dir, exist_ok=True)
-    
-    # Create template file if it doesn't exist
-    template_path = os.path.join(template_dir, "performance_report.html")
-    if not os.path.exists(template_path):
-        with open(template_path, "w") as f:
-            f.write("""<!DOCTYPE html>
+# Longer trade lists are summarized by their largest round trips
+MAX_REPORT_TRADES = 1000
+
+# Custom templates in this directory override the built-in one
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), "templates")
+
+PERFORMANCE_REPORT_TEMPLATE = """<!DOCTYPE html>
 <html>
 <head>
     <title>Backtest Performance Report</title>
@@ -143,6 +127,66 @@ def create_performance_report(results: Dict) -> str:
             <img src="data:image/png;base64,{{ trades_chart }}" alt="Trades" style="width: 100%;">
         </div>
         
+        {% if trades_truncated %}
+        <p>The report shows the largest winning and losing round trips of {{ total_trades }} trade records.
+        {% if trades_url %}<a href="{{ trades_url }}">Download the full trade list (CSV)</a>{% endif %}</p>
+        
+        <h2>Largest Winning Trades</h2>
+        <table>
+            <thead>
+                <tr>
+                    <th>Entry Date</th>
+                    <th>Exit Date</th>
+                    <th>Symbol</th>
+                    <th>Quantity</th>
+                    <th>Entry Price</th>
+                    <th>Exit Price</th>
+                    <th>P&amp;L</th>
+                </tr>
+            </thead>
+            <tbody>
+                {% for trade in top_winners %}
+                <tr>
+                    <td>{{ trade.entry_date }}</td>
+                    <td>{{ trade.exit_date }}</td>
+                    <td>{{ trade.symbol }}</td>
+                    <td>{{ trade.quantity }}</td>
+                    <td>{{ '${:.2f}'.format(trade.entry_price) }}</td>
+                    <td>{{ '${:.2f}'.format(trade.exit_price) }}</td>
+                    <td>{{ '${:.2f}'.format(trade.pnl) }}</td>
+                </tr>
+                {% endfor %}
+            </tbody>
+        </table>
+        
+        <h2>Largest Losing Trades</h2>
+        <table>
+            <thead>
+                <tr>
+                    <th>Entry Date</th>
+                    <th>Exit Date</th>
+                    <th>Symbol</th>
+                    <th>Quantity</th>
+                    <th>Entry Price</th>
+                    <th>Exit Price</th>
+                    <th>P&amp;L</th>
+                </tr>
+            </thead>
+            <tbody>
+                {% for trade in top_losers %}
+                <tr>
+                    <td>{{ trade.entry_date }}</td>
+                    <td>{{ trade.exit_date }}</td>
+                    <td>{{ trade.symbol }}</td>
+                    <td>{{ trade.quantity }}</td>
+                    <td>{{ '${:.2f}'.format(trade.entry_price) }}</td>
+                    <td>{{ '${:.2f}'.format(trade.exit_price) }}</td>
+                    <td>{{ '${:.2f}'.format(trade.pnl) }}</td>
+                </tr>
+                {% endfor %}
+            </tbody>
+        </table>
+        {% else %}
         <h2>Trade List</h2>
         <table>
             <thead>
@@ -168,44 +212,151 @@ def create_performance_report(results: Dict) -> str:
                 {% endfor %}
             </tbody>
         </table>
+        {% endif %}
     </div>
 </body>
-</html>""")
+</html>"""
+
+# Compiled once per process and reused by every report
+environment = jinja2.Environment(
+    loader=jinja2.ChoiceLoader([
+        jinja2.FileSystemLoader(TEMPLATE_DIR),
+        jinja2.DictLoader({"performance_report.html": PERFORMANCE_REPORT_TEMPLATE}),
+    ]),
+    autoescape=jinja2.select_autoescape(["html", "xml"]),
+    auto_reload=False,
+)
+
+def top_round_trips(trade_batches: Iterable[List[Dict]], top: int) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Find the largest winning and losing round-trip trades of a trade list.
     
-    # Create Jinja2 environment
-    env = jinja2.Environment(
-        loader=jinja2.FileSystemLoader(template_dir),
-        autoescape=jinja2.select_autoescape(["html", "xml"])
-    )
+    The trades are matched batch by batch, carrying each symbol's open buy
+    into the next batch, so only one batch and the current top trades are
+    held in memory.
+    
+    Args:
+        trade_batches: The trade records in execution order, in batches
+        top: The number of winning and losing round trips to keep
+        
+    Returns:
+        The largest winning and the largest losing round trips
+    """
+    from app.backtester.engine.trade_analytics import match_round_trips
+    
+    winners = losers = None
+    open_buys = None
+    for batch in trade_batches:
+        trades = pd.DataFrame(batch)
+        if open_buys is not None and not open_buys.empty:
+            trades = pd.concat([open_buys, trades], ignore_index=True)
+        if trades.empty:
+            continue
+        
+        round_trips = match_round_trips(trades)
+        if winners is not None:
+            winners = pd.concat([winners, round_trips], ignore_index=True)
+            losers = pd.concat([losers, round_trips], ignore_index=True)
+        else:
+            winners = losers = round_trips
+        winners = winners.nlargest(top, "pnl")
+        losers = losers.nsmallest(top, "pnl")
+        
+        # A symbol's position is open if its latest record is a buy
+        latest = trades.groupby("symbol", sort=False, dropna=False).tail(1)
+        open_buys = latest[latest["action"] == "buy"]
+    
+    if winners is None:
+        return [], []
+    
+    return winners.to_dict(orient="records"), losers.to_dict(orient="records")
+
+def create_performance_report(results: Dict, max_trades: int = MAX_REPORT_TRADES, trades_url: Optional[str] = None) -> str:
+    """
+    Create a performance report.
+    
+    Args:
+        results: The backtest results
+        max_trades: The maximum number of trades listed individually
+        trades_url: The URL of the full trade list, linked when trades are summarized
+        
+    Returns:
+        An HTML report
+    """
+    return "".join(stream_performance_report(results, max_trades, trades_url))
+
+def stream_performance_report(
+    results: Dict,
+    max_trades: int = MAX_REPORT_TRADES,
+    trades_url: Optional[str] = None,
+    trade_batches: Optional[Iterable[List[Dict]]] = None,
+) -> Iterator[str]:
+    """
+    Render a performance report incrementally.
+    
+    Trade lists longer than `max_trades` are summarized by the largest
+    winning and losing round-trip trades instead of listing every record.
+    For such lists the results may leave out the trades and give their
+    `total_trades`, with the records read from `trade_batches` instead.
+    
+    Args:
+        results: The backtest results
+        max_trades: The maximum number of trades listed individually
+        trades_url: The URL of the full trade list, linked when trades are summarized
+        trade_batches: The trade records in batches, used to summarize long trade lists
+        
+    Returns:
+        An iterator over chunks of the HTML report
+    """
+    # Extract data
+    equity_curve = pd.DataFrame(results["equity_curve"])
+    trades = results.get("trades")
+    total_trades = results["total_trades"] if "total_trades" in results else len(trades)
+    
+    # Metrics stored as JSON use None for non-finite values
+    metrics = {key: float("nan") if value is None else value for key, value in results["metrics"].items()}
     
     # Load template
-    template = env.get_template("performance_report.html")
+    template = environment.get_template("performance_report.html")
     
-    # Generate charts
-    from app.backtester.visualization.charts import (
-        create_equity_curve_chart,
-        create_drawdown_chart,
-        create_returns_distribution_chart,
-        create_trades_chart,
-    )
+    # Render charts concurrently in the chart worker pool
+    from app.backtester.visualization.render_pool import render_charts
+    charts = render_charts({
+        "equity_curve": ("equity_curve_png", (equity_curve,)),
+        "drawdown": ("drawdown_png", (equity_curve,)),
+        "returns_distribution": ("returns_distribution_png", (equity_curve,)),
+    })
     
-    equity_curve_chart = create_equity_curve_chart(equity_curve)
-    drawdown_chart = create_drawdown_chart(equity_curve)
-    returns_distribution_chart = create_returns_distribution_chart(equity_curve)
+    equity_curve_chart = base64.b64encode(charts["equity_curve"]).decode("utf-8")
+    drawdown_chart = base64.b64encode(charts["drawdown"]).decode("utf-8")
+    returns_distribution_chart = base64.b64encode(charts["returns_distribution"]).decode("utf-8")
     
     # Only create trades chart if we have market data
     trades_chart = ""
     
+    # Summarize long trade lists by their largest round trips
+    trades_truncated = total_trades > max_trades
+    top_winners = top_losers = []
+    if trades_truncated:
+        if trade_batches is None:
+            trade_batches = [trades]
+        top_winners, top_losers = top_round_trips(trade_batches, max(1, max_trades // 2))
+        trade_records = []
+    else:
+        trade_records = pd.DataFrame(trades).to_dict(orient="records")
+    
     # Render template
-    html = template.render(
+    return template.generate(
         generated_date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         metrics=metrics,
         equity_curve_chart=equity_curve_chart,
         drawdown_chart=drawdown_chart,
         returns_distribution_chart=returns_distribution_chart,
         trades_chart=trades_chart,
-        trades=trades.to_dict(orient="records"),
+        trades=trade_records,
+        trades_truncated=trades_truncated,
+        total_trades=total_trades,
+        top_winners=top_winners,
+        top_losers=top_losers,
+        trades_url=trades_url,
     )
-    
-    return html
-
@@ -0,0 +1,183 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional
+from datetime import datetime
+
+from app.backtester.data.storage import DataStorage
+
+TIMEFRAME_SECONDS = {
+    "M1": 60,
+    "M5": 5 * 60,
+    "M15": 15 * 60,
+    "M30": 30 * 60,
+    "H1": 60 * 60,
+    "H4": 4 * 60 * 60,
+    "D1": 24 * 60 * 60,
+}
+
+DEFAULT_TIMEFRAMES = ["M15", "H1", "H4", "D1"]
+
+BAR_COLUMNS = ["date", "open", "high", "low", "close", "volume"]
+
+def resample_bars(data: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    """
+    Aggregate bars into a higher timeframe.
+
+    Bars are grouped by the start of their timeframe bucket (aligned to
+    the epoch, so D1 bars start at midnight). The last bucket may be
+    incomplete if more base bars are still to come.
+
+    Args:
+        data: The bars, with date (datetime or epoch seconds), open, high,
+            low, close and volume columns
+        timeframe: The target timeframe (e.g., "H1")
+
+    Returns:
+        A pandas DataFrame with the resampled bars
+    """
+    if timeframe not in TIMEFRAME_SECONDS:
+        raise ValueError(f"Unknown timeframe: {timeframe}")
+
+    if data.empty:
+        return pd.DataFrame(columns=BAR_COLUMNS)
+
+    if pd.api.types.is_integer_dtype(data["date"]):
+        times = data["date"].to_numpy(dtype=np.int64)
+    else:
+        times = pd.to_datetime(data["date"]).to_numpy().astype("datetime64[s]").astype(np.int64)
+
+    # Make sure the bars are in time order
+    order = np.argsort(times, kind="stable")
+    times = times[order]
+
+    seconds = TIMEFRAME_SECONDS[timeframe]
+    buckets = times // seconds * seconds
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(buckets)] - 1
+
+    high = data["high"].to_numpy(dtype=np.float64)[order]
+    low = data["low"].to_numpy(dtype=np.float64)[order]
+    volume = data["volume"].to_numpy(dtype=np.int64)[order]
+
+    return pd.DataFrame({
+        "date": buckets[starts].astype("datetime64[s]").astype("datetime64[ns]"),
+        "open": data["open"].to_numpy(dtype=np.float64)[order][starts],
+        "high": np.maximum.reduceat(high, starts),
+        "low": np.minimum.reduceat(low, starts),
+        "close": data["close"].to_numpy(dtype=np.float64)[order][ends],
+        "volume": np.add.reduceat(volume, starts),
+    })
+
+class TimeframeResampler:
+    """
+    Builds and caches higher-timeframe bars from stored base bars.
+    """
+
+    def __init__(self, storage: DataStorage, base_timeframe: str = "M1"):
+        """
+        Initialize the resampler.
+
+        Args:
+            storage: The data storage holding the base bars
+            base_timeframe: The timeframe of the stored bars (e.g., "M1" or "M5")
+        """
+        if base_timeframe not in TIMEFRAME_SECONDS:
+            raise ValueError(f"Unknown timeframe: {base_timeframe}")
+
+        self.storage = storage
+        self.base_timeframe = base_timeframe
+
+    def _check_timeframe(self, timeframe: str):
+        """
+        Ensure a timeframe can be built from the base timeframe.
+
+        Args:
+            timeframe: The target timeframe
+        """
+        if timeframe not in TIMEFRAME_SECONDS:
+            raise ValueError(f"Unknown timeframe: {timeframe}")
+        if TIMEFRAME_SECONDS[timeframe] % TIMEFRAME_SECONDS[self.base_timeframe] != 0:
+            raise ValueError(f"Cannot build {timeframe} bars from {self.base_timeframe} bars")
+
+    def update(self, symbol: str, timeframes: Optional[List[str]] = None) -> Dict[str, int]:
+        """
+        Bring the cached higher-timeframe bars up to date.
+
+        Only base bars from the start of the last cached bar onwards are
+        read, since that bar may have been incomplete when it was built.
+
+        Args:
+            symbol: The symbol
+            timeframes: The timeframes to update (defaults to DEFAULT_TIMEFRAMES)
+
+        Returns:
+            A dictionary mapping timeframes to the number of bars written
+        """
+        timeframes = timeframes or DEFAULT_TIMEFRAMES
+        for timeframe in timeframes:
+            self._check_timeframe(timeframe)
+
+        last_dates = {timeframe: self.storage.get_last_resampled_date(symbol, timeframe) for timeframe in timeframes}
+
+        # Read the base bars needed by the most outdated timeframe once
+        if any(last_date is None for last_date in last_dates.values()):
+            start_date = None
+        else:
+            start_date = min(last_dates.values())
+        base = self.storage.get_data(symbol, start_date=start_date)
+
+        written = {}
+        for timeframe in timeframes:
+            bars = base
+            if not base.empty and last_dates[timeframe] is not None:
+                bars = base[base["date"] >= last_dates[timeframe]]
+
+            resampled = resample_bars(bars, timeframe)
+            self.storage.store_resampled_data(symbol, timeframe, resampled)
+            written[timeframe] = len(resampled)
+
+        return written
+
+    def add_bars(self, symbol: str, data: pd.DataFrame, timeframes: Optional[List[str]] = None) -> Dict[str, int]:
+        """
+        Store new base bars and update the higher timeframes.
+
+        Args:
+            symbol: The symbol
+            data: The new base bars
+            timeframes: The timeframes to update (defaults to DEFAULT_TIMEFRAMES)
+
+        Returns:
+            A dictionary mapping timeframes to the number of bars written
+        """
+        self.storage.store_data(symbol, data)
+        return self.update(symbol, timeframes)
+
+    def get_bars(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        update: bool = True,
+    ) -> pd.DataFrame:
+        """
+        Get bars for a symbol in any timeframe.
+
+        Args:
+            symbol: The symbol
+            timeframe: The timeframe (e.g., "H1")
+            start_date: The start date
+            end_date: The end date
+            update: Whether to bring the cached bars up to date first
+
+        Returns:
+            A pandas DataFrame with the bars
+        """
+        if timeframe == self.base_timeframe:
+            return self.storage.get_data(symbol, start_date, end_date)
+
+        if update:
+            self.update(symbol, [timeframe])
+
+        return self.storage.get_resampled_data(symbol, timeframe, start_date, end_date)
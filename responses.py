@@ -0,0 +1,89 @@
+from datetime import date, datetime
+from decimal import Decimal
+from fastapi.responses import JSONResponse
+from typing import Any
+import json
+import math
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+def _default(value):
+    """
+    Encode values the standard json module does not support.
+
+    Args:
+        value: The value
+
+    Returns:
+        A JSON-compatible value
+    """
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if hasattr(value, "dict"):
+        return value.dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _replace_non_finite(value):
+    """
+    Replace NaN and infinite floats with None, as orjson does.
+
+    Args:
+        value: The value
+
+    Returns:
+        The value with non-finite floats replaced
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _replace_non_finite(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_replace_non_finite(v) for v in value]
+    return value
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize content to JSON.
+
+    Uses orjson when it is installed, which handles datetimes and NumPy
+    arrays natively and is many times faster than the json module on large
+    lists of records. NaN and infinity are encoded as null either way.
+
+    Args:
+        content: The content
+
+    Returns:
+        The JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+
+    return json.dumps(
+        _replace_non_finite(content),
+        default=_default,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with `dumps`.
+
+    Returning it from an endpoint also skips response-model validation,
+    which is only worth doing for data the API built itself.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
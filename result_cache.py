@@ -0,0 +1,285 @@
+import pandas as pd
+import sqlite3
+import functools
+import hashlib
+import importlib
+import inspect
+import json
+import pickle
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional
+import os
+
+# Bump when results change for reasons the source hashes below do not see
+# (e.g. a dependency upgrade)
+RESULT_CACHE_VERSION = 1
+
+# Modules whose source is part of every cache key
+ENGINE_MODULES = (
+    "app.backtester.engine.backtest",
+    "app.backtester.engine.portfolio",
+    "app.backtester.engine.performance",
+    "app.backtester.engine.trade_analytics",
+    "app.backtester.data.indicator_cache",
+)
+
+def fingerprint_data(data: pd.DataFrame) -> str:
+    """
+    Compute a content fingerprint of market data.
+
+    Args:
+        data: The market data
+
+    Returns:
+        A hex digest that changes whenever any value, column or row changes
+    """
+    digest = hashlib.sha256()
+    digest.update(",".join(map(str, data.columns)).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+def _source(obj: Any) -> bytes:
+    """
+    Get the source code of a module or class.
+
+    Args:
+        obj: The module or class
+
+    Returns:
+        The source, or the qualified name if the source is unavailable
+    """
+    try:
+        return inspect.getsource(obj).encode("utf-8")
+    except (OSError, TypeError):
+        return getattr(obj, "__qualname__", obj.__name__).encode("utf-8")
+
+@functools.lru_cache(maxsize=None)
+def engine_version() -> str:
+    """
+    Compute a version fingerprint of the backtesting engine.
+
+    The source does not change while the process runs, so it is hashed once.
+
+    Returns:
+        A hex digest of RESULT_CACHE_VERSION and the engine modules' source
+    """
+    digest = hashlib.sha256()
+    digest.update(str(RESULT_CACHE_VERSION).encode("utf-8"))
+    for name in ENGINE_MODULES:
+        digest.update(name.encode("utf-8"))
+        digest.update(_source(importlib.import_module(name)))
+    return digest.hexdigest()
+
+def strategy_version(strategy: Any, code: Optional[str] = None) -> str:
+    """
+    Compute a version fingerprint of a strategy implementation.
+
+    Args:
+        strategy: The strategy instance
+        code: The user-supplied strategy code, if any
+
+    Returns:
+        A hex digest of the engine version, the source of the strategy
+        class and its base classes, and the code
+    """
+    digest = hashlib.sha256()
+    digest.update(engine_version().encode("utf-8"))
+    for cls in type(strategy).__mro__:
+        if cls is not object:
+            digest.update(_source(cls))
+    digest.update((code or "").encode("utf-8"))
+    return digest.hexdigest()
+
+def make_cache_key(
+    strategy_type: str,
+    version: str,
+    parameters: Dict,
+    data_fingerprint: str,
+    **settings: Any,
+) -> str:
+    """
+    Build a content-addressed cache key for a backtest.
+
+    Args:
+        strategy_type: The type of strategy
+        version: The strategy version fingerprint
+        parameters: The merged strategy parameters
+        data_fingerprint: The fingerprint of the input data
+        **settings: Other inputs that affect the results (capital, costs, ...)
+
+    Returns:
+        A hex digest identifying the backtest inputs
+    """
+    payload = json.dumps(
+        {
+            "strategy_type": strategy_type,
+            "version": version,
+            "parameters": parameters,
+            "data": data_fingerprint,
+            "settings": settings,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class ResultCache:
+    """
+    Persistent, size-bounded LRU cache of backtest results.
+    """
+
+    def __init__(
+        self,
+        db_path: str = None,
+        max_size_bytes: int = 512 * 1024 * 1024,
+        max_entries: int = 1000,
+    ):
+        """
+        Initialize the result cache.
+
+        Args:
+            db_path: The path to the SQLite database
+            max_size_bytes: The maximum total size of stored results
+            max_entries: The maximum number of stored results
+        """
+        if db_path is None:
+            # Create a data directory if it doesn't exist
+            data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), "data")
+            os.makedirs(data_dir, exist_ok=True)
+            db_path = os.path.join(data_dir, "result_cache.db")
+
+        self.max_size_bytes = max_size_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.create_tables()
+
+    def create_tables(self):
+        """
+        Create the necessary tables.
+        """
+        cursor = self.conn.cursor()
+
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS results (
+            key TEXT PRIMARY KEY,
+            value BLOB,
+            size INTEGER,
+            created_at REAL,
+            accessed_at REAL
+        )
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS ix_results_accessed_at ON results (accessed_at)")
+
+        self.conn.commit()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Get cached results.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cached results, or None if the key is not cached
+        """
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT value FROM results WHERE key = ?", (key,))
+            row = cursor.fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            # Mark as recently used
+            cursor.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self.conn.commit()
+            self.hits += 1
+
+        return pickle.loads(zlib.decompress(row[0]))
+
+    def set(self, key: str, results: Dict):
+        """
+        Store results and evict the least recently used entries if needed.
+
+        Args:
+            key: The cache key
+            results: The backtest results
+        """
+        value = zlib.compress(pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL))
+        if len(value) > self.max_size_bytes:
+            return
+
+        now = time.time()
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO results (key, value, size, created_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (key, sqlite3.Binary(value), len(value), now, now),
+            )
+            self._evict(cursor)
+            self.conn.commit()
+
+    def _evict(self, cursor: sqlite3.Cursor):
+        """
+        Delete least recently used entries until the cache is within its limits.
+
+        Args:
+            cursor: The database cursor
+        """
+        cursor.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results")
+        count, total_size = cursor.fetchone()
+        if count <= self.max_entries and total_size <= self.max_size_bytes:
+            return
+
+        cursor.execute("SELECT key, size FROM results ORDER BY accessed_at")
+        evicted = []
+        for key, size in cursor.fetchall():
+            if count <= self.max_entries and total_size <= self.max_size_bytes:
+                break
+            evicted.append((key,))
+            count -= 1
+            total_size -= size
+
+        cursor.executemany("DELETE FROM results WHERE key = ?", evicted)
+
+    def stats(self) -> Dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            A dictionary with entry count, total size, hits and misses
+        """
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results")
+            count, total_size = cursor.fetchone()
+
+        return {
+            "entries": count,
+            "size_bytes": total_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def clear(self):
+        """
+        Remove all cached results.
+        """
+        with self._lock:
+            self.conn.execute("DELETE FROM results")
+            self.conn.commit()
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        self.conn.close()
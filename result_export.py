@@ -0,0 +1,213 @@
+import importlib.util
+import io
+from sqlalchemy import String, select, type_coerce
+from sqlalchemy.orm import Session
+from typing import Iterator, List
+
+from app.db.models.backtest import Backtest
+from app.db.models.backtest_result import BacktestEquityPoint, BacktestTrade
+from app.services.backtest_results import EQUITY_FIELDS, TRADE_FIELDS
+
+EXPORT_FORMATS = {
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+EXPORT_TABLES = {
+    "equity": (BacktestEquityPoint, EQUITY_FIELDS),
+    "trades": (BacktestTrade, TRADE_FIELDS),
+}
+
+def _import_pyarrow():
+    """
+    Import pyarrow, which is optional and slow to import.
+
+    Returns:
+        The pyarrow module, with the IPC and Parquet modules loaded
+    """
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+    return pyarrow
+
+def _schema(table: str):
+    """
+    Get the Arrow schema of an exported table.
+
+    Args:
+        table: The table ("equity" or "trades")
+
+    Returns:
+        The pyarrow schema
+    """
+    pa = _import_pyarrow()
+    if table == "equity":
+        return pa.schema([
+            ("date", pa.timestamp("us")),
+            ("equity", pa.float64()),
+        ])
+
+    return pa.schema([
+        ("date", pa.timestamp("us")),
+        ("symbol", pa.string()),
+        ("action", pa.string()),
+        ("quantity", pa.float64()),
+        ("price", pa.float64()),
+        ("commission", pa.float64()),
+    ])
+
+class _ChunkSink(io.RawIOBase):
+    """
+    Write-only file collecting bytes until they are taken.
+
+    The Arrow and Parquet writers write into it, and the bytes written so
+    far are handed to the response after each batch.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def take(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+class ResultExportService:
+    def is_available(self) -> bool:
+        """
+        Check whether binary exports are supported.
+
+        Returns:
+            True if pyarrow is installed
+        """
+        return importlib.util.find_spec("pyarrow") is not None
+
+    def iter_batches(self, db: Session, backtest: Backtest, table: str, batch_size: int = 50000) -> Iterator["pyarrow.RecordBatch"]:
+        """
+        Iterate over a result table as Arrow record batches.
+
+        Rows are read with keyset pagination on the sequence number and
+        converted column by column, without building ORM objects or a dict
+        per row.
+
+        Args:
+            db: The database session
+            backtest: The backtest
+            table: The table ("equity" or "trades")
+            batch_size: The number of rows per batch
+
+        Returns:
+            An iterator over record batches
+        """
+        import pandas as pd
+
+        pa = _import_pyarrow()
+        model, fields = EXPORT_TABLES[table]
+        schema = _schema(table)
+
+        if backtest.results:
+            # Legacy JSON results only exist as records
+            key = "equity_curve" if table == "equity" else "trades"
+            records = backtest.results.get(key) or []
+            for start in range(0, len(records), batch_size):
+                batch = records[start:start + batch_size]
+                # Dates were stored as strings
+                dates = pd.to_datetime(pd.Series([record.get("date") for record in batch]))
+                arrays = [pa.Array.from_pandas(dates).cast(pa.timestamp("us"))]
+                arrays += [
+                    pa.array([record.get(field) for record in batch], type=schema.field(field).type)
+                    for field in fields[1:]
+                ]
+                yield pa.record_batch(arrays, schema=schema)
+            return
+
+        # Select raw column values with Core: dates are converted for the
+        # whole batch below instead of one value at a time by the dialect
+        table_columns = model.__table__.c
+        columns = [table_columns.seq, type_coerce(table_columns.date, String)]
+        columns += [table_columns[field] for field in fields[1:]]
+
+        connection = db.connection()
+        last_seq = -1
+        while True:
+            rows = connection.execute(
+                select(*columns)
+                .where(table_columns.backtest_id == backtest.id, table_columns.seq > last_seq)
+                .order_by(table_columns.seq)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                return
+
+            values = list(zip(*rows))
+            last_seq = values[0][-1]
+            dates = pd.to_datetime(pd.Series(values[1]))
+            arrays = [pa.Array.from_pandas(dates).cast(pa.timestamp("us"))]
+            arrays += [
+                pa.array(column, type=schema.field(field).type)
+                for field, column in zip(fields[1:], values[2:])
+            ]
+            yield pa.record_batch(arrays, schema=schema)
+
+            if len(rows) < batch_size:
+                return
+
+    def iter_export(self, db: Session, backtest: Backtest, table: str, format: str, batch_size: int = 50000) -> Iterator[bytes]:
+        """
+        Stream a result table as an Arrow IPC stream or a Parquet file.
+
+        Only one batch is held in memory at a time, and its encoded bytes
+        are yielded as soon as the writer has produced them.
+
+        Args:
+            db: The database session
+            backtest: The backtest
+            table: The table ("equity" or "trades")
+            format: The format ("arrow" or "parquet")
+            batch_size: The number of rows per batch (and Parquet row group)
+
+        Returns:
+            An iterator over chunks of the encoded file
+        """
+        if table not in EXPORT_TABLES:
+            raise ValueError(f"Unknown table: {table}")
+        if format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported format: {format}")
+
+        pa = _import_pyarrow()
+        schema = _schema(table)
+        sink = _ChunkSink()
+        if format == "arrow":
+            writer = pa.ipc.new_stream(sink, schema)
+        else:
+            writer = pa.parquet.ParquetWriter(sink, schema, compression="zstd")
+
+        try:
+            for batch in self.iter_batches(db, backtest, table, batch_size):
+                if format == "arrow":
+                    writer.write_batch(batch)
+                else:
+                    writer.write_table(pa.Table.from_batches([batch]), row_group_size=batch_size)
+
+                chunk = sink.take()
+                if chunk:
+                    yield chunk
+        finally:
+            writer.close()
+
+        yield sink.take()
+
+result_export_service = ResultExportService()
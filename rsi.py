@@ -2,6 +2,7 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Optional
 
+from app.backtester.data.indicator_cache import calculate_rsi
 from app.backtester.strategies.base import Strategy
 
 class RSIStrategy(Strategy):
@@ -43,20 +44,19 @@ class RSIStrategy(Strategy):
         oversold = self.parameters.get("oversold", 30)
         overbought = self.parameters.get("overbought", 70)
         
-        # Check if we have enough data
-        if len(data) < window + 1:
-            return signals
-        
-        # Calculate RSI
-        delta = data["close"].diff()
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
-        
-        avg_gain = gain.rolling(window=window).mean()
-        avg_loss = loss.rolling(window=window).mean()
-        
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
+        # Use precomputed RSI when available
+        rsi_column = f"rsi_{window}"
+        if rsi_column in data.columns:
+            if len(data) < 2:
+                return signals
+            rsi = data[rsi_column]
+        else:
+            # Check if we have enough data
+            if len(data) < window + 1:
+                return signals
+            
+            # Calculate RSI over the last bars only
+            rsi = calculate_rsi(data["close"].iloc[-(window + 2):], window)
         
         # Generate signals
         if rsi.iloc[-1] < oversold and rsi.iloc[-2] >= oversold:
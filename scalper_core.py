@@ -0,0 +1,342 @@
+"""
+Core logic of the ICT Forex Trading Bot
+Strategies, position sizing, timeframe resampling and performance tracking,
+without any dependency on MetaTrader5 so it can be imported for tests,
+backtests and tooling on any platform.
+"""
+
+import json
+import os
+import logging
+
+logger = logging.getLogger("TradingBot")
+
+# === TIMEFRAMES ===
+# Same values as the MetaTrader5 TIMEFRAME_* constants
+TIMEFRAME_M1 = 1
+TIMEFRAME_M5 = 5
+TIMEFRAME_M15 = 15
+TIMEFRAME_M30 = 30
+TIMEFRAME_H1 = 16385
+TIMEFRAME_H4 = 16388
+TIMEFRAME_D1 = 16408
+
+# === TIMEFRAME RESAMPLING ===
+TIMEFRAME_MINUTES = {
+    TIMEFRAME_M1: 1,
+    TIMEFRAME_M5: 5,
+    TIMEFRAME_M15: 15,
+    TIMEFRAME_M30: 30,
+    TIMEFRAME_H1: 60,
+    TIMEFRAME_H4: 240,
+    TIMEFRAME_D1: 1440,
+}
+
+def resample_rates(df, timeframe, htf):
+    """Build higher timeframe bars from lower timeframe rates, or None if not possible"""
+    minutes = TIMEFRAME_MINUTES.get(timeframe)
+    htf_minutes = TIMEFRAME_MINUTES.get(htf)
+    if not minutes or not htf_minutes or htf_minutes % minutes != 0:
+        return None
+        
+    import pandas as pd
+    
+    if pd.api.types.is_integer_dtype(df['time']):
+        seconds = df['time']
+    else:
+        seconds = df['time'].astype('datetime64[s]').astype('int64')
+    bucket = seconds // (htf_minutes * 60) * (htf_minutes * 60)
+    
+    htf_df = df.groupby(bucket.to_numpy(), sort=True).agg(
+        open=('open', 'first'),
+        high=('high', 'max'),
+        low=('low', 'min'),
+        close=('close', 'last'),
+        tick_volume=('tick_volume', 'sum'),
+    )
+    htf_df.insert(0, 'time', pd.to_datetime(htf_df.index, unit='s'))
+    return htf_df.reset_index(drop=True)
+# === TRADING STRATEGIES ===
+class TradingStrategies:
+    @staticmethod
+    def get_htf_bias(mt5_handler, symbol, htf=TIMEFRAME_M15, df=None, timeframe=None):
+        """Get higher timeframe bias
+        
+        If lower timeframe bars (df, timeframe) cover 150 higher timeframe
+        bars, they are resampled instead of requesting more data from MT5.
+        """
+        htf_df = None
+        if df is not None and timeframe is not None:
+            htf_df = resample_rates(df, timeframe, htf)
+        if htf_df is not None and len(htf_df) >= 150:
+            df = htf_df.tail(150).reset_index(drop=True)
+        else:
+            df = mt5_handler.get_data(symbol, htf, 150)
+        if df is None or len(df) < 30:
+            return None
+            
+        highs = []
+        lows = []
+        
+        # Find swing highs and lows
+        for i in range(2, len(df) - 2):
+            if df['high'].iloc[i] > df['high'].iloc[i - 1] and df['high'].iloc[i] > df['high'].iloc[i + 1]:
+                highs.append(df['high'].iloc[i])
+            if df['low'].iloc[i] < df['low'].iloc[i - 1] and df['low'].iloc[i] < df['low'].iloc[i + 1]:
+                lows.append(df['low'].iloc[i])
+                
+        if len(highs) < 2 or len(lows) < 2:
+            return None
+            
+        # Get the last two highs and lows
+        hh1, hh2 = highs[-1], highs[-2]
+        ll1, ll2 = lows[-1], lows[-2]
+        
+        # Determine market structure
+        if hh1 > hh2 and ll1 > ll2:
+            return "bullish"
+        elif hh1 < hh2 and ll1 < ll2:
+            return "bearish"
+        elif hh1 > hh2 and ll1 < ll2:
+            return "choch_bullish"  # Change of character bullish
+        elif hh1 < hh2 and ll1 > ll2:
+            return "choch_bearish"  # Change of character bearish
+            
+        return None
+    
+    @staticmethod
+    def has_fvg(df, i):
+        """Check for fair value gap"""
+        if i < 2 or i + 1 >= len(df):
+            return False
+            
+        prev = df.iloc[i - 1]
+        next_candle = df.iloc[i + 1]
+        
+        # Check for bullish or bearish FVG
+        return next_candle['low'] > prev['high'] or next_candle['high'] < prev['low']
+    
+    @staticmethod
+    def detect_order_block(df):
+        """Detect order blocks"""
+        for i in range(len(df) - 3, 2, -1):
+            c = df.iloc[i]
+            next_c = df.iloc[i + 1]
+            
+            # Bullish order block
+            if c['close'] < c['open'] and next_c['close'] > next_c['open'] and TradingStrategies.has_fvg(df, i):
+                return ('bullish', c['low'], c['high'], c['time'])
+                
+            # Bearish order block
+            if c['close'] > c['open'] and next_c['close'] < next_c['open'] and TradingStrategies.has_fvg(df, i):
+                return ('bearish', c['low'], c['high'], c['time'])
+                
+        return None
+    
+    @staticmethod
+    def detect_turtle_soup(df):
+        """Detect turtle soup pattern"""
+        if len(df) < 21:
+            return None
+            
+        prev = df.iloc[-2]
+        last = df.iloc[-1]
+        swing_low = df['low'][-21:-1].min()
+        swing_high = df['high'][-21:-1].max()
+        
+        if prev['low'] < swing_low and last['low'] > prev['low']:
+            return "buy"
+        elif prev['high'] > swing_high and last['high'] < prev['high']:
+            return "sell"
+            
+        return None
+    
+    @staticmethod
+    def detect_sh_bms_rto(df):
+        """Detect swing high break market structure return to origin"""
+        if len(df) < 10:
+            return None
+            
+        prev = df.iloc[-2]
+        last = df.iloc[-1]
+        
+        if prev['low'] < df['low'][-10:-2].min() and last['close'] > prev['high']:
+            return "buy"
+        elif prev['high'] > df['high'][-10:-2].max() and last['close'] < prev['low']:
+            return "sell"
+            
+        return None
+    
+    @staticmethod
+    def detect_sms_bms_rto(df):
+        """Detect swing market structure break market structure return to origin"""
+        if len(df) < 10:
+            return None
+            
+        highs = df['high']
+        lows = df['low']
+        prev = df.iloc[-2]
+        last = df.iloc[-1]
+        
+        if prev['high'] > highs[-10:-2].max() and last['close'] < prev['low']:
+            return "sell"
+        elif prev['low'] < lows[-10:-2].min() and last['close'] > prev['high']:
+            return "buy"
+            
+        return None
+    
+    @staticmethod
+    def detect_stop_hunt(df):
+        """Detect stop hunt pattern"""
+        if len(df) < 20:
+            return None
+            
+        recent_high = df['high'][-20:-2].max()
+        recent_low = df['low'][-20:-2].min()
+        prev = df.iloc[-2]
+        last = df.iloc[-1]
+        
+        if prev['high'] > recent_high and last['close'] < prev['low']:
+            return "sell"
+        if prev['low'] < recent_low and last['close'] > prev['high']:
+            return "buy"
+            
+        return None
+    
+    @staticmethod
+    def detect_retail_trap(df):
+        """Detect retail trap pattern"""
+        if len(df) < 10:
+            return None
+            
+        high = df['high'][-10:-2].max()
+        low = df['low'][-10:-2].min()
+        last = df.iloc[-1]
+        prev = df.iloc[-2]
+        
+        if last['high'] > high and last['close'] < prev['low']:
+            return "sell"
+        if last['low'] < low and last['close'] > prev['high']:
+            return "buy"
+            
+        return None
+# === POSITION SIZING ===
+def calculate_lot_size(balance, risk_percent, stop_loss_pips, pip, contract_size, price, digits,
+                       volume_min=0.01, volume_max=100.0, volume_step=0.01):
+    """Calculate the lot size risking risk_percent of the balance at the stop loss"""
+    risk_amount = balance * (risk_percent / 100)
+    
+    # Calculate pip value in the account currency
+    if digits >= 4:  # Forex pairs typically have 4 or 5 digits
+        pip_value_in_account_currency = (pip * contract_size) / price
+    else:  # For other instruments
+        pip_value_in_account_currency = pip * contract_size
+        
+    if stop_loss_pips <= 0 or pip_value_in_account_currency <= 0:
+        return 0.01
+        
+    position_size = risk_amount / (stop_loss_pips * pip_value_in_account_currency)
+    
+    # Round down to nearest 0.01
+    position_size = max(0.01, round(position_size * 100) / 100)
+    
+    # Adjust to step size
+    position_size = round(position_size / volume_step) * volume_step
+    
+    # Ensure within limits
+    return max(volume_min, min(position_size, volume_max))
+
+# === PERFORMANCE TRACKING ===
+class PerformanceTracker:
+    def __init__(self, file_path="performance.json"):
+        self.file_path = file_path
+        self.data = self._load_data()
+    
+    def _load_data(self):
+        """Load performance data from file"""
+        if os.path.exists(self.file_path):
+            try:
+                with open(self.file_path, 'r') as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.error(f"Error loading performance data: {str(e)}")
+        
+        # Default structure
+        return {
+            "trades": [],
+            "stats": {
+                "total_trades": 0,
+                "winning_trades": 0,
+                "losing_trades": 0,
+                "win_rate": 0,
+                "profit_factor": 0,
+                "total_profit": 0,
+                "max_drawdown": 0
+            }
+        }
+    
+    def _save_data(self):
+        """Save performance data to file"""
+        try:
+            with open(self.file_path, 'w') as f:
+                json.dump(self.data, f, indent=4)
+        except Exception as e:
+            logger.error(f"Error saving performance data: {str(e)}")
+    
+    def add_trade(self, trade_info):
+        """Add a new trade to the performance tracker"""
+        self.data["trades"].append(trade_info)
+        self._update_stats()
+        self._save_data()
+    
+    def _update_stats(self):
+        """Update performance statistics"""
+        trades = self.data["trades"]
+        stats = self.data["stats"]
+        
+        stats["total_trades"] = len(trades)
+        
+        if not trades:
+            return
+            
+        # Calculate basic stats
+        winning_trades = [t for t in trades if t.get("profit", 0) > 0]
+        losing_trades = [t for t in trades if t.get("profit", 0) <= 0]
+        
+        stats["winning_trades"] = len(winning_trades)
+        stats["losing_trades"] = len(losing_trades)
+        
+        if stats["total_trades"] > 0:
+            stats["win_rate"] = stats["winning_trades"] / stats["total_trades"] * 100
+        
+        # Calculate profit factor
+        total_profit = sum(t.get("profit", 0) for t in winning_trades)
+        total_loss = abs(sum(t.get("profit", 0) for t in losing_trades))
+        
+        stats["total_profit"] = total_profit - total_loss
+        
+        if total_loss > 0:
+            stats["profit_factor"] = total_profit / total_loss
+        else:
+            stats["profit_factor"] = total_profit if total_profit > 0 else 0
+        
+        # Calculate drawdown (simplified)
+        balance_curve = []
+        current_balance = 0
+        
+        for trade in trades:
+            current_balance += trade.get("profit", 0)
+            balance_curve.append(current_balance)
+        
+        if balance_curve:
+            peak = 0
+            max_dd = 0
+            
+            for balance in balance_curve:
+                if balance > peak:
+                    peak = balance
+                dd = peak - balance
+                if dd > max_dd:
+                    max_dd = dd
+            
+            stats["max_drawdown"] = max_dd
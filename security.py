@@ -1,12 +1,87 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Optional, Union
+from typing import Any, Callable, Optional, Union
+import asyncio
+import threading
 
 from jose import jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+)
+
+class PasswordHasherBusy(Exception):
+    """
+    Raised when too many password hashes are already queued.
+    """
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a dedicated, bounded thread pool.
+    
+    bcrypt releases the GIL, so a few threads hash in parallel while the
+    event loop keeps serving requests. Work beyond the pool size plus the
+    queue limit is rejected immediately instead of piling up.
+    """
+    
+    def __init__(self, max_workers: int = 4, max_queue: int = 32):
+        """
+        Initialize the password hasher.
+        
+        Args:
+            max_workers: The number of hashing threads
+            max_queue: The maximum number of hashes waiting for a thread
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_workers + max_queue
+        self.pending = 0
+        self._lock = threading.Lock()
+        self._executor = None
+    
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Get the thread pool, creating it on first use.
+        """
+        if self._executor is None:
+            with self._lock:
+                # Concurrent first requests must not each create a pool
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="password-hasher",
+                    )
+        return self._executor
+    
+    async def run(self, function: Callable, *args) -> Any:
+        """
+        Run a hashing function on the pool.
+        
+        Args:
+            function: The function to run
+            *args: The function arguments
+            
+        Returns:
+            The function result
+        """
+        with self._lock:
+            if self.pending >= self.max_pending:
+                raise PasswordHasherBusy()
+            self.pending += 1
+        
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, function, *args)
+        finally:
+            with self._lock:
+                self.pending -= 1
+
+password_hasher = PasswordHasher(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_QUEUE)
 
 def create_access_token(
     subject: Union[str, Any], expires_delta: Optional[timedelta] = None
@@ -60,3 +135,33 @@ def get_password_hash(password: str) -> str:
     """
     return pwd_context.hash(password)
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password against a hash without blocking the event loop.
+    
+    Args:
+        plain_password: The plain password
+        hashed_password: The hashed password
+        
+    Returns:
+        True if the password matches the hash, False otherwise
+        
+    Raises:
+        PasswordHasherBusy: If the hashing queue is full
+    """
+    return await password_hasher.run(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Hash a password without blocking the event loop.
+    
+    Args:
+        password: The plain password
+        
+    Returns:
+        The hashed password
+        
+    Raises:
+        PasswordHasherBusy: If the hashing queue is full
+    """
+    return await password_hasher.run(get_password_hash, password)
@@ -1,11 +1,64 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
 
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URI)
+def engine_options(uri: str) -> dict:
+    """
+    Get the connection pool options for a database URI.
+    
+    Args:
+        uri: The database URI
+        
+    Returns:
+        Keyword arguments for create_engine / create_async_engine
+    """
+    # SQLite uses a single-connection pool that takes no sizing options
+    if str(uri).startswith("sqlite"):
+        return {}
+    
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+engine = create_engine(settings.SQLALCHEMY_DATABASE_URI, **engine_options(settings.SQLALCHEMY_DATABASE_URI))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-Base = declarative_base()
+# The async engine is created on first use so the asyncio driver is only
+# required by deployments that serve the async endpoints
+_async_engine = None
+_async_sessionmaker = None
+
+def get_async_engine():
+    """
+    Get the async engine, creating it on first use.
+    """
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            settings.SQLALCHEMY_ASYNC_DATABASE_URI,
+            **engine_options(settings.SQLALCHEMY_ASYNC_DATABASE_URI),
+        )
+    return _async_engine
 
+def AsyncSessionLocal() -> AsyncSession:
+    """
+    Create an async database session.
+    """
+    global _async_sessionmaker
+    if _async_sessionmaker is None:
+        _async_sessionmaker = sessionmaker(
+            get_async_engine(),
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_sessionmaker()
+
+Base = declarative_base()
@@ -1,9 +1,11 @@
 import pandas as pd
 import sqlite3
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime
 import os
 
+from app.backtester.data.compact import compact_bars
+
 class DataStorage:
     """
     Stores and retrieves market data.
@@ -58,6 +60,22 @@ class DataStorage:
         )
         """)
         
+        # Create resampled data table (higher timeframes built from stored bars)
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS resampled_data (
+            symbol_id INTEGER,
+            timeframe TEXT,
+            date TEXT,
+            open REAL,
+            high REAL,
+            low REAL,
+            close REAL,
+            volume INTEGER,
+            FOREIGN KEY (symbol_id) REFERENCES symbols (id),
+            PRIMARY KEY (symbol_id, timeframe, date)
+        )
+        """)
+        
         self.conn.commit()
     
     def store_data(self, symbol: str, data: pd.DataFrame):
@@ -102,14 +120,14 @@ class DataStorage:
         
         self.conn.commit()
     
-    def get_data(
+    def _build_query(
         self,
         symbol: str,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-    ) -> pd.DataFrame:
+    ):
         """
-        Get market data for a symbol.
+        Build the market data query for a symbol.
         
         Args:
             symbol: The symbol
@@ -117,7 +135,7 @@ class DataStorage:
             end_date: The end date
             
         Returns:
-            A pandas DataFrame with the market data
+            A tuple of (query, params), or None if the symbol is unknown
         """
         cursor = self.conn.cursor()
         
@@ -126,7 +144,7 @@ class DataStorage:
         result = cursor.fetchone()
         
         if result is None:
-            return pd.DataFrame()
+            return None
         
         symbol_id = result[0]
         
@@ -148,24 +166,221 @@ class DataStorage:
         
         query += " ORDER BY date"
         
+        return query, params
+    
+    def get_data(
+        self,
+        symbol: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        compact: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Get market data for a symbol.
+        
+        Args:
+            symbol: The symbol
+            start_date: The start date
+            end_date: The end date
+            compact: Whether to return the compact representation
+            
+        Returns:
+            A pandas DataFrame with the market data
+        """
+        query = self._build_query(symbol, start_date, end_date)
+        
+        if query is None:
+            return pd.DataFrame()
+        
         # Execute query
-        cursor.execute(query, params)
+        cursor = self.conn.cursor()
+        cursor.execute(*query)
         rows = cursor.fetchall()
         
-        # Create DataFrame
-        data = pd.DataFrame(
+        return _to_frame(rows, compact)
+    
+    def iter_data(
+        self,
+        symbol: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        chunk_size: int = 100000,
+        compact: bool = False,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Iterate over market data for a symbol in time-ordered chunks.
+        
+        Args:
+            symbol: The symbol
+            start_date: The start date
+            end_date: The end date
+            chunk_size: The number of bars per chunk
+            compact: Whether to return the compact representation
+            
+        Returns:
+            An iterator over pandas DataFrames with the market data
+        """
+        query = self._build_query(symbol, start_date, end_date)
+        
+        if query is None:
+            return
+        
+        # A dedicated cursor streams rows without loading the full result
+        cursor = self.conn.cursor()
+        cursor.execute(*query)
+        
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield _to_frame(rows, compact)
+    
+    def store_resampled_data(self, symbol: str, timeframe: str, data: pd.DataFrame):
+        """
+        Store resampled bars for a symbol, replacing existing bars.
+        
+        Args:
+            symbol: The symbol
+            timeframe: The timeframe (e.g., "H1")
+            data: The resampled bars
+        """
+        if data.empty:
+            return
+        
+        cursor = self.conn.cursor()
+        
+        # Insert or update symbol
+        cursor.execute(
+            "INSERT OR IGNORE INTO symbols (symbol) VALUES (?)",
+            (symbol,)
+        )
+        
+        # Get symbol ID
+        cursor.execute("SELECT id FROM symbols WHERE symbol = ?", (symbol,))
+        symbol_id = cursor.fetchone()[0]
+        
+        dates = pd.to_datetime(data["date"]).dt.strftime("%Y-%m-%d %H:%M:%S")
+        rows = zip(
+            [symbol_id] * len(data),
+            [timeframe] * len(data),
+            dates,
+            data["open"].astype(float),
+            data["high"].astype(float),
+            data["low"].astype(float),
+            data["close"].astype(float),
+            data["volume"].astype("int64").tolist(),
+        )
+        cursor.executemany(
+            """
+            INSERT OR REPLACE INTO resampled_data
+            (symbol_id, timeframe, date, open, high, low, close, volume)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
             rows,
-            columns=["date", "open", "high", "low", "close", "adj_close", "volume"]
         )
         
-        # Convert Date column to datetime
+        self.conn.commit()
+    
+    def get_resampled_data(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """
+        Get resampled bars for a symbol.
+        
+        Args:
+            symbol: The symbol
+            timeframe: The timeframe (e.g., "H1")
+            start_date: The start date
+            end_date: The end date
+            
+        Returns:
+            A pandas DataFrame with the resampled bars
+        """
+        query = """
+        SELECT r.date, r.open, r.high, r.low, r.close, r.volume
+        FROM resampled_data r
+        JOIN symbols s ON s.id = r.symbol_id
+        WHERE s.symbol = ? AND r.timeframe = ?
+        """
+        params = [symbol, timeframe]
+        
+        if start_date is not None:
+            query += " AND r.date >= ?"
+            params.append(start_date.strftime("%Y-%m-%d %H:%M:%S"))
+        
+        if end_date is not None:
+            query += " AND r.date <= ?"
+            params.append(end_date.strftime("%Y-%m-%d %H:%M:%S"))
+        
+        query += " ORDER BY r.date"
+        
+        cursor = self.conn.cursor()
+        cursor.execute(query, params)
+        
+        data = pd.DataFrame(
+            cursor.fetchall(),
+            columns=["date", "open", "high", "low", "close", "volume"]
+        )
         data["date"] = pd.to_datetime(data["date"])
         
         return data
     
+    def get_last_resampled_date(self, symbol: str, timeframe: str) -> Optional[datetime]:
+        """
+        Get the start of the most recent resampled bar.
+        
+        Args:
+            symbol: The symbol
+            timeframe: The timeframe (e.g., "H1")
+            
+        Returns:
+            The date of the last bar, or None if nothing is stored
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """
+            SELECT MAX(r.date)
+            FROM resampled_data r
+            JOIN symbols s ON s.id = r.symbol_id
+            WHERE s.symbol = ? AND r.timeframe = ?
+            """,
+            (symbol, timeframe),
+        )
+        result = cursor.fetchone()[0]
+        
+        return None if result is None else datetime.strptime(result, "%Y-%m-%d %H:%M:%S")
+    
     def close(self):
         """
         Close the database connection.
         """
         self.conn.close()
 
+def _to_frame(rows: List, compact: bool = False) -> pd.DataFrame:
+    """
+    Convert market data rows to a DataFrame.
+    
+    Args:
+        rows: The market data rows
+        compact: Whether to return the compact representation
+        
+    Returns:
+        A pandas DataFrame with the market data
+    """
+    # Create DataFrame
+    data = pd.DataFrame(
+        rows,
+        columns=["date", "open", "high", "low", "close", "adj_close", "volume"]
+    )
+    
+    # Convert Date column to datetime
+    data["date"] = pd.to_datetime(data["date"])
+    
+    if compact:
+        data = compact_bars(data)
+    
+    return data
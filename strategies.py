@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.api.dependencies import get_db, get_current_active_user
 from app.db.models.user import User
 from app.schemas.strategy import Strategy, StrategyCreate, StrategyUpdate
+from app.schemas.summary import StrategySummaryPage
 from app.services.strategy import strategy_service
+from app.services.summaries import MAX_SUMMARY_LIMIT, summary_service
 
 router = APIRouter()
 
@@ -24,6 +26,22 @@ def read_strategies(
     )
     return strategies
 
+@router.get("/summary", response_model=StrategySummaryPage)
+def read_strategy_summaries(
+    db: Session = Depends(get_db),
+    after_id: Optional[int] = None,
+    limit: int = Query(100, ge=1, le=MAX_SUMMARY_LIMIT),
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Retrieve strategy summaries for list views.
+    
+    Pass the returned `next_after_id` as `after_id` to get the next page.
+    """
+    return summary_service.get_strategies(
+        db=db, user_id=current_user.id, after_id=after_id, limit=limit
+    )
+
 @router.post("/", response_model=Strategy)
 def create_strategy(
     *,
@@ -0,0 +1,94 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from app.api.dependencies import get_async_db, get_current_active_user_async
+from app.db.models.user import User
+from app.schemas.strategy import Strategy, StrategyCreate, StrategyUpdate
+from app.services.async_crud import strategy_async_service
+
+router = APIRouter()
+
+@router.get("/", response_model=List[Strategy])
+async def read_strategies(
+    db: AsyncSession = Depends(get_async_db),
+    skip: int = 0,
+    limit: int = 100,
+    current_user: User = Depends(get_current_active_user_async),
+):
+    """
+    Retrieve strategies.
+    """
+    strategies = await strategy_async_service.get_multi(
+        db=db, user_id=current_user.id, skip=skip, limit=limit
+    )
+    return strategies
+
+@router.post("/", response_model=Strategy)
+async def create_strategy(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    strategy_in: StrategyCreate,
+    current_user: User = Depends(get_current_active_user_async),
+):
+    """
+    Create new strategy.
+    """
+    strategy = await strategy_async_service.create(
+        db=db, obj_in=strategy_in, user_id=current_user.id
+    )
+    return strategy
+
+@router.get("/{strategy_id}", response_model=Strategy)
+async def read_strategy(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    strategy_id: int,
+    current_user: User = Depends(get_current_active_user_async),
+):
+    """
+    Get strategy by ID.
+    """
+    strategy = await strategy_async_service.get(db=db, id=strategy_id)
+    if not strategy:
+        raise HTTPException(status_code=404, detail="Strategy not found")
+    if strategy.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return strategy
+
+@router.put("/{strategy_id}", response_model=Strategy)
+async def update_strategy(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    strategy_id: int,
+    strategy_in: StrategyUpdate,
+    current_user: User = Depends(get_current_active_user_async),
+):
+    """
+    Update a strategy.
+    """
+    strategy = await strategy_async_service.get(db=db, id=strategy_id)
+    if not strategy:
+        raise HTTPException(status_code=404, detail="Strategy not found")
+    if strategy.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    strategy = await strategy_async_service.update(db=db, db_obj=strategy, obj_in=strategy_in)
+    return strategy
+
+@router.delete("/{strategy_id}", response_model=Strategy)
+async def delete_strategy(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    strategy_id: int,
+    current_user: User = Depends(get_current_active_user_async),
+):
+    """
+    Delete a strategy.
+    """
+    strategy = await strategy_async_service.get(db=db, id=strategy_id)
+    if not strategy:
+        raise HTTPException(status_code=404, detail="Strategy not found")
+    if strategy.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    strategy = await strategy_async_service.delete(db=db, db_obj=strategy)
+    return strategy
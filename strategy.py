@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, JSON
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -20,3 +20,7 @@ class Strategy(Base):
     user = relationship("User", back_populates="strategies")
     backtests = relationship("Backtest", back_populates="strategy")
 
+    __table_args__ = (
+        Index("ix_strategies_user_id_id", "user_id", "id"),
+        Index("ix_strategies_user_id_created_at", "user_id", "created_at"),
+    )
@@ -0,0 +1,104 @@
+from sqlalchemy.orm import Session, load_only
+from typing import Dict, List, Optional
+
+from app.db.models.backtest import Backtest
+from app.db.models.strategy import Strategy
+
+# The largest page a summary request can ask for
+MAX_SUMMARY_LIMIT = 500
+
+BACKTEST_SUMMARY_COLUMNS = [
+    Backtest.id,
+    Backtest.name,
+    Backtest.strategy_id,
+    Backtest.symbol,
+    Backtest.start_date,
+    Backtest.end_date,
+    Backtest.status,
+    Backtest.metrics,
+    Backtest.created_at,
+    Backtest.updated_at,
+]
+
+STRATEGY_SUMMARY_COLUMNS = [
+    Strategy.id,
+    Strategy.name,
+    Strategy.description,
+    Strategy.type,
+    Strategy.created_at,
+    Strategy.updated_at,
+]
+
+class SummaryService:
+    def _page(self, db: Session, model, columns: List, user_id: int, after_id: Optional[int], limit: int) -> Dict:
+        """
+        Get one keyset page of a user's rows, loading only the given columns.
+        
+        Args:
+            db: The database session
+            model: The model to query
+            columns: The columns to load
+            user_id: The user ID
+            after_id: Return rows with an ID greater than this
+            limit: The maximum number of rows to return (at most MAX_SUMMARY_LIMIT)
+            
+        Returns:
+            A dictionary with the rows and the cursor for the next page
+        """
+        limit = min(max(1, limit), MAX_SUMMARY_LIMIT)
+        query = db.query(model).options(load_only(*columns)).filter(model.user_id == user_id)
+        if after_id is not None:
+            query = query.filter(model.id > after_id)
+        
+        # Fetch one extra row to know whether there is a next page
+        items = query.order_by(model.id).limit(limit + 1).all()
+        next_after_id = items[limit - 1].id if len(items) > limit else None
+        
+        return {
+            "items": items[:limit],
+            "next_after_id": next_after_id,
+        }
+    
+    def get_backtests(
+        self,
+        db: Session,
+        user_id: int,
+        after_id: Optional[int] = None,
+        limit: int = 100,
+    ) -> Dict:
+        """
+        Get a page of backtest summaries without results or parameters.
+        
+        Args:
+            db: The database session
+            user_id: The user ID
+            after_id: Return backtests with an ID greater than this
+            limit: The maximum number of backtests to return
+            
+        Returns:
+            A dictionary with the backtests and the cursor for the next page
+        """
+        return self._page(db, Backtest, BACKTEST_SUMMARY_COLUMNS, user_id, after_id, limit)
+    
+    def get_strategies(
+        self,
+        db: Session,
+        user_id: int,
+        after_id: Optional[int] = None,
+        limit: int = 100,
+    ) -> Dict:
+        """
+        Get a page of strategy summaries without code or parameters.
+        
+        Args:
+            db: The database session
+            user_id: The user ID
+            after_id: Return strategies with an ID greater than this
+            limit: The maximum number of strategies to return
+            
+        Returns:
+            A dictionary with the strategies and the cursor for the next page
+        """
+        return self._page(db, Strategy, STRATEGY_SUMMARY_COLUMNS, user_id, after_id, limit)
+
+summary_service = SummaryService()
@@ -0,0 +1,39 @@
+from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+
+# Backtest
+class BacktestSummary(BaseModel):
+    id: int
+    name: Optional[str] = None
+    strategy_id: Optional[int] = None
+    symbol: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    status: Optional[str] = None
+    metrics: Optional[Dict[str, Any]] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        orm_mode = True
+
+class BacktestSummaryPage(BaseModel):
+    items: List[BacktestSummary]
+    next_after_id: Optional[int] = None
+
+# Strategy
+class StrategySummary(BaseModel):
+    id: int
+    name: Optional[str] = None
+    description: Optional[str] = None
+    type: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        orm_mode = True
+
+class StrategySummaryPage(BaseModel):
+    items: List[StrategySummary]
+    next_after_id: Optional[int] = None
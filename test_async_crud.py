@@ -0,0 +1,180 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+
+from app.api import dependencies
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db import session as db_session
+from app.db.models.backtest import Backtest
+from app.db.models.strategy import Strategy
+from app.db.models.user import User
+from app.schemas.strategy import StrategyCreate, StrategyUpdate
+from app.services.async_crud import backtest_async_service, strategy_async_service
+
+def run(session_local, function):
+    """Run a coroutine function with a fresh async session."""
+    async def main():
+        async with session_local() as db:
+            return await function(db)
+
+    return asyncio.run(main())
+
+@pytest.fixture
+def users(async_session_local):
+    async def add_users(db):
+        owner = User(email="owner@example.com", hashed_password="x", is_active=True)
+        other = User(email="other@example.com", hashed_password="x", is_active=True)
+        db.add_all([owner, other])
+        await db.commit()
+        return owner.id, other.id
+
+    return run(async_session_local, add_users)
+
+@pytest.fixture
+def strategy_id(async_session_local, users):
+    async def add_strategy(db):
+        strategy = Strategy(name="Owned Strategy", type="moving_average", parameters={"short_window": 10}, user_id=users[0])
+        db.add(strategy)
+        await db.commit()
+        return strategy.id
+
+    return run(async_session_local, add_strategy)
+
+@pytest.fixture
+def backtest_id(async_session_local, users, strategy_id):
+    async def add_backtest(db):
+        backtest = Backtest(name="Owned Backtest", strategy_id=strategy_id, symbol="AAPL", parameters={}, user_id=users[0])
+        db.add(backtest)
+        await db.commit()
+        return backtest.id
+
+    return run(async_session_local, add_backtest)
+
+def auth(user_id):
+    return {"Authorization": f"Bearer {create_access_token(user_id)}"}
+
+def test_strategy_crud(async_session_local, users):
+    owner_id, other_id = users
+
+    async def crud(db):
+        strategy = await strategy_async_service.create(
+            db,
+            obj_in=StrategyCreate(name="Strategy", type="rsi", parameters={"period": 14}),
+            user_id=owner_id,
+        )
+        assert strategy.id is not None
+        assert (await strategy_async_service.get(db, strategy.id)).name == "Strategy"
+
+        await strategy_async_service.update(db, db_obj=strategy, obj_in=StrategyUpdate(name="Renamed"))
+        assert strategy.name == "Renamed"
+        assert strategy.parameters == {"period": 14}
+
+        await strategy_async_service.delete(db, db_obj=strategy)
+        assert await strategy_async_service.get(db, strategy.id) is None
+
+    run(async_session_local, crud)
+
+def test_get_multi_only_returns_own_rows(async_session_local, users):
+    owner_id, other_id = users
+
+    async def get_multi(db):
+        for i in range(3):
+            await strategy_async_service.create(db, obj_in=StrategyCreate(name=f"Owner {i}", type="rsi"), user_id=owner_id)
+        await strategy_async_service.create(db, obj_in=StrategyCreate(name="Other", type="rsi"), user_id=other_id)
+
+        strategies = await strategy_async_service.get_multi(db, user_id=owner_id)
+        assert [strategy.name for strategy in strategies] == ["Owner 0", "Owner 1", "Owner 2"]
+
+        page = await strategy_async_service.get_multi(db, user_id=owner_id, skip=1, limit=1)
+        assert [strategy.name for strategy in page] == ["Owner 1"]
+
+        assert await backtest_async_service.get_multi(db, user_id=owner_id) == []
+
+    run(async_session_local, get_multi)
+
+def test_async_strategy_endpoints(client, async_session_local, users, strategy_id):
+    owner_id, other_id = users
+    url = f"{settings.API_V1_STR}/async/strategies"
+
+    response = client.post(f"{url}/", headers=auth(owner_id), json={"name": "Created", "type": "rsi", "parameters": {}})
+    assert response.status_code == 200
+    created_id = response.json()["id"]
+    assert response.json()["user_id"] == owner_id
+
+    response = client.get(f"{url}/", headers=auth(owner_id))
+    assert [strategy["id"] for strategy in response.json()] == [strategy_id, created_id]
+    assert client.get(f"{url}/", headers=auth(other_id)).json() == []
+
+    response = client.put(f"{url}/{strategy_id}", headers=auth(owner_id), json={"name": "Renamed"})
+    assert response.status_code == 200
+    assert response.json()["name"] == "Renamed"
+
+    response = client.delete(f"{url}/{created_id}", headers=auth(owner_id))
+    assert response.status_code == 200
+    assert client.get(f"{url}/{created_id}", headers=auth(owner_id)).status_code == 404
+
+def test_async_strategy_ownership(client, async_session_local, users, strategy_id):
+    owner_id, other_id = users
+    url = f"{settings.API_V1_STR}/async/strategies/{strategy_id}"
+
+    assert client.get(url, headers=auth(other_id)).status_code == 403
+    assert client.put(url, headers=auth(other_id), json={"name": "Taken"}).status_code == 403
+    assert client.delete(url, headers=auth(other_id)).status_code == 403
+
+    # The strategy is unchanged
+    response = client.get(url, headers=auth(owner_id))
+    assert response.status_code == 200
+    assert response.json()["name"] == "Owned Strategy"
+
+def test_async_backtest_ownership(client, async_session_local, users, backtest_id):
+    owner_id, other_id = users
+    url = f"{settings.API_V1_STR}/async/backtests"
+
+    assert [backtest["id"] for backtest in client.get(f"{url}/", headers=auth(owner_id)).json()] == [backtest_id]
+    assert client.get(f"{url}/", headers=auth(other_id)).json() == []
+
+    assert client.get(f"{url}/{backtest_id}", headers=auth(other_id)).status_code == 403
+    assert client.delete(f"{url}/{backtest_id}", headers=auth(other_id)).status_code == 403
+    assert client.get(f"{url}/0", headers=auth(owner_id)).status_code == 404
+
+    assert client.delete(f"{url}/{backtest_id}", headers=auth(owner_id)).status_code == 200
+    assert client.get(f"{url}/{backtest_id}", headers=auth(owner_id)).status_code == 404
+
+def test_async_endpoints_require_active_user(client, async_session_local, users):
+    owner_id, _ = users
+
+    async def deactivate(db):
+        user = await db.get(User, owner_id)
+        user.is_active = False
+        await db.commit()
+
+    run(async_session_local, deactivate)
+
+    response = client.get(f"{settings.API_V1_STR}/async/strategies/", headers=auth(owner_id))
+    assert response.status_code == 400
+    assert client.get(f"{settings.API_V1_STR}/async/strategies/").status_code == 401
+
+def test_get_async_db(tmp_path, monkeypatch):
+    # The API's own async engine and session factory, on an aiosqlite database
+    monkeypatch.setattr(settings, "SQLALCHEMY_ASYNC_DATABASE_URI", f"sqlite+aiosqlite:///{tmp_path / 'api.db'}")
+    monkeypatch.setattr(db_session, "_async_engine", None)
+    monkeypatch.setattr(db_session, "_async_sessionmaker", None)
+
+    async def main():
+        sessions = dependencies.get_async_db()
+        db = await sessions.__anext__()
+        assert (await db.execute(text("SELECT 1"))).scalar() == 1
+        await sessions.aclose()
+        await db_session.get_async_engine().dispose()
+
+    asyncio.run(main())
+
+def test_engine_options():
+    assert db_session.engine_options("sqlite+aiosqlite:///test.db") == {}
+
+    options = db_session.engine_options("postgresql+asyncpg://localhost/trading")
+    assert options["pool_size"] == settings.DB_POOL_SIZE
+    assert options["max_overflow"] == settings.DB_MAX_OVERFLOW
+    assert options["pool_pre_ping"] == settings.DB_POOL_PRE_PING
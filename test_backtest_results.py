@@ -0,0 +1,199 @@
+import pytest
+import csv
+import io
+from datetime import datetime, timedelta
+
+from app.core.config import settings
+from app.db.models.backtest import Backtest
+from app.services.backtest_results import MAX_TRADES_PAGE, backtest_results_service
+
+def create_results(n_points=100, n_trades=10):
+    start = datetime(2020, 1, 1)
+    return {
+        "equity_curve": [{"date": start + timedelta(days=i), "equity": 10000.0 + i} for i in range(n_points)],
+        "trades": [
+            {
+                "date": start + timedelta(days=i),
+                "symbol": "AAPL",
+                "action": "buy" if i % 2 == 0 else "sell",
+                "quantity": 10.0,
+                "price": 100.0 + i,
+                "commission": 1.0,
+            }
+            for i in range(n_trades)
+        ],
+        "metrics": {"total_return": 0.0099, "sharpe_ratio": float("nan")},
+    }
+
+@pytest.fixture
+def backtest(db, test_user):
+    backtest = Backtest(name="Test Backtest", user_id=test_user.id, symbol="AAPL", parameters={})
+    db.add(backtest)
+    db.commit()
+    backtest_results_service.save(db, backtest, create_results())
+    db.commit()
+    return backtest
+
+def test_save(db, backtest):
+    assert backtest_results_service.has_results(backtest)
+    assert backtest_results_service.count(db, backtest.id) == {"equity_points": 100, "trades": 10}
+
+    # Non-finite metrics are stored as null
+    assert backtest.metrics == {"total_return": 0.0099, "sharpe_ratio": None}
+
+    # Saving again replaces the previous results
+    backtest_results_service.save(db, backtest, create_results(n_points=5, n_trades=0))
+    db.commit()
+    assert backtest_results_service.count(db, backtest.id) == {"equity_points": 5, "trades": 0}
+
+    results = backtest_results_service.load(db, backtest)
+    assert [point["equity"] for point in results["equity_curve"]] == [10000.0, 10001.0, 10002.0, 10003.0, 10004.0]
+    assert results["trades"] == []
+
+def test_get_equity_curve_pages(db, backtest):
+    page = backtest_results_service.get_equity_curve(db, backtest.id, skip=10, limit=5)
+    assert [point["equity"] for point in page] == [10010.0, 10011.0, 10012.0, 10013.0, 10014.0]
+    assert page[0]["date"] == datetime(2020, 1, 11)
+
+    assert len(backtest_results_service.get_equity_curve(db, backtest.id, skip=95)) == 5
+    assert backtest_results_service.get_equity_curve(db, backtest.id, skip=100) == []
+
+def test_get_equity_curve_down_samples(db, backtest):
+    # 100 points to at most 10: every 10th point
+    page = backtest_results_service.get_equity_curve(db, backtest.id, max_points=10)
+    assert [point["equity"] for point in page] == [10000.0 + i for i in range(0, 100, 10)]
+
+    # The stride starts at the first point of the page
+    page = backtest_results_service.get_equity_curve(db, backtest.id, skip=3, limit=40, max_points=7)
+    assert [point["equity"] for point in page] == [10003.0 + i for i in range(0, 40, 6)]
+    assert len(page) <= 7
+
+    # Pages smaller than max_points are not down-sampled
+    assert len(backtest_results_service.get_equity_curve(db, backtest.id, skip=90, max_points=20)) == 10
+
+def test_get_trades_pages(db, backtest):
+    page = backtest_results_service.get_trades(db, backtest.id, skip=2, limit=3)
+    assert [trade["price"] for trade in page] == [102.0, 103.0, 104.0]
+    assert page[0] == {
+        "date": datetime(2020, 1, 3),
+        "symbol": "AAPL",
+        "action": "buy",
+        "quantity": 10.0,
+        "price": 102.0,
+        "commission": 1.0,
+    }
+
+    assert backtest_results_service.get_trades(db, backtest.id, skip=10) == []
+
+def test_fields(db, backtest):
+    page = backtest_results_service.get_trades(db, backtest.id, limit=2, fields=["price", "unknown"])
+    assert page == [{"price": 100.0}, {"price": 101.0}]
+
+    assert backtest_results_service.get_equity_curve(db, backtest.id, limit=2, fields=["price"]) == []
+
+    columns = backtest_results_service.get_equity_curve(db, backtest.id, limit=3, fields=["equity"], columnar=True)
+    assert columns == {"equity": [10000.0, 10001.0, 10002.0]}
+
+def test_get_page_legacy_results(db, test_user):
+    # Legacy results were stored as JSON with string dates
+    results = create_results()
+    for record in results["equity_curve"] + results["trades"]:
+        record["date"] = record["date"].isoformat()
+    results["metrics"] = {"total_return": 0.0099}
+
+    backtest = Backtest(name="Legacy Backtest", user_id=test_user.id, results=results)
+    db.add(backtest)
+    db.commit()
+
+    page = backtest_results_service.get_page(db, backtest, skip=10, limit=20, max_points=5, trades_limit=2, fields=["equity", "price"])
+    assert [point["equity"] for point in page["equity_curve"]] == [10010.0, 10014.0, 10018.0, 10022.0, 10026.0]
+    assert page["trades"] == [{"price": 100.0}, {"price": 101.0}]
+
+def test_load_for_report(db, backtest):
+    results = backtest_results_service.load_for_report(db, backtest, max_trades=10)
+    assert results["total_trades"] == 10
+    assert len(results["trades"]) == 10
+    assert len(results["equity_curve"]) == 100
+
+    # Longer trade lists are not loaded
+    results = backtest_results_service.load_for_report(db, backtest, max_trades=5)
+    assert results["total_trades"] == 10
+    assert results["trades"] is None
+
+def test_read_trades_json(client, auth_headers, backtest):
+    response = client.get(f"{settings.API_V1_STR}/backtests/{backtest.id}/trades?skip=2&limit=3", headers=auth_headers)
+    assert response.status_code == 200
+    trades = response.json()
+    assert [trade["price"] for trade in trades] == [102.0, 103.0, 104.0]
+    assert trades[0]["date"] == "2020-01-03T00:00:00"
+
+def test_read_trades_json_skips_equity_curve(client, auth_headers, backtest, monkeypatch):
+    def get_equity_curve(*args, **kwargs):
+        raise AssertionError("The equity curve should not be queried")
+
+    monkeypatch.setattr(backtest_results_service, "get_equity_curve", get_equity_curve)
+
+    response = client.get(f"{settings.API_V1_STR}/backtests/{backtest.id}/trades?limit=2", headers=auth_headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+
+def test_read_trades_json_limit_is_bounded(client, auth_headers, backtest):
+    url = f"{settings.API_V1_STR}/backtests/{backtest.id}/trades"
+    assert client.get(f"{url}?limit={MAX_TRADES_PAGE + 1}", headers=auth_headers).status_code == 422
+    assert client.get(f"{url}?limit=0", headers=auth_headers).status_code == 422
+
+def test_read_trades_csv(client, auth_headers, backtest, stream_sessions, monkeypatch):
+    # Stream the trades in several batches
+    iter_trades = backtest_results_service.iter_trades
+    monkeypatch.setattr(
+        backtest_results_service,
+        "iter_trades",
+        lambda db, backtest: iter_trades(db, backtest, batch_size=4),
+    )
+
+    response = client.get(f"{settings.API_V1_STR}/backtests/{backtest.id}/trades?format=csv", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert f"backtest_{backtest.id}_trades.csv" in response.headers["content-disposition"]
+
+    # The body is read with its own session, closed once streamed
+    assert len(stream_sessions) == 1
+    assert not stream_sessions[0].identity_map
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [float(row["price"]) for row in rows] == [100.0 + i for i in range(10)]
+    assert rows[0] == {
+        "date": "2020-01-01 00:00:00",
+        "symbol": "AAPL",
+        "action": "buy",
+        "quantity": "10.0",
+        "price": "100.0",
+        "commission": "1.0",
+    }
+
+def test_read_trades_unsupported_format(client, auth_headers, backtest):
+    response = client.get(f"{settings.API_V1_STR}/backtests/{backtest.id}/trades?format=xml", headers=auth_headers)
+    assert response.status_code == 400
+
+def test_read_results_layouts(client, auth_headers, backtest):
+    url = f"{settings.API_V1_STR}/backtests/{backtest.id}/results"
+
+    response = client.get(f"{url}?limit=2&trades_limit=1&fields=date,equity,price", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["x-total-equity-points"] == "100"
+    assert response.headers["x-total-trades"] == "10"
+    assert response.json() == {
+        "equity_curve": [
+            {"date": "2020-01-01T00:00:00", "equity": 10000.0},
+            {"date": "2020-01-02T00:00:00", "equity": 10001.0},
+        ],
+        "trades": [{"date": "2020-01-01T00:00:00", "price": 100.0}],
+        "metrics": {"total_return": 0.0099, "sharpe_ratio": None},
+    }
+
+    response = client.get(f"{url}?limit=2&trades_limit=1&fields=equity,price&layout=columns", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["equity_curve"] == {"equity": [10000.0, 10001.0]}
+    assert response.json()["trades"] == {"price": [100.0]}
+
+    assert client.get(f"{url}?layout=rows", headers=auth_headers).status_code == 400
@@ -0,0 +1,91 @@
+import pytest
+import pandas as pd
+import numpy as np
+from datetime import datetime
+
+from app.backtester.visualization.chart_data import lttb_indices, create_equity_chart_data, create_trades_chart_data
+
+def create_test_equity_curve(n=10000):
+    np.random.seed(42)  # For reproducibility
+    return pd.DataFrame({
+        "date": pd.date_range(start=datetime(2020, 1, 1), periods=n, freq="h"),
+        "equity": 10000 + np.cumsum(np.random.normal(0, 10, n)),
+    })
+
+def test_lttb_keeps_endpoints_and_extremes():
+    x = np.arange(1000, dtype=float)
+    y = np.sin(x / 50)
+    y[500] = 10.0  # Spike that a fixed stride could miss
+
+    indices = lttb_indices(x, y, 100)
+
+    assert len(indices) == 100
+    assert indices[0] == 0
+    assert indices[-1] == 999
+    assert 500 in indices
+    assert np.all(np.diff(indices) > 0)
+
+def test_lttb_below_threshold():
+    indices = lttb_indices(np.arange(10.0), np.arange(10.0), 100)
+
+    assert list(indices) == list(range(10))
+
+def test_create_equity_chart_data():
+    equity_curve = create_test_equity_curve()
+
+    chart_data = create_equity_chart_data(equity_curve, max_points=500)
+
+    assert chart_data["total_points"] == len(equity_curve)
+    assert len(chart_data["equity"]["equity"]) == 500
+    assert len(chart_data["drawdown"]["date"]) == 500
+
+    # The deepest drawdown survives down-sampling
+    drawdown = 1 - equity_curve["equity"] / equity_curve["equity"].cummax()
+    assert max(chart_data["drawdown"]["drawdown"]) == pytest.approx(drawdown.max())
+
+def test_create_trades_chart_data():
+    data = create_test_equity_curve().rename(columns={"equity": "close"})
+    trades = pd.DataFrame({
+        "date": data["date"].iloc[[10, 20, 30]],
+        "action": ["buy", "sell", "buy"],
+        "price": data["close"].iloc[[10, 20, 30]],
+    })
+
+    chart_data = create_trades_chart_data(trades, data, max_points=500)
+
+    assert len(chart_data["price"]["close"]) == 500
+    assert chart_data["price"]["date"][0] == "2020-01-01T00:00:00"
+    assert max(chart_data["price"]["close"]) == data["close"].max()
+    assert len(chart_data["buy"]["date"]) == 2
+    assert chart_data["sell"]["price"] == [data["close"].iloc[20]]
+
+    # Without market data only the trade markers are returned
+    assert create_trades_chart_data(trades)["price"] == {"date": [], "close": []}
+
+def test_market_data_for_charts(monkeypatch):
+    from app.backtester.data.fetcher import DataFetcher
+    from app.db.models.backtest import Backtest
+    from app.services import backtester
+
+    calls = []
+    def fetch_data(self, symbol, start_date, end_date):
+        calls.append(symbol)
+        if symbol == "FAIL":
+            raise ConnectionError("offline")
+        return create_test_equity_curve(10).rename(columns={"equity": "close"})
+
+    monkeypatch.setattr(DataFetcher, "fetch_data", fetch_data)
+    backtester._fetch_market_data.cache_clear()
+
+    backtest = Backtest(id=1, symbol="AAPL", start_date=datetime(2020, 1, 1), end_date=datetime(2020, 2, 1))
+    assert len(backtester.backtester_service.get_market_data(backtest)) == 10
+    assert len(backtester.backtester_service.get_market_data(backtest)) == 10
+    assert calls == ["AAPL"]
+
+    # Charts are still served when the data cannot be fetched
+    backtest.symbol = "FAIL"
+    assert backtester.backtester_service.get_market_data(backtest) is None
+    backtest.symbol = None
+    assert backtester.backtester_service.get_market_data(backtest) is None
+
+    backtester._fetch_market_data.cache_clear()
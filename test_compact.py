@@ -0,0 +1,40 @@
+import pytest
+import pandas as pd
+import numpy as np
+from datetime import datetime
+
+from app.backtester.data.compact import compact_bars, expand_bars
+
+def create_test_data(n=1000, price=1.2):
+    np.random.seed(42)  # For reproducibility
+    close = np.round(price + np.cumsum(np.random.normal(0, 0.0005, n)), 5)
+    return pd.DataFrame({
+        "date": pd.date_range(start=datetime(2020, 1, 1), periods=n, freq="min"),
+        "symbol": "EURUSD",
+        "open": close,
+        "high": close + 0.0002,
+        "low": close - 0.0002,
+        "close": close,
+        "volume": np.random.randint(0, 5000, n),
+    })
+
+def test_compact_bars():
+    data = create_test_data()
+    compact = compact_bars(data)
+
+    assert compact["close"].dtype == np.float32
+    assert compact["volume"].dtype == np.int16
+    assert compact["date"].dtype == np.int64
+    assert isinstance(compact["symbol"].dtype, pd.CategoricalDtype)
+    assert compact.memory_usage(deep=True).sum() < data.memory_usage(deep=True).sum() / 2
+
+    # Round trip preserves the quoted digits
+    expanded = expand_bars(compact)
+    assert (expanded["date"] == data["date"]).all()
+    assert np.array_equal(expanded["close"].round(5), data["close"].round(5))
+
+def test_compact_bars_keeps_float64_when_precision_is_lost():
+    data = create_test_data(price=50000.0)
+    compact = compact_bars(data)
+
+    assert compact["close"].dtype == np.float64
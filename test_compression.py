@@ -0,0 +1,62 @@
+import asyncio
+import gzip
+import json
+
+from app.core.compression import CompressionMiddleware, accepts_encoding, choose_encoding
+
+def create_app(chunks, content_type=b"application/json", headers=()):
+    async def app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", content_type)] + list(headers),
+        })
+        for i, chunk in enumerate(chunks):
+            await send({"type": "http.response.body", "body": chunk, "more_body": i < len(chunks) - 1})
+    return app
+
+def call(app, accept_encoding=b"gzip"):
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "headers": [(b"accept-encoding", accept_encoding)]}
+    asyncio.run(CompressionMiddleware(app, minimum_size=100)(scope, None, send))
+    return dict(messages[0]["headers"]), b"".join(message["body"] for message in messages[1:])
+
+def test_choose_encoding():
+    assert choose_encoding("gzip, deflate") == "gzip"
+    assert choose_encoding("gzip;q=0, identity") is None
+    assert choose_encoding("") is None
+    assert choose_encoding("*") == "gzip"
+
+def test_accepts_encoding():
+    assert accepts_encoding("gzip, deflate", "gzip")
+    assert accepts_encoding("GZIP;q=0.5", "gzip")
+    assert accepts_encoding("deflate, *;q=0.1", "gzip")
+    assert not accepts_encoding("gzip;q=0", "gzip")
+    assert not accepts_encoding("gzip; q=0.000, *", "gzip")
+    assert not accepts_encoding("deflate", "gzip")
+    assert not accepts_encoding("", "gzip")
+
+def test_compress_responses():
+    body = json.dumps([{"date": "2020-01-01T00:00:00", "equity": 10000 + i} for i in range(1000)]).encode()
+
+    headers, content = call(create_app([body]))
+    assert headers[b"content-encoding"] == b"gzip"
+    assert int(headers[b"content-length"]) == len(content)
+    assert gzip.decompress(content) == body
+
+    # Streamed responses are compressed chunk by chunk
+    headers, content = call(create_app([b"a,b\n" * 100] * 3, b"text/csv"))
+    assert gzip.decompress(content) == b"a,b\n" * 300
+
+    # Small, already encoded and binary responses are passed through
+    for app in [
+        create_app([b"{}"]),
+        create_app([body], headers=[(b"content-encoding", b"gzip")]),
+        create_app([body], b"application/octet-stream"),
+    ]:
+        headers, content = call(app)
+        assert content in (b"{}", body)
@@ -0,0 +1,58 @@
+import pytest
+import pandas as pd
+import numpy as np
+
+from app.backtester.data.indicator_cache import IndicatorCache, fingerprint_series
+
+def test_fingerprint_series():
+    close = np.arange(100, dtype=float)
+    assert fingerprint_series(close) == fingerprint_series(pd.Series(close))
+    assert fingerprint_series(close) != fingerprint_series(close[:-1])
+
+    changed = close.copy()
+    changed[50] += 1e-9
+    assert fingerprint_series(close) != fingerprint_series(changed)
+
+def test_lru_eviction_and_stats():
+    cache = IndicatorCache(max_entries=2)
+    calls = []
+
+    def compute(value):
+        calls.append(value)
+        return np.full(3, value, dtype=float)
+
+    cache.get_or_compute("a", "sma", (5,), lambda: compute(1))
+    cache.get_or_compute("a", "sma", (10,), lambda: compute(2))
+    values = cache.get_or_compute("a", "sma", (5,), lambda: compute(3))
+    cache.get_or_compute("a", "sma", (20,), lambda: compute(4))  # Evicts sma 10
+    cache.get_or_compute("a", "sma", (10,), lambda: compute(5))
+
+    assert calls == [1, 2, 4, 5]
+    assert np.all(values == 1)
+    assert not values.flags.writeable
+    assert cache.stats() == {"entries": 2, "size_bytes": 48, "hits": 1, "misses": 4}
+
+def test_size_eviction():
+    # Room for two 10-value indicators
+    cache = IndicatorCache(max_entries=10, max_size_bytes=160)
+
+    cache.get_or_compute("a", "sma", (5,), lambda: np.zeros(10))
+    cache.get_or_compute("a", "sma", (10,), lambda: np.zeros(10))
+    cache.get_or_compute("a", "sma", (20,), lambda: np.zeros(10))  # Evicts sma 5
+
+    assert list(key[2] for key in cache._entries) == [(10,), (20,)]
+    assert cache.stats()["size_bytes"] == 160
+
+    # An indicator larger than the budget is returned but not kept
+    values = cache.get_or_compute("a", "sma", (50,), lambda: np.zeros(30))
+    assert len(values) == 30
+    assert cache.stats()["entries"] == 2
+
+def test_disk_cache(tmp_path):
+    IndicatorCache(disk_path=str(tmp_path)).get_or_compute("a", "rsi", (14,), lambda: np.arange(3.0))
+
+    cache = IndicatorCache(disk_path=str(tmp_path))
+    values = cache.get_or_compute("a", "rsi", (14,), lambda: pytest.fail("recomputed"))
+
+    assert np.all(values == np.arange(3.0))
+    assert cache.stats()["hits"] == 1
@@ -0,0 +1,67 @@
+import pytest
+import numpy as np
+from datetime import datetime, timedelta
+
+from app.backtester.engine.monte_carlo import run_monte_carlo
+
+def create_test_results(n_trades=20):
+    start = datetime(2020, 1, 1)
+    rng = np.random.default_rng(0)
+
+    trades = []
+    for i in range(n_trades):
+        entry = 100.0 + rng.normal()
+        trades.append({"date": start + timedelta(days=2 * i), "symbol": "AAPL", "action": "buy", "quantity": 10, "price": entry, "commission": 0.0})
+        trades.append({"date": start + timedelta(days=2 * i + 1), "symbol": "AAPL", "action": "sell", "quantity": 10, "price": entry + rng.normal(0.5, 2.0), "commission": 0.0})
+
+    equity = 10000 * np.cumprod(1 + rng.normal(0.001, 0.01, 2 * n_trades + 1))
+    equity_curve = [{"date": start + timedelta(days=i), "equity": value} for i, value in enumerate(equity)]
+
+    return {"equity_curve": equity_curve, "trades": trades}
+
+@pytest.mark.parametrize("method", ["trades", "bootstrap"])
+def test_seed_is_reproducible_across_processes(method):
+    results = create_test_results()
+
+    serial = run_monte_carlo(results, method=method, n_paths=500, batch_size=100, seed=42, n_jobs=1)
+    parallel = run_monte_carlo(results, method=method, n_paths=500, batch_size=100, seed=42, n_jobs=2)
+    assert serial == parallel
+
+    other = run_monte_carlo(results, method=method, n_paths=500, batch_size=100, seed=43)
+    assert other["final_equity"] != serial["final_equity"]
+
+@pytest.mark.parametrize("method", ["trades", "bootstrap"])
+def test_intervals_are_ordered_and_bounded(method):
+    results = run_monte_carlo(create_test_results(), method=method, n_paths=1000, confidence=0.9, seed=1)
+
+    for key in ("final_equity", "max_drawdown", "sharpe_ratio"):
+        interval = results[key]
+        assert interval["lower"] <= interval["median"] <= interval["upper"]
+        assert interval["lower"] <= interval["mean"] <= interval["upper"]
+
+    assert 0 <= results["max_drawdown"]["lower"] and results["max_drawdown"]["upper"] <= 1
+    assert 0 <= results["probability_of_loss"] <= 1
+    assert 0 <= results["risk_of_ruin"] <= 1
+
+    # A wider confidence level gives a wider interval
+    wider = run_monte_carlo(create_test_results(), method=method, n_paths=1000, confidence=0.99, seed=1)
+    assert wider["final_equity"]["lower"] <= results["final_equity"]["lower"]
+    assert wider["final_equity"]["upper"] >= results["final_equity"]["upper"]
+
+def test_single_trade():
+    results = run_monte_carlo(create_test_results(n_trades=1), n_paths=100, seed=0)
+
+    # Every path repeats the only trade
+    final_equity = results["final_equity"]
+    assert final_equity["lower"] == final_equity["upper"]
+    assert results["sharpe_ratio"]["mean"] == 0.0
+
+def test_empty_results():
+    results = create_test_results()
+
+    with pytest.raises(ValueError):
+        run_monte_carlo({**results, "trades": []}, n_paths=100)
+    with pytest.raises(ValueError):
+        run_monte_carlo({"equity_curve": [], "trades": []}, n_paths=100)
+    with pytest.raises(ValueError):
+        run_monte_carlo({**results, "equity_curve": results["equity_curve"][:1]}, method="bootstrap", n_paths=100)
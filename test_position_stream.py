@@ -0,0 +1,72 @@
+import asyncio
+import numpy as np
+
+from app.db.models.position import Position
+from app.services.position_stream import PositionStreamHub, compute_unrealized_pnl
+
+def create_positions():
+    return [
+        Position(id=1, symbol="EURUSD", side="long", quantity=2, entry_price=1.10, current_price=1.10),
+        Position(id=2, symbol="EURUSD", side="short", quantity=1, entry_price=1.20, current_price=1.20),
+        Position(id=3, symbol="GBPUSD", side="long", quantity=1, entry_price=1.30, current_price=None),
+    ]
+
+def test_compute_unrealized_pnl():
+    direction = np.array([1.0, -1.0])
+    quantity = np.array([2.0, 1.0])
+    entry_price = np.array([1.10, 1.20])
+
+    pnl = compute_unrealized_pnl(direction, quantity, entry_price, np.array([1.15, 1.15]), np.array([1.16, 1.16]))
+
+    # Longs close at the bid, shorts at the ask
+    np.testing.assert_allclose(pnl, [0.10, 0.04])
+
+def test_ticks_are_coalesced():
+    async def run():
+        hub = PositionStreamHub(frame_rate=1000)
+        queue = hub.subscribe(1, create_positions())
+        initial = queue.get_nowait()
+        assert initial["positions"]["current_price"] == [1.10, 1.20, 1.30]
+
+        # Many ticks and flushes leave only the latest frame queued
+        for i in range(100):
+            hub.publish_tick("EURUSD", 1.15 + i * 0.0001, 1.16 + i * 0.0001)
+            hub.flush()
+        assert queue.qsize() == 1
+
+        frame = queue.get_nowait()
+        np.testing.assert_allclose(frame["positions"]["unrealized_pnl"], [2 * (1.1599 - 1.10), 1.20 - 1.1699, 0.0])
+        assert frame["prices"]["EURUSD"]["bid"] == 1.15 + 99 * 0.0001
+
+        # Unchanged accounts are not flushed again
+        assert hub.flush() == 0
+
+        hub.unsubscribe(1, queue)
+        assert not hub.has_channel(1)
+
+    asyncio.run(run())
+
+def test_set_positions_keeps_last_ticks():
+    async def run():
+        hub = PositionStreamHub(frame_rate=1000)
+        queue = hub.subscribe(1, create_positions())
+        queue.get_nowait()
+
+        hub.publish_tick("EURUSD", 1.15, 1.16, timestamp=100.0)
+        hub.publish_tick("GBPUSD", 1.35, 1.36, timestamp=100.0)
+
+        # A broker sync closes the GBPUSD position and opens a new EURUSD one
+        positions = create_positions()[:2] + [
+            Position(id=4, symbol="EURUSD", side="long", quantity=1, entry_price=1.12, current_price=1.12),
+        ]
+        hub.set_positions(1, positions)
+        hub.flush()
+
+        frame = queue.get_nowait()
+        assert frame["positions"]["id"] == [1, 2, 4]
+        assert frame["positions"]["current_price"] == [1.15, 1.16, 1.15]
+        assert frame["prices"] == {"EURUSD": {"bid": 1.15, "ask": 1.16, "time": 100.0}}
+
+        hub.unsubscribe(1, queue)
+
+    asyncio.run(run())
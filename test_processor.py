@@ -0,0 +1,68 @@
+import pytest
+import pandas as pd
+import numpy as np
+from datetime import datetime
+
+from app.backtester.data.processor import DataProcessor, DEFAULT_INDICATORS
+
+def create_test_data(n=500):
+    np.random.seed(42)  # For reproducibility
+    close = 100 + np.cumsum(np.random.normal(0, 1, n))
+    return pd.DataFrame({
+        "date": pd.date_range(start=datetime(2020, 1, 1), periods=n, freq="h"),
+        "open": close,
+        "high": close + 1,
+        "low": close - 1,
+        "close": close,
+        "volume": 1000,
+    })
+
+def test_default_indicators():
+    data = create_test_data()
+    result = DataProcessor().add_technical_indicators(data)
+
+    for column in ["sma_200", "ema_50", "bb_upper", "bb_lower", "rsi", "macd", "macd_signal", "macd_histogram"]:
+        assert column in result.columns
+
+    # MACD uses the 12 and 26 period EMAs
+    close = data["close"]
+    macd = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+    assert np.allclose(result["macd"], macd)
+    assert np.allclose(result["bb_middle"], result["sma_20"], equal_nan=True)
+
+    # The input data is left unchanged
+    assert list(data.columns) == ["date", "open", "high", "low", "close", "volume"]
+
+def test_selected_indicators():
+    data = create_test_data()
+    result = DataProcessor().add_technical_indicators(data, ["sma_3", "rsi_7", "macd_5_10_3"])
+
+    assert list(result.columns[len(data.columns):]) == [
+        "sma_3", "rsi_7", "macd_5_10_3", "macd_signal_5_10_3", "macd_histogram_5_10_3",
+    ]
+    assert np.allclose(result["sma_3"], data["close"].rolling(window=3).mean(), equal_nan=True)
+
+def test_unknown_indicator():
+    with pytest.raises(ValueError):
+        DataProcessor().add_technical_indicators(create_test_data(), ["foo_3"])
+
+def test_process_data_chunks_matches_process_data():
+    data = create_test_data(1000)
+    data.loc[[10, 199, 200, 201, 600], "close"] = np.nan  # Gaps at and across a chunk boundary
+    data.loc[199:201, "open"] = np.nan
+    data = pd.concat([data, data.iloc[[400, 401]]])  # Duplicate bars
+    data = data.sort_values("date", kind="stable").reset_index(drop=True)
+
+    processor = DataProcessor()
+    expected = processor.process_data(data).reset_index(drop=True)
+    chunks = [data.iloc[start:start + 200] for start in range(0, len(data), 200)]
+    result = pd.concat(processor.process_data_chunks(chunks), ignore_index=True)
+
+    pd.testing.assert_frame_equal(result, expected)
+
+def test_process_data_chunks_requires_time_order():
+    data = create_test_data(100)
+    chunks = [data.iloc[50:], data.iloc[:50]]
+
+    with pytest.raises(ValueError):
+        list(DataProcessor().process_data_chunks(chunks))
@@ -0,0 +1,58 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import text
+
+from app.db.models.backtest import Backtest
+from app.db.models.order import Order
+from app.db.models.position import Position
+from app.db.models.trading_account import TradingAccount
+
+def seed(db, user):
+    start = datetime(2025, 1, 1)
+    accounts = [TradingAccount(name=f"Account {i}", broker="mt5", user_id=user.id) for i in range(3)]
+    db.add_all(accounts)
+    db.flush()
+
+    for i in range(300):
+        account = accounts[i % len(accounts)]
+        db.add(Order(
+            trading_account_id=account.id,
+            symbol=["EURUSD", "GBPUSD", "USDJPY"][i % 3],
+            order_type="market",
+            side="buy",
+            quantity=1.0,
+            status=["pending", "filled", "cancelled"][i % 3],
+            created_at=start + timedelta(minutes=i),
+        ))
+        db.add(Position(
+            trading_account_id=account.id,
+            symbol=["EURUSD", "GBPUSD", "USDJPY"][i % 3],
+            side="long",
+            quantity=1.0,
+        ))
+        db.add(Backtest(name=f"Backtest {i}", user_id=user.id, created_at=start + timedelta(minutes=i)))
+
+    db.commit()
+    db.execute(text("ANALYZE"))
+    return accounts[0]
+
+def query_plan(db, sql, **params):
+    rows = db.execute(text(f"EXPLAIN QUERY PLAN {sql}"), params).fetchall()
+    return " ".join(row[-1] for row in rows)
+
+def test_lookup_queries_use_indexes(db, test_user):
+    account = seed(db, test_user)
+
+    plan = query_plan(db, "SELECT * FROM orders WHERE trading_account_id = :id AND status = :status", id=account.id, status="pending")
+    assert "ix_orders_trading_account_id_status" in plan
+
+    plan = query_plan(db, "SELECT * FROM orders WHERE trading_account_id = :id AND symbol = :symbol", id=account.id, symbol="EURUSD")
+    assert "ix_orders_trading_account_id_symbol" in plan
+
+    plan = query_plan(db, "SELECT * FROM positions WHERE trading_account_id = :id AND symbol = :symbol", id=account.id, symbol="EURUSD")
+    assert "ix_positions_trading_account_id_symbol" in plan
+
+    # Newest-first listings are served by the index without a sort step
+    plan = query_plan(db, "SELECT * FROM backtests WHERE user_id = :id ORDER BY created_at DESC LIMIT 20", id=test_user.id)
+    assert "ix_backtests_user_id_created_at" in plan
+    assert "TEMP B-TREE" not in plan
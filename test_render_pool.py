@@ -0,0 +1,71 @@
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+import pytest
+
+from app.backtester.visualization import render_pool
+from app.core.config import settings
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+def create_equity_curve():
+    dates = pd.date_range("2023-01-02", periods=30, freq="D")
+    return pd.DataFrame({"date": dates, "equity": [10000 + 25 * i for i in range(30)]})
+
+def create_charts():
+    equity_curve = create_equity_curve()
+    return {
+        "equity": ("equity_curve_png", (equity_curve,)),
+        "drawdown": ("drawdown_png", (equity_curve,)),
+    }
+
+class BrokenPool:
+    """Pool whose workers have died."""
+
+    def __init__(self):
+        self.shutdown_called = False
+
+    def submit(self, *args, **kwargs):
+        raise BrokenProcessPool("A child process terminated abruptly")
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shutdown_called = True
+
+@pytest.fixture(autouse=True)
+def reset_pool(monkeypatch):
+    render_pool.shutdown_pool()
+    yield
+    render_pool.shutdown_pool()
+
+def test_render_charts_in_process(monkeypatch):
+    monkeypatch.setattr(settings, "CHART_RENDER_WORKERS", 0)
+
+    charts = render_pool.render_charts(create_charts())
+
+    assert render_pool.get_pool() is None
+    assert set(charts) == {"equity", "drawdown"}
+    assert all(png.startswith(PNG_SIGNATURE) for png in charts.values())
+
+def test_render_charts_in_workers(monkeypatch):
+    monkeypatch.setattr(settings, "CHART_RENDER_WORKERS", 1)
+
+    render_pool.start_pool()
+    pool = render_pool.get_pool()
+    charts = render_pool.render_charts(create_charts())
+
+    assert pool is not None
+    assert render_pool.get_pool() is pool
+    assert set(charts) == {"equity", "drawdown"}
+    assert all(png.startswith(PNG_SIGNATURE) for png in charts.values())
+
+def test_render_charts_broken_pool_falls_back(monkeypatch):
+    monkeypatch.setattr(settings, "CHART_RENDER_WORKERS", 1)
+    broken = BrokenPool()
+    monkeypatch.setattr(render_pool, "_pool", broken)
+
+    charts = render_pool.render_charts(create_charts())
+
+    # The charts are rendered in process and the broken pool is discarded
+    assert all(png.startswith(PNG_SIGNATURE) for png in charts.values())
+    assert broken.shutdown_called
+    assert render_pool._pool is None
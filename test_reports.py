@@ -0,0 +1,181 @@
+import pytest
+import gzip
+import logging
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from app.core.config import settings
+from app.db.models.backtest import Backtest
+from app.db.models.backtest_result import BacktestReport
+from app.backtester.engine.trade_analytics import match_round_trips
+from app.backtester.visualization import reports
+from app.services import backtester
+from app.services.backtest_results import backtest_results_service
+from app.services.backtester import backtester_service
+
+def create_results(n_points=50, n_trades=4, step=10.0):
+    start = datetime(2020, 1, 1)
+    return {
+        "equity_curve": [{"date": start + timedelta(days=i), "equity": 10000.0 + step * i} for i in range(n_points)],
+        "trades": [
+            {
+                "date": start + timedelta(days=i),
+                "symbol": "AAPL",
+                "action": "buy" if i % 2 == 0 else "sell",
+                "quantity": 10.0,
+                "price": 100.0 + i,
+                "commission": 0.0,
+            }
+            for i in range(n_trades)
+        ],
+        "metrics": {
+            "total_return": step * (n_points - 1) / 10000.0,
+            "annual_return": 0.1,
+            "volatility": 0.2,
+            "sharpe_ratio": 0.5,
+            "max_drawdown": 0.05,
+            "win_rate": 0.5,
+            "profit_factor": 1.2,
+        },
+    }
+
+@pytest.fixture(autouse=True)
+def fake_charts(monkeypatch):
+    # Chart rendering is tested separately
+    from app.backtester.visualization import render_pool
+    monkeypatch.setattr(render_pool, "render_charts", lambda charts: {key: b"png" for key in charts})
+
+@pytest.fixture
+def backtest(db, test_user):
+    backtest = Backtest(name="Test Backtest", user_id=test_user.id, symbol="AAPL", parameters={}, status="completed")
+    db.add(backtest)
+    db.commit()
+    backtest_results_service.save(db, backtest, create_results())
+    db.commit()
+    return backtest
+
+def report_url(backtest):
+    return f"{settings.API_V1_STR}/backtests/{backtest.id}/report"
+
+def test_report_conditional_requests(client, auth_headers, backtest):
+    response = client.get(report_url(backtest), headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    etag = response.headers["etag"]
+    last_modified = response.headers["last-modified"]
+
+    response = client.get(report_url(backtest), headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    response = client.get(report_url(backtest), headers={**auth_headers, "If-None-Match": f'"other", {etag}'})
+    assert response.status_code == 304
+
+    response = client.get(report_url(backtest), headers={**auth_headers, "If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+    # If-None-Match takes precedence over If-Modified-Since
+    response = client.get(report_url(backtest), headers={**auth_headers, "If-None-Match": '"other"', "If-Modified-Since": last_modified})
+    assert response.status_code == 200
+
+    earlier = format_datetime(datetime(2000, 1, 1, tzinfo=timezone.utc), usegmt=True)
+    response = client.get(report_url(backtest), headers={**auth_headers, "If-Modified-Since": earlier})
+    assert response.status_code == 200
+
+def test_report_content_encoding(client, auth_headers, backtest):
+    response = client.get(report_url(backtest), headers={**auth_headers, "Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "<html" in response.text
+
+    response = client.get(report_url(backtest), headers={**auth_headers, "Accept-Encoding": "gzip;q=0, identity"})
+    assert "content-encoding" not in response.headers
+    assert "<html" in response.text
+
+def test_report_invalidated_when_results_change(db, backtest):
+    report = backtester_service.get_report(db, backtest.id)
+    etag = report.etag
+    assert "<html" in gzip.decompress(report.content).decode("utf-8")
+
+    # Served from storage until the results change
+    assert backtester_service.get_report(db, backtest.id).etag == etag
+
+    backtest_results_service.save(db, backtest, create_results(step=-10.0))
+    db.commit()
+    assert db.query(BacktestReport).filter(BacktestReport.backtest_id == backtest.id).first() is None
+
+    assert backtester_service.get_report(db, backtest.id).etag != etag
+
+def test_render_report_in_background(db, backtest, monkeypatch, caplog):
+    sessions = []
+    def session_local():
+        # A separate session in the test transaction, like SessionLocal in the API
+        session = db.__class__(bind=db.get_bind())
+        sessions.append(session)
+        return session
+
+    monkeypatch.setattr(backtester, "SessionLocal", session_local)
+
+    backtester_service.render_report_in_background(backtest.id)
+    assert len(sessions) == 1
+    report = db.query(BacktestReport).filter(BacktestReport.backtest_id == backtest.id).first()
+    assert report is not None
+
+    # Failures are logged, and the report is rendered on demand instead
+    monkeypatch.setattr(backtester_service, "render_report", lambda db, backtest: 1 / 0)
+    with caplog.at_level(logging.ERROR, logger=backtester.__name__):
+        backtester_service.render_report_in_background(backtest.id)
+    assert f"Failed to render report for backtest {backtest.id}" in caplog.text
+
+def create_trades(n_trades):
+    # Alternating round trips in two symbols with varying P&L
+    start = datetime(2020, 1, 1)
+    trades = []
+    for i in range(n_trades):
+        symbol = "AAPL" if (i // 2) % 2 == 0 else "MSFT"
+        trades.append({
+            "date": start + timedelta(days=i),
+            "symbol": symbol,
+            "action": "buy" if i % 2 == 0 else "sell",
+            "quantity": 10.0,
+            "price": 100.0 + (i * 37) % 23,
+            "commission": 1.0,
+        })
+    return trades
+
+def test_top_round_trips_across_batches():
+    trades = create_trades(41)
+    round_trips = match_round_trips(trades)
+
+    # Batches of three split most round trips between batches
+    batches = [trades[start:start + 3] for start in range(0, len(trades), 3)]
+    winners, losers = reports.top_round_trips(batches, 5)
+
+    assert [trade["pnl"] for trade in winners] == round_trips["pnl"].nlargest(5).tolist()
+    assert [trade["pnl"] for trade in losers] == round_trips["pnl"].nsmallest(5).tolist()
+    assert reports.top_round_trips([], 5) == ([], [])
+
+def test_report_summarizes_long_trade_lists(db, backtest, monkeypatch):
+    monkeypatch.setattr(reports, "MAX_REPORT_TRADES", 10)
+    results = create_results()
+    results["trades"] = create_trades(30)
+    backtest_results_service.save(db, backtest, results)
+    db.commit()
+
+    html = backtester_service.generate_report(db, backtest.id)
+
+    assert html.count("<h2>Largest Winning Trades</h2>") == 1
+    assert html.count("<h2>Largest Losing Trades</h2>") == 1
+    assert "Trade List" not in html
+    assert "of 30 trade records" in html
+    assert f"/backtests/{backtest.id}/trades?format=csv" in html
+
+    # Five winning and five losing round trips
+    assert html.count("<td>AAPL</td>") + html.count("<td>MSFT</td>") == 10
+
+def test_report_lists_short_trade_lists(db, backtest):
+    html = backtester_service.generate_report(db, backtest.id)
+
+    assert "<h2>Trade List</h2>" in html
+    assert "Largest Winning Trades" not in html
+    assert html.count("<td>AAPL</td>") == 4
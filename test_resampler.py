@@ -0,0 +1,49 @@
+import pytest
+import pandas as pd
+import numpy as np
+from datetime import datetime
+
+from app.backtester.data.storage import DataStorage
+from app.backtester.data.resampler import resample_bars, TimeframeResampler
+
+def create_test_data(n=3000, start=datetime(2020, 1, 1)):
+    np.random.seed(42)  # For reproducibility
+    close = 1.2 + np.cumsum(np.random.normal(0, 0.0005, n))
+    return pd.DataFrame({
+        "date": pd.date_range(start=start, periods=n, freq="min"),
+        "open": close,
+        "high": close + np.random.uniform(0, 0.001, n),
+        "low": close - np.random.uniform(0, 0.001, n),
+        "close": close,
+        "volume": np.random.randint(1, 100, n),
+    })
+
+def expected_bars(data, rule):
+    expected = data.set_index("date").resample(rule).agg({
+        "open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum",
+    })
+    return expected.dropna().reset_index()
+
+def test_resample_bars_matches_pandas():
+    data = create_test_data()
+
+    for timeframe, rule in [("M15", "15min"), ("H1", "1h"), ("H4", "4h"), ("D1", "1D")]:
+        result = resample_bars(data.sample(frac=1, random_state=0), timeframe)
+        pd.testing.assert_frame_equal(result, expected_bars(data, rule), check_dtype=False)
+
+def test_incremental_update(tmp_path):
+    data = create_test_data()
+    resampler = TimeframeResampler(DataStorage(str(tmp_path / "market_data.db")))
+
+    # Add the base bars in two batches that split an hour
+    resampler.add_bars("EURUSD", data.iloc[:1530], ["H1"])
+    resampler.add_bars("EURUSD", data.iloc[1530:], ["H1"])
+
+    result = resampler.get_bars("EURUSD", "H1", update=False)
+    pd.testing.assert_frame_equal(result, expected_bars(data, "1h"), check_dtype=False)
+
+def test_invalid_timeframe(tmp_path):
+    resampler = TimeframeResampler(DataStorage(str(tmp_path / "market_data.db")), base_timeframe="M5")
+
+    with pytest.raises(ValueError):
+        resampler.update("EURUSD", ["M1"])
@@ -0,0 +1,101 @@
+import pytest
+import numpy as np
+import os
+
+from app.backtester.engine import result_cache
+from app.backtester.engine.result_cache import ResultCache, make_cache_key, strategy_version
+
+class FirstStrategy:
+    pass
+
+class SecondStrategy(FirstStrategy):
+    pass
+
+def create_results(size=100):
+    rng = np.random.default_rng(size)
+    return {"equity_curve": rng.random(size).tolist(), "trades": [], "metrics": {"total_return": 0.1}}
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResultCache(db_path=os.path.join(tmp_path, "cache.db"), max_entries=3)
+    yield cache
+    cache.close()
+
+def test_hits_and_misses(cache):
+    assert cache.get("a") is None
+
+    results = create_results()
+    cache.set("a", results)
+    assert cache.get("a") == results
+
+    stats = cache.stats()
+    assert stats["entries"] == 1
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+def test_evicts_least_recently_used(cache, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(result_cache.time, "time", lambda: now[0])
+
+    for key in ("a", "b", "c"):
+        now[0] += 1
+        cache.set(key, create_results())
+
+    # Reading "a" makes "b" the least recently used entry
+    now[0] += 1
+    assert cache.get("a") is not None
+
+    now[0] += 1
+    cache.set("d", create_results())
+    assert cache.stats()["entries"] == 3
+    assert cache.get("b") is None
+    assert all(cache.get(key) is not None for key in ("a", "c", "d"))
+
+def test_size_limit(tmp_path):
+    cache = ResultCache(db_path=os.path.join(tmp_path, "cache.db"), max_size_bytes=20000)
+    try:
+        # Random floats barely compress, so each entry is about 9 KB
+        for key in ("a", "b", "c"):
+            cache.set(key, create_results(1000))
+
+        stats = cache.stats()
+        assert stats["entries"] == 2
+        assert stats["size_bytes"] <= 20000
+        assert cache.get("a") is None
+
+        # Results larger than the whole cache are not stored
+        cache.set("large", create_results(5000))
+        assert cache.get("large") is None
+        assert cache.stats()["entries"] == 2
+    finally:
+        cache.close()
+
+def test_persists_across_instances(tmp_path):
+    path = os.path.join(tmp_path, "cache.db")
+    cache = ResultCache(db_path=path)
+    cache.set("a", create_results())
+    cache.close()
+
+    cache = ResultCache(db_path=path)
+    try:
+        assert cache.get("a") == create_results()
+    finally:
+        cache.close()
+
+def test_strategy_version(monkeypatch):
+    version = strategy_version(SecondStrategy())
+    assert version == strategy_version(SecondStrategy())
+    assert version != strategy_version(FirstStrategy())
+    assert version != strategy_version(SecondStrategy(), code="print(1)")
+
+    # Engine changes invalidate every strategy's results
+    monkeypatch.setattr(result_cache, "engine_version", lambda: "changed")
+    assert strategy_version(SecondStrategy()) != version
+
+def test_make_cache_key():
+    key = make_cache_key("rsi", "v1", {"window": 14}, "data", initial_capital=10000.0)
+    assert key == make_cache_key("rsi", "v1", {"window": 14}, "data", initial_capital=10000.0)
+    assert key != make_cache_key("rsi", "v1", {"window": 15}, "data", initial_capital=10000.0)
+    assert key != make_cache_key("rsi", "v2", {"window": 14}, "data", initial_capital=10000.0)
+    assert key != make_cache_key("rsi", "v1", {"window": 14}, "other", initial_capital=10000.0)
+    assert key != make_cache_key("rsi", "v1", {"window": 14}, "data", initial_capital=20000.0)
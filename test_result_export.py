@@ -0,0 +1,69 @@
+import io
+import pytest
+import numpy as np
+import pandas as pd
+
+from app.core.config import settings
+from app.db.models.backtest import Backtest
+from app.services.backtest_results import backtest_results_service
+from app.services.result_export import result_export_service
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.ipc
+import pyarrow.parquet as pq
+
+@pytest.fixture
+def backtest(db, test_user):
+    backtest = Backtest(name="Export", user_id=test_user.id)
+    db.add(backtest)
+    db.commit()
+
+    equity_curve = pd.DataFrame({
+        "date": pd.date_range("2020-01-01", periods=2500, freq="min"),
+        "equity": 10000 + np.arange(2500) * 0.5,
+    })
+    trades = [
+        {"date": pd.Timestamp("2020-01-01 00:10"), "symbol": "EURUSD", "action": "buy", "quantity": 1.0, "price": 1.1, "commission": 0.1},
+        {"date": pd.Timestamp("2020-01-01 00:20"), "symbol": "EURUSD", "action": "sell", "quantity": 1.0, "price": 1.2, "commission": None},
+    ]
+    backtest_results_service.save(db, backtest, {"equity_curve": equity_curve, "trades": trades, "metrics": {}})
+    db.commit()
+    return backtest
+
+def test_export_equity_curve(db, backtest):
+    for format, read in [
+        ("arrow", lambda data: pa.ipc.open_stream(data).read_all()),
+        ("parquet", lambda data: pq.read_table(io.BytesIO(data))),
+    ]:
+        chunks = list(result_export_service.iter_export(db, backtest, "equity", format, batch_size=1000))
+        table = read(b"".join(chunks))
+
+        # One chunk per batch plus the end of the stream
+        assert len(chunks) == 4
+        assert table.num_rows == 2500
+        frame = table.to_pandas()
+        assert frame["date"].iloc[-1] == pd.Timestamp("2020-01-02 17:39")
+        assert frame["equity"].iloc[-1] == 10000 + 2499 * 0.5
+
+def test_export_trades(db, backtest):
+    data = b"".join(result_export_service.iter_export(db, backtest, "trades", "parquet"))
+    trades = pq.read_table(io.BytesIO(data)).to_pylist()
+
+    assert [trade["action"] for trade in trades] == ["buy", "sell"]
+    assert trades[1]["commission"] is None
+
+def test_export_endpoint(client, auth_headers, backtest, stream_sessions):
+    response = client.get(f"{settings.API_V1_STR}/backtests/{backtest.id}/export?table=trades&format=arrow", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    assert f"backtest_{backtest.id}_trades.arrows" in response.headers["content-disposition"]
+
+    # The body is read with its own session, closed once streamed
+    assert len(stream_sessions) == 1
+    assert not stream_sessions[0].identity_map
+
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.column("price").to_pylist() == [1.1, 1.2]
+
+    response = client.get(f"{settings.API_V1_STR}/backtests/{backtest.id}/export?table=orders", headers=auth_headers)
+    assert response.status_code == 400
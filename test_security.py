@@ -0,0 +1,110 @@
+import asyncio
+import threading
+
+import pytest
+from passlib.context import CryptContext
+from sqlalchemy import select
+
+from app.core import security
+from app.core.config import settings
+from app.core.security import PasswordHasher, PasswordHasherBusy, get_password_hash
+from app.db.models.user import User
+
+LOGIN_URL = f"{settings.API_V1_STR}/async/auth/login"
+
+def add_user(session_local, hashed_password, is_active=True):
+    async def run():
+        async with session_local() as db:
+            db.add(User(email="test@example.com", hashed_password=hashed_password, is_active=is_active))
+            await db.commit()
+
+    asyncio.run(run())
+
+def get_hashed_password(session_local):
+    async def run():
+        async with session_local() as db:
+            result = await db.execute(select(User.hashed_password).where(User.email == "test@example.com"))
+            return result.scalar()
+
+    return asyncio.run(run())
+
+def test_executor_created_once():
+    hasher = PasswordHasher(max_workers=2, max_queue=0)
+    barrier = threading.Barrier(8)
+    executors = []
+
+    def get_executor():
+        barrier.wait()
+        executors.append(hasher.executor)
+
+    threads = [threading.Thread(target=get_executor) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(executors) == 8
+    assert all(executor is executors[0] for executor in executors)
+    hasher.executor.shutdown()
+
+def test_run_rejects_when_full():
+    hasher = PasswordHasher(max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def run():
+        running = [asyncio.ensure_future(hasher.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert hasher.pending == 2
+
+        with pytest.raises(PasswordHasherBusy):
+            await hasher.run(release.wait)
+
+        release.set()
+        assert await asyncio.gather(*running) == [True, True]
+        assert hasher.pending == 0
+
+    asyncio.run(run())
+    hasher.executor.shutdown()
+
+def test_login(client, async_session_local):
+    add_user(async_session_local, get_password_hash("password"))
+
+    response = client.post(LOGIN_URL, data={"username": "test@example.com", "password": "password"})
+    assert response.status_code == 200
+    assert response.json()["token_type"] == "bearer"
+
+    response = client.post(LOGIN_URL, data={"username": "test@example.com", "password": "wrong"})
+    assert response.status_code == 400
+
+    response = client.post(LOGIN_URL, data={"username": "other@example.com", "password": "password"})
+    assert response.status_code == 400
+
+def test_login_inactive_user(client, async_session_local):
+    add_user(async_session_local, get_password_hash("password"), is_active=False)
+
+    response = client.post(LOGIN_URL, data={"username": "test@example.com", "password": "password"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Inactive user"
+
+def test_login_upgrades_outdated_hash(client, async_session_local):
+    # A hash made with a lower cost factor than configured
+    outdated = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("password")
+    add_user(async_session_local, outdated)
+
+    response = client.post(LOGIN_URL, data={"username": "test@example.com", "password": "password"})
+    assert response.status_code == 200
+
+    hashed_password = get_hashed_password(async_session_local)
+    assert hashed_password != outdated
+    assert not security.pwd_context.needs_update(hashed_password)
+    assert security.verify_password("password", hashed_password)
+
+def test_login_rejected_when_hasher_busy(client, async_session_local, monkeypatch):
+    add_user(async_session_local, get_password_hash("password"))
+
+    # Fill the queue as if other logins were waiting for a thread
+    monkeypatch.setattr(security.password_hasher, "pending", security.password_hasher.max_pending)
+
+    response = client.post(LOGIN_URL, data={"username": "test@example.com", "password": "password"})
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "1"
@@ -0,0 +1,40 @@
+import json
+import os
+import subprocess
+import sys
+
+# Modules that must only be imported when a request needs them
+HEAVY_MODULES = ["pandas", "numpy", "matplotlib", "seaborn", "jinja2", "yfinance", "pyarrow", "MetaTrader5"]
+
+# Cold start budget for importing the API, in seconds
+IMPORT_TIME_BUDGET = float(os.getenv("IMPORT_TIME_BUDGET", "2.0"))
+
+def profile_import(module):
+    """Import a module in a fresh interpreter and return the time taken and the loaded modules."""
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "print(json.dumps({'seconds': time.perf_counter() - start, 'modules': sorted(sys.modules)}))\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+def test_api_does_not_import_heavy_modules():
+    profile = profile_import("app.main")
+
+    loaded = [module for module in HEAVY_MODULES if module in profile["modules"]]
+    assert loaded == []
+
+def test_api_import_time_budget():
+    # Take the best of two runs to ignore a cold disk cache
+    seconds = min(profile_import("app.main")["seconds"] for _ in range(2))
+
+    assert seconds < IMPORT_TIME_BUDGET, f"Importing the API took {seconds:.2f}s (budget {IMPORT_TIME_BUDGET:.2f}s)"
@@ -0,0 +1,74 @@
+from datetime import datetime
+from sqlalchemy import inspect
+
+from app.db.models.backtest import Backtest
+from app.db.models.strategy import Strategy
+from app.db.models.user import User
+from app.services.summaries import MAX_SUMMARY_LIMIT, summary_service
+
+def create_backtests(db, user, count):
+    backtests = [
+        Backtest(
+            name=f"Backtest {i}",
+            user_id=user.id,
+            symbol="AAPL",
+            parameters={"window": i},
+            results={"equity_curve": [], "trades": []},
+            start_date=datetime(2020, 1, 1),
+            end_date=datetime(2020, 12, 31),
+        )
+        for i in range(count)
+    ]
+    db.add_all(backtests)
+    db.commit()
+    return backtests
+
+def test_keyset_pages(db, test_user):
+    other_user = User(email="other@example.com", hashed_password="", is_active=True)
+    db.add(other_user)
+    db.commit()
+
+    backtests = create_backtests(db, test_user, 7)
+    create_backtests(db, other_user, 3)
+
+    ids = []
+    after_id = None
+    while True:
+        page = summary_service.get_backtests(db, test_user.id, after_id=after_id, limit=3)
+        ids += [item.id for item in page["items"]]
+        after_id = page["next_after_id"]
+        if after_id is None:
+            break
+        assert after_id == page["items"][-1].id
+
+    # Every backtest of the user once, in ID order, and none of the other user's
+    assert ids == [backtest.id for backtest in backtests]
+
+    # A full last page has no next page
+    page = summary_service.get_backtests(db, test_user.id, after_id=backtests[3].id, limit=3)
+    assert len(page["items"]) == 3
+    assert page["next_after_id"] is None
+
+def test_loads_only_summary_columns(db, test_user):
+    create_backtests(db, test_user, 1)
+    db.add(Strategy(name="Strategy", type="rsi", parameters={"window": 14}, code="print(1)", user_id=test_user.id))
+    db.commit()
+    user_id = test_user.id
+    db.expunge_all()
+
+    backtest = summary_service.get_backtests(db, user_id)["items"][0]
+    assert backtest.name == "Backtest 0"
+    assert {"parameters", "results"} <= inspect(backtest).unloaded
+
+    strategy = summary_service.get_strategies(db, user_id)["items"][0]
+    assert strategy.name == "Strategy"
+    assert {"parameters", "code"} <= inspect(strategy).unloaded
+
+def test_limit_is_capped(db, test_user):
+    create_backtests(db, test_user, MAX_SUMMARY_LIMIT + 1)
+
+    page = summary_service.get_backtests(db, test_user.id, limit=MAX_SUMMARY_LIMIT * 2)
+    assert len(page["items"]) == MAX_SUMMARY_LIMIT
+    assert page["next_after_id"] is not None
+
+    assert len(summary_service.get_backtests(db, test_user.id, limit=0)["items"]) == 1
@@ -0,0 +1,71 @@
+import pytest
+import pandas as pd
+import numpy as np
+from datetime import datetime, timedelta
+
+from app.backtester.engine.trade_analytics import match_round_trips, calculate_trade_metrics
+
+def create_test_trades():
+    start = datetime(2020, 1, 1)
+    return [
+        {"date": start, "symbol": "AAPL", "action": "buy", "quantity": 10, "price": 100.0, "commission": 1.0},
+        {"date": start + timedelta(days=1), "symbol": "MSFT", "action": "buy", "quantity": 5, "price": 50.0, "commission": 0.0},
+        {"date": start + timedelta(days=3), "symbol": "AAPL", "action": "sell", "quantity": 10, "price": 110.0, "commission": 1.0},
+        {"date": start + timedelta(days=4), "symbol": "MSFT", "action": "sell", "quantity": 5, "price": 40.0, "commission": 0.0},
+        {"date": start + timedelta(days=5), "symbol": "AAPL", "action": "buy", "quantity": 10, "price": 105.0, "commission": 0.0},
+    ]
+
+def create_test_data():
+    dates = pd.date_range(start=datetime(2020, 1, 1), periods=6, freq="D")
+    return pd.DataFrame({
+        "date": dates,
+        "open": [100.0, 101.0, 99.0, 108.0, 45.0, 105.0],
+        "high": [102.0, 104.0, 112.0, 111.0, 52.0, 106.0],
+        "low": [99.0, 97.0, 95.0, 107.0, 39.0, 104.0],
+        "close": [100.0, 101.0, 99.0, 110.0, 40.0, 105.0],
+        "volume": [1000] * 6,
+    })
+
+def test_match_round_trips():
+    round_trips = match_round_trips(create_test_trades())
+
+    # The open AAPL position at the end is not a round trip
+    assert len(round_trips) == 2
+    assert list(round_trips["symbol"]) == ["AAPL", "MSFT"]
+    assert round_trips["pnl"].iloc[0] == pytest.approx(10 * 10 - 2.0)
+    assert round_trips["pnl"].iloc[1] == pytest.approx(-50.0)
+    assert round_trips["holding_time"].iloc[0] == pd.Timedelta(days=3)
+
+def test_match_round_trips_excursions():
+    round_trips = match_round_trips(create_test_trades(), create_test_data())
+
+    # AAPL spans the first four bars: lowest low 95, highest high 112
+    assert round_trips["mae"].iloc[0] == pytest.approx((95.0 - 100.0) * 10)
+    assert round_trips["mfe"].iloc[0] == pytest.approx((112.0 - 100.0) * 10)
+
+def test_calculate_trade_metrics():
+    pnl = np.array([10.0, 5.0, -3.0, -4.0, -1.0, 8.0])
+    dates = pd.date_range(start=datetime(2020, 1, 1), periods=len(pnl), freq="D")
+    round_trips = pd.DataFrame({
+        "pnl": pnl,
+        "holding_time": pd.to_timedelta(np.ones(len(pnl)), unit="h"),
+        "mae": np.nan,
+        "mfe": np.nan,
+        "exit_date": dates,
+    })
+
+    metrics = calculate_trade_metrics(round_trips)
+
+    assert metrics["total_trades"] == 6
+    assert metrics["win_rate"] == pytest.approx(0.5)
+    assert metrics["profit_factor"] == pytest.approx(23.0 / 8.0)
+    assert metrics["expectancy"] == pytest.approx(pnl.mean())
+    assert metrics["max_consecutive_wins"] == 2
+    assert metrics["max_consecutive_losses"] == 3
+    assert metrics["average_holding_time"] == pytest.approx(3600.0)
+
+def test_calculate_trade_metrics_no_trades():
+    metrics = calculate_trade_metrics(match_round_trips([]))
+
+    assert metrics["total_trades"] == 0
+    assert metrics["win_rate"] == 0
@@ -468,6 +468,49 @@ class TestPerformanceTracker(unittest.TestCase):
         self.assertEqual(self.tracker.data["stats"]["losing_trades"], 1)
         self.assertEqual(self.tracker.data["stats"]["win_rate"], 50.0)
 
+class TestScalperCore(unittest.TestCase):
+    """Test the MetaTrader5-independent core"""
+    
+    def test_import_without_mt5(self):
+        """Test that importing the bot does not load MetaTrader5"""
+        import improved_scalper
+        
+        self.assertNotIn("MetaTrader5", sys.modules)
+        self.assertEqual(improved_scalper.Config().get("trading", "timeframe"), improved_scalper.TIMEFRAME_M5)
+    
+    def test_calculate_lot_size(self):
+        """Test risk based position sizing"""
+        from scalper_core import calculate_lot_size
+        
+        # 1% of 10000 risked over 20 pips at 10 USD per pip
+        lot = calculate_lot_size(10000, 1.0, 20, 0.0001, 100000, 1.0, 5)
+        self.assertAlmostEqual(lot, 0.5)
+        
+        # Limited by the maximum volume and at least the minimum volume
+        self.assertEqual(calculate_lot_size(10000000, 1.0, 20, 0.0001, 100000, 1.0, 5, volume_max=50.0), 50.0)
+        self.assertEqual(calculate_lot_size(100, 1.0, 20, 0.0001, 100000, 1.0, 5, volume_min=0.01), 0.01)
+    
+    def test_resample_rates(self):
+        """Test building higher timeframe bars"""
+        import pandas as pd
+        from scalper_core import TIMEFRAME_M5, TIMEFRAME_M15, resample_rates
+        
+        df = pd.DataFrame({
+            'time': pd.date_range('2025-01-01', periods=6, freq='5min'),
+            'open': [1, 2, 3, 4, 5, 6],
+            'high': [2, 3, 4, 5, 6, 7],
+            'low': [0, 1, 2, 3, 4, 5],
+            'close': [1.5, 2.5, 3.5, 4.5, 5.5, 6.5],
+            'tick_volume': [10, 10, 10, 10, 10, 10],
+        })
+        
+        htf = resample_rates(df, TIMEFRAME_M5, TIMEFRAME_M15)
+        self.assertEqual(len(htf), 2)
+        self.assertEqual(list(htf['open']), [1, 4])
+        self.assertEqual(list(htf['high']), [4, 7])
+        self.assertEqual(list(htf['close']), [3.5, 6.5])
+        self.assertEqual(list(htf['tick_volume']), [30, 30])
+
 class TestTradingBot(unittest.TestCase):
     """Test the TradingBot class"""
     
@@ -0,0 +1,197 @@
+import pytest
+
+from app.core.config import settings
+from app.db.models.order import Order
+from app.db.models.position import Position
+from app.db.models.trading_account import TradingAccount
+from app.db.models.user import User
+from app.schemas.trading import OrderCreate, PositionSync, PositionSyncItem
+from app.services.trading_bulk import trading_bulk_service
+
+def create_account(db, user_id, name="Test Account"):
+    account = TradingAccount(name=name, broker="mt5", account_id="1", api_key="key", api_secret="secret", user_id=user_id)
+    db.add(account)
+    db.commit()
+    return account
+
+def position_item(external_id, quantity=1.0, side="long", price=100.0):
+    return PositionSyncItem(
+        external_id=external_id,
+        symbol="EURUSD",
+        side=side,
+        quantity=quantity,
+        entry_price=price,
+        current_price=price,
+        unrealized_pnl=0.0,
+    )
+
+def order(account_id, **fields):
+    return OrderCreate(**{"trading_account_id": account_id, "symbol": "EURUSD", "order_type": "market", "side": "buy", "quantity": 1.0, **fields})
+
+@pytest.fixture
+def account(db, test_user):
+    return create_account(db, test_user.id)
+
+@pytest.fixture
+def other_account(db):
+    other = User(email="other@example.com", hashed_password="x", is_active=True)
+    db.add(other)
+    db.commit()
+    return create_account(db, other.id, name="Other Account")
+
+def positions_by_external_id(db, account_id):
+    return {position.external_id: position for position in db.query(Position).filter(Position.trading_account_id == account_id)}
+
+def test_create_orders_per_item_status(db, test_user, account, other_account):
+    result = trading_bulk_service.create_orders(db, [
+        order(account.id),
+        order(account.id, order_type="limit"),
+        order(other_account.id),
+        order(account.id, side="hold"),
+        order(account.id, quantity=0),
+        order(account.id, order_type="limit", price=1.1),
+    ], user_id=test_user.id)
+
+    assert (result.created, result.failed) == (2, 4)
+    assert [item.status for item in result.items] == ["created", "failed", "failed", "failed", "failed", "created"]
+    assert [item.error for item in result.items] == [
+        None,
+        "A limit order requires a price",
+        "Trading account not found",
+        "Invalid side: hold",
+        "Quantity must be positive",
+        None,
+    ]
+
+    orders = db.query(Order).order_by(Order.id).all()
+    assert [o.id for o in orders] == [result.items[0].id, result.items[5].id]
+    assert all(o.status == "pending" and o.trading_account_id == account.id for o in orders)
+
+def test_sync_positions_upserts_on_external_id(db, test_user, account):
+    result = trading_bulk_service.sync_positions(db, PositionSync(
+        trading_account_id=account.id,
+        positions=[position_item("a"), position_item("b")],
+    ), user_id=test_user.id)
+    assert (result.created, result.updated) == (2, 0)
+    ids = {item.external_id: item.id for item in result.items}
+
+    result = trading_bulk_service.sync_positions(db, PositionSync(
+        trading_account_id=account.id,
+        positions=[position_item("a", quantity=3.0, price=101.0), position_item("c")],
+    ), user_id=test_user.id)
+    assert (result.created, result.updated, result.removed) == (1, 1, 0)
+    assert [(item.external_id, item.status) for item in result.items] == [("a", "updated"), ("c", "created")]
+
+    # "a" is updated in place, "b" is kept without remove_missing
+    db.expire_all()
+    positions = positions_by_external_id(db, account.id)
+    assert set(positions) == {"a", "b", "c"}
+    assert positions["a"].id == ids["a"]
+    assert (positions["a"].quantity, positions["a"].current_price) == (3.0, 101.0)
+    assert positions["b"].id == ids["b"]
+
+def test_sync_positions_external_id_is_per_account(db, test_user, account):
+    second = create_account(db, test_user.id, name="Second Account")
+    for trading_account in (account, second):
+        trading_bulk_service.sync_positions(db, PositionSync(
+            trading_account_id=trading_account.id,
+            positions=[position_item("a")],
+        ), user_id=test_user.id)
+
+    assert db.query(Position).filter(Position.external_id == "a").count() == 2
+
+def test_sync_positions_remove_missing(db, test_user, account):
+    trading_bulk_service.sync_positions(db, PositionSync(
+        trading_account_id=account.id,
+        positions=[position_item("a"), position_item("b"), position_item("c")],
+    ), user_id=test_user.id)
+
+    # Positions opened outside the broker sync have no external ID and are kept
+    db.add(Position(trading_account_id=account.id, symbol="EURUSD", side="long", quantity=1.0, entry_price=1.0))
+    db.commit()
+
+    result = trading_bulk_service.sync_positions(db, PositionSync(
+        trading_account_id=account.id,
+        positions=[position_item("b")],
+        remove_missing=True,
+    ), user_id=test_user.id)
+
+    assert (result.created, result.updated, result.removed) == (0, 1, 2)
+    db.expire_all()
+    assert set(positions_by_external_id(db, account.id)) == {"b", None}
+
+def test_sync_positions_duplicates_and_invalid_items(db, test_user, account):
+    result = trading_bulk_service.sync_positions(db, PositionSync(
+        trading_account_id=account.id,
+        positions=[
+            position_item("a"),
+            position_item("a", quantity=2.0),
+            position_item("b", side="flat"),
+            position_item("c", quantity=-1.0),
+            position_item("d"),
+        ],
+    ), user_id=test_user.id)
+
+    assert (result.created, result.updated, result.failed) == (2, 0, 3)
+    assert [(item.external_id, item.status, item.error) for item in result.items] == [
+        ("a", "created", None),
+        ("a", "failed", "Duplicate external_id"),
+        ("b", "failed", "Invalid side: flat"),
+        ("c", "failed", "Quantity must be positive"),
+        ("d", "created", None),
+    ]
+
+    # The first occurrence of a duplicate wins
+    db.expire_all()
+    positions = positions_by_external_id(db, account.id)
+    assert set(positions) == {"a", "d"}
+    assert positions["a"].quantity == 1.0
+
+def test_sync_positions_rejects_other_users_account(db, test_user, other_account):
+    trading_bulk_service.sync_positions(db, PositionSync(
+        trading_account_id=other_account.id,
+        positions=[position_item("a")],
+    ), user_id=other_account.user_id)
+
+    result = trading_bulk_service.sync_positions(db, PositionSync(
+        trading_account_id=other_account.id,
+        positions=[position_item("a", quantity=5.0)],
+        remove_missing=True,
+    ), user_id=test_user.id)
+
+    assert result is None
+    db.expire_all()
+    assert positions_by_external_id(db, other_account.id)["a"].quantity == 1.0
+
+def test_bulk_endpoints(client, auth_headers, account, other_account):
+    response = client.post(
+        f"{settings.API_V1_STR}/trading/positions/sync",
+        headers=auth_headers,
+        json={"trading_account_id": other_account.id, "positions": []},
+    )
+    assert response.status_code == 404
+
+    response = client.post(
+        f"{settings.API_V1_STR}/trading/orders/bulk",
+        headers=auth_headers,
+        json={"orders": [order(account.id).dict()]},
+    )
+    assert response.status_code == 200
+    assert response.json()["created"] == 1
+
+def test_bulk_endpoints_limit_items(client, auth_headers, account, monkeypatch):
+    monkeypatch.setattr(settings, "TRADING_BULK_MAX_ITEMS", 2)
+
+    response = client.post(
+        f"{settings.API_V1_STR}/trading/orders/bulk",
+        headers=auth_headers,
+        json={"orders": [order(account.id).dict()] * 3},
+    )
+    assert response.status_code == 413
+
+    response = client.post(
+        f"{settings.API_V1_STR}/trading/positions/sync",
+        headers=auth_headers,
+        json={"trading_account_id": account.id, "positions": [position_item(str(i)).dict() for i in range(3)]},
+    )
+    assert response.status_code == 413
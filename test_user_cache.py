@@ -0,0 +1,124 @@
+import pytest
+from sqlalchemy import event, inspect
+
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db.models.user import User
+from app.services import user_cache as user_cache_module
+from app.services.user_cache import UserCache, user_cache
+
+class Clock:
+    """Monotonic clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(user_cache_module.time, "monotonic", clock)
+    return clock
+
+@pytest.fixture
+def queries(db):
+    """Collect the statements executed on the test connection."""
+    statements = []
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.get_bind().engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+@pytest.fixture
+def superuser(db):
+    user = User(email="admin@example.com", hashed_password="x", is_active=True, is_superuser=True)
+    db.add(user)
+    db.commit()
+    return user
+
+def auth(user):
+    return {"Authorization": f"Bearer {create_access_token(user.id)}"}
+
+def test_ttl_expiry(db, test_user, clock):
+    user_id = test_user.id
+    cache = UserCache(ttl_seconds=30)
+    assert cache.get(db, user_id).email == "test@example.com"
+
+    # Changes made behind the cache's back are not seen until the entry expires
+    db.query(User).filter(User.id == user_id).update({"email": "changed@example.com"})
+    db.commit()
+    db.expunge_all()
+
+    clock.now += 29
+    assert cache.get(db, user_id).email == "test@example.com"
+    db.expunge_all()
+
+    clock.now += 2
+    assert cache.get(db, user_id).email == "changed@example.com"
+
+def test_disabled_with_zero_ttl(db, test_user, queries):
+    cache = UserCache(ttl_seconds=0)
+    cache.get(db, test_user.id)
+    db.expunge_all()
+    del queries[:]
+
+    cache.get(db, test_user.id)
+    assert len(queries) == 1
+
+def test_cached_user_is_merged_without_loading(db, test_user, queries):
+    cache = UserCache(ttl_seconds=30)
+    cache.get(db, test_user.id)
+    db.expunge_all()
+    del queries[:]
+
+    user = cache.get(db, test_user.id)
+
+    # The cached user is attached to the session without a query
+    assert queries == []
+    assert user in db
+    assert user.email == "test@example.com"
+
+    # The session gets its own copy; the cached snapshot stays detached
+    snapshot = cache._entries[str(test_user.id)][1]
+    assert user is not snapshot
+    assert inspect(snapshot).detached
+
+    # Returned users can be used like queried ones
+    user.email = "merged@example.com"
+    db.commit()
+    assert db.query(User.email).filter(User.id == test_user.id).scalar() == "merged@example.com"
+
+def test_max_entries(db, test_user, superuser, clock):
+    cache = UserCache(ttl_seconds=30, max_entries=1)
+    cache.get(db, test_user.id)
+    cache.get(db, superuser.id)
+
+    assert list(cache._entries) == [str(superuser.id)]
+
+def test_update_me_invalidates(client, test_user):
+    response = client.get(f"{settings.API_V1_STR}/users/me", headers=auth(test_user))
+    assert response.json()["email"] == "test@example.com"
+    assert str(test_user.id) in user_cache._entries
+
+    response = client.put(f"{settings.API_V1_STR}/users/me", headers=auth(test_user), json={"email": "me@example.com"})
+    assert response.status_code == 200
+    assert str(test_user.id) not in user_cache._entries
+
+    response = client.get(f"{settings.API_V1_STR}/users/me", headers=auth(test_user))
+    assert response.json()["email"] == "me@example.com"
+
+def test_deactivation_invalidates(client, test_user, superuser):
+    assert client.get(f"{settings.API_V1_STR}/users/me", headers=auth(test_user)).status_code == 200
+
+    response = client.put(f"{settings.API_V1_STR}/users/{test_user.id}", headers=auth(superuser), json={"is_active": False})
+    assert response.status_code == 200
+
+    # The cached user would still be active without the invalidation
+    response = client.get(f"{settings.API_V1_STR}/users/me", headers=auth(test_user))
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Inactive user"
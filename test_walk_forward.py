@@ -0,0 +1,149 @@
+import pytest
+import pandas as pd
+import numpy as np
+from datetime import datetime, timedelta
+
+from app.backtester.engine import walk_forward
+from app.backtester.engine.walk_forward import WalkForward, generate_windows
+
+def create_test_data(days=120):
+    dates = pd.date_range(start=datetime(2020, 1, 1), periods=days, freq="D")
+    close = 100 + np.arange(days, dtype=float)
+    return pd.DataFrame({
+        "date": dates,
+        "open": close,
+        "high": close + 1,
+        "low": close - 1,
+        "close": close,
+        "volume": [1000] * days,
+    })
+
+def fake_run_window(data, strategy_type, parameters, start, end, initial_capital, commission, slippage):
+    # Scores are highest when the parameter equals the month the window starts in
+    window = walk_forward._slice(data, start, end)
+    equity = initial_capital * (1 + 0.001 * parameters["window"]) ** np.arange(len(window))
+    return {
+        "equity_curve": pd.DataFrame({"date": window["date"], "equity": equity}),
+        "trades": [],
+        "metrics": {"sharpe_ratio": -abs(parameters["window"] - start.month)},
+    }
+
+def test_generate_windows():
+    start = datetime(2020, 1, 1)
+    end = datetime(2020, 4, 10)
+
+    windows = generate_windows(start, end, in_sample_days=30, out_of_sample_days=20)
+    assert len(windows) == 4
+    assert windows[0] == (start, start + timedelta(days=30), start + timedelta(days=30), start + timedelta(days=50))
+
+    for previous, current in zip(windows, windows[1:]):
+        # Out-of-sample windows tile the range after the first in-sample window
+        assert current[2] == previous[3]
+    for in_sample_start, in_sample_end, out_of_sample_start, out_of_sample_end in windows:
+        # In-sample and out-of-sample windows are half-open and do not overlap
+        assert in_sample_start < in_sample_end == out_of_sample_start < out_of_sample_end <= end
+
+    # The last out-of-sample window is cut at the end date
+    assert windows[-1][3] == end
+
+    anchored = generate_windows(start, end, in_sample_days=30, out_of_sample_days=20, anchored=True)
+    assert [window[0] for window in anchored] == [start] * len(anchored)
+    assert [window[2:] for window in anchored] == [window[2:] for window in windows]
+
+    assert generate_windows(start, start + timedelta(days=10), in_sample_days=30, out_of_sample_days=20) == []
+
+def test_selects_best_in_sample_parameters(monkeypatch):
+    monkeypatch.setattr(walk_forward, "_run_window", fake_run_window)
+
+    results = WalkForward(
+        strategy_type="test",
+        parameter_grid={"window": [1, 2, 3, 4]},
+        data=create_test_data(),
+        in_sample_days=31,
+        out_of_sample_days=30,
+    ).run()
+
+    for fold in results["folds"]:
+        expected = min(fold["in_sample_start"].month, 4)
+        assert fold["parameters"] == {"window": expected}
+        assert fold["in_sample_score"] == -abs(expected - fold["in_sample_start"].month)
+
+def test_stitches_out_of_sample_equity(monkeypatch):
+    monkeypatch.setattr(walk_forward, "_run_window", fake_run_window)
+    data = create_test_data()
+
+    results = WalkForward(
+        strategy_type="test",
+        parameter_grid={"window": [1, 2]},
+        data=data,
+        in_sample_days=30,
+        out_of_sample_days=20,
+        initial_capital=1000.0,
+    ).run()
+
+    folds = results["folds"]
+    equity_curve = results["equity_curve"]
+
+    # The stitched curve covers every out-of-sample bar once, up to the last bar
+    assert equity_curve["date"].is_monotonic_increasing
+    assert not equity_curve["date"].duplicated().any()
+    assert equity_curve["date"].iloc[0] == folds[0]["out_of_sample_start"]
+    assert equity_curve["date"].iloc[-1] == data["date"].iloc[-1]
+    assert len(equity_curve) == len(data) - 30
+
+    # Each fold starts from the previous fold's final equity
+    assert equity_curve["equity"].iloc[0] == 1000.0
+    boundaries = equity_curve.index[equity_curve["date"].isin([fold["out_of_sample_start"] for fold in folds[1:]])]
+    for i in boundaries:
+        assert equity_curve["equity"].iloc[i] == equity_curve["equity"].iloc[i - 1]
+
+    assert results["metrics"]["total_return"] == pytest.approx(equity_curve["equity"].iloc[-1] / 1000.0 - 1)
+
+def test_overlapping_steps_trade_each_bar_once(monkeypatch):
+    monkeypatch.setattr(walk_forward, "_run_window", fake_run_window)
+    data = create_test_data()
+
+    results = WalkForward(
+        strategy_type="test",
+        parameter_grid={"window": [1, 2]},
+        data=data,
+        in_sample_days=30,
+        out_of_sample_days=20,
+        step_days=10,
+    ).run()
+
+    folds = results["folds"]
+    equity_curve = results["equity_curve"]
+
+    # Each fold's out-of-sample run starts where the previous one ended
+    for previous, current in zip(folds, folds[1:]):
+        assert current["out_of_sample_start"] == previous["out_of_sample_end"]
+    assert not equity_curve["date"].duplicated().any()
+    assert equity_curve["date"].is_monotonic_increasing
+    assert len(equity_curve) == len(data) - 30
+
+def test_rejects_steps_leaving_gaps(monkeypatch):
+    monkeypatch.setattr(walk_forward, "_run_window", fake_run_window)
+
+    with pytest.raises(ValueError):
+        WalkForward(
+            strategy_type="test",
+            parameter_grid={"window": [1]},
+            data=create_test_data(),
+            in_sample_days=30,
+            out_of_sample_days=20,
+            step_days=30,
+        ).run()
+
+def test_serial_run_keeps_no_data(monkeypatch):
+    monkeypatch.setattr(walk_forward, "_run_window", fake_run_window)
+
+    WalkForward(
+        strategy_type="test",
+        parameter_grid={"window": [1, 2]},
+        data=create_test_data(),
+        in_sample_days=30,
+        out_of_sample_days=20,
+    ).run()
+
+    assert walk_forward._worker_data is None
@@ -0,0 +1,257 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Union
+
+ROUND_TRIP_COLUMNS = [
+    "symbol",
+    "entry_date",
+    "exit_date",
+    "entry_price",
+    "exit_price",
+    "quantity",
+    "commission",
+    "pnl",
+    "return",
+    "holding_time",
+    "mae",
+    "mfe",
+]
+
+def match_round_trips(
+    trades: Union[pd.DataFrame, List[Dict]],
+    data: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """
+    Pair the buy and sell records of a portfolio into round-trip trades.
+
+    Each sell is matched with the most recent unmatched buy of the same
+    symbol, which mirrors how `Portfolio.update` opens and closes positions.
+    The matching, P&L and excursion calculations are done on NumPy arrays so
+    that millions of records can be processed without a Python-level loop.
+
+    Args:
+        trades: The trades as recorded in `Portfolio.trades` (a list of dicts
+            or a DataFrame with date, symbol, action, quantity, price and
+            commission columns)
+        data: Optional market data with date, high and low columns, used to
+            compute the maximum adverse and favorable excursions
+
+    Returns:
+        A pandas DataFrame with one row per round-trip trade
+    """
+    if not isinstance(trades, pd.DataFrame):
+        trades = pd.DataFrame(trades)
+
+    if trades.empty:
+        return pd.DataFrame(columns=ROUND_TRIP_COLUMNS)
+
+    # Order records by symbol while keeping the execution order within a symbol
+    symbols = trades["symbol"].to_numpy() if "symbol" in trades.columns else np.full(len(trades), "Unknown", dtype=object)
+    symbol_codes, symbol_names = pd.factorize(symbols)
+    order = np.argsort(symbol_codes, kind="stable")
+
+    symbol_codes = symbol_codes[order]
+    is_buy = trades["action"].to_numpy()[order] == "buy"
+    dates = pd.to_datetime(trades["date"]).to_numpy()[order]
+    prices = trades["price"].to_numpy(dtype=np.float64)[order]
+    quantities = trades["quantity"].to_numpy(dtype=np.float64)[order]
+    if "commission" in trades.columns:
+        commissions = trades["commission"].fillna(0).to_numpy(dtype=np.float64)[order]
+    else:
+        commissions = np.zeros(len(trades))
+
+    # Index of the first record of each row's symbol group
+    positions = np.arange(len(trades))
+    group_start = np.zeros(len(trades), dtype=np.int64)
+    boundaries = np.flatnonzero(np.diff(symbol_codes)) + 1
+    group_start[boundaries] = boundaries
+    group_start = np.maximum.accumulate(group_start)
+
+    # Most recent buy at or before each row, and most recent sell strictly before it
+    last_buy = np.maximum.accumulate(np.where(is_buy, positions, -1))
+    last_sell = np.maximum.accumulate(np.where(~is_buy, positions, -1))
+    prev_sell = np.concatenate(([-1], last_sell[:-1]))
+
+    # A sell closes a trade if an open buy of the same symbol precedes it
+    is_exit = ~is_buy & (last_buy >= group_start) & (last_buy > prev_sell)
+    exits = np.flatnonzero(is_exit)
+    entries = last_buy[exits]
+
+    entry_price = prices[entries]
+    exit_price = prices[exits]
+    quantity = quantities[exits]
+    commission = commissions[entries] + commissions[exits]
+
+    # Calculate per-trade P&L and return on the capital committed
+    pnl = (exit_price - entry_price) * quantity - commission
+    cost = entry_price * quantity + commissions[entries]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        trade_return = np.where(cost != 0, pnl / cost, 0.0)
+
+    entry_date = dates[entries]
+    exit_date = dates[exits]
+
+    # Calculate excursions against the bars spanned by each trade
+    mae = np.full(len(exits), np.nan)
+    mfe = np.full(len(exits), np.nan)
+    if data is not None and len(data) > 0 and len(exits) > 0:
+        mae, mfe = _calculate_excursions(data, entry_date, exit_date, entry_price, quantity)
+
+    round_trips = pd.DataFrame({
+        "symbol": symbol_names.take(symbol_codes[exits]),
+        "entry_date": entry_date,
+        "exit_date": exit_date,
+        "entry_price": entry_price,
+        "exit_price": exit_price,
+        "quantity": quantity,
+        "commission": commission,
+        "pnl": pnl,
+        "return": trade_return,
+        "holding_time": exit_date - entry_date,
+        "mae": mae,
+        "mfe": mfe,
+    })
+
+    # Restore chronological order across symbols
+    return round_trips.sort_values("exit_date", kind="stable").reset_index(drop=True)
+
+def _calculate_excursions(
+    data: pd.DataFrame,
+    entry_date: np.ndarray,
+    exit_date: np.ndarray,
+    entry_price: np.ndarray,
+    quantity: np.ndarray,
+):
+    """
+    Calculate the maximum adverse and favorable excursion of long trades.
+
+    Args:
+        data: The market data
+        entry_date: The entry date of each trade
+        exit_date: The exit date of each trade
+        entry_price: The entry price of each trade
+        quantity: The quantity of each trade
+
+    Returns:
+        A tuple of arrays with the MAE and MFE of each trade in currency
+    """
+    bars = data.sort_values("date")
+    bar_dates = pd.to_datetime(bars["date"]).to_numpy()
+    close = bars["close"].to_numpy(dtype=np.float64)
+    lows = bars["low"].to_numpy(dtype=np.float64) if "low" in bars.columns else close
+    highs = bars["high"].to_numpy(dtype=np.float64) if "high" in bars.columns else close
+
+    # Locate the bar range [start, stop) covered by each trade
+    start = np.searchsorted(bar_dates, entry_date, side="left")
+    stop = np.searchsorted(bar_dates, exit_date, side="right")
+    stop = np.maximum(stop, start + 1)
+
+    # Pad with a neutral element so every index is valid for reduceat
+    lows = np.append(lows, np.inf)
+    highs = np.append(highs, -np.inf)
+    start = np.minimum(start, len(bar_dates))
+    stop = np.minimum(stop, len(bar_dates))
+
+    # Interleave start/stop so the even segments of reduceat are the trade ranges
+    indices = np.empty(2 * len(start), dtype=np.int64)
+    indices[0::2] = start
+    indices[1::2] = stop
+    lowest = np.minimum.reduceat(lows, indices)[0::2]
+    highest = np.maximum.reduceat(highs, indices)[0::2]
+
+    # Trades outside the bar range have no excursion information
+    empty = start >= stop
+    lowest = np.where(empty, np.nan, lowest)
+    highest = np.where(empty, np.nan, highest)
+
+    mae = np.minimum(lowest - entry_price, 0.0) * quantity
+    mfe = np.maximum(highest - entry_price, 0.0) * quantity
+
+    return mae, mfe
+
+def _longest_streak(mask: np.ndarray) -> int:
+    """
+    Get the length of the longest run of True values.
+
+    Args:
+        mask: A boolean array
+
+    Returns:
+        The length of the longest run
+    """
+    if not mask.any():
+        return 0
+
+    # Run boundaries are where the padded mask changes value
+    padded = np.concatenate(([False], mask, [False])).astype(np.int8)
+    changes = np.flatnonzero(np.diff(padded))
+    return int((changes[1::2] - changes[0::2]).max())
+
+def calculate_trade_metrics(round_trips: pd.DataFrame) -> Dict:
+    """
+    Calculate performance metrics from round-trip trades.
+
+    Args:
+        round_trips: The round-trip trades from `match_round_trips`
+
+    Returns:
+        A dictionary with trade-level performance metrics
+    """
+    pnl = round_trips["pnl"].to_numpy(dtype=np.float64) if len(round_trips) > 0 else np.empty(0)
+    total_trades = len(pnl)
+
+    if total_trades == 0:
+        return {
+            "total_trades": 0,
+            "winning_trades": 0,
+            "losing_trades": 0,
+            "win_rate": 0,
+            "profit_factor": 0,
+            "total_pnl": 0,
+            "expectancy": 0,
+            "average_win": 0,
+            "average_loss": 0,
+            "largest_win": 0,
+            "largest_loss": 0,
+            "average_holding_time": 0,
+            "max_consecutive_wins": 0,
+            "max_consecutive_losses": 0,
+            "average_mae": None,
+            "average_mfe": None,
+        }
+
+    wins = pnl > 0
+    losses = ~wins
+    winning_trades = int(wins.sum())
+    losing_trades = total_trades - winning_trades
+
+    # Calculate profit factor
+    gross_profit = pnl[wins].sum()
+    gross_loss = abs(pnl[losses].sum())
+    profit_factor = gross_profit / gross_loss if gross_loss != 0 else float("inf")
+
+    # Average holding time in seconds
+    holding_time = pd.to_timedelta(round_trips["holding_time"]).to_numpy()
+    average_holding_time = holding_time.astype("timedelta64[ns]").astype(np.float64).mean() / 1e9
+
+    mae = round_trips["mae"].to_numpy(dtype=np.float64)
+    mfe = round_trips["mfe"].to_numpy(dtype=np.float64)
+
+    return {
+        "total_trades": total_trades,
+        "winning_trades": winning_trades,
+        "losing_trades": losing_trades,
+        "win_rate": winning_trades / total_trades,
+        "profit_factor": profit_factor,
+        "total_pnl": float(pnl.sum()),
+        "expectancy": float(pnl.mean()),
+        "average_win": float(pnl[wins].mean()) if winning_trades > 0 else 0,
+        "average_loss": float(pnl[losses].mean()) if losing_trades > 0 else 0,
+        "largest_win": float(pnl.max()),
+        "largest_loss": float(pnl.min()),
+        "average_holding_time": float(average_holding_time),
+        "max_consecutive_wins": _longest_streak(wins),
+        "max_consecutive_losses": _longest_streak(losses),
+        "average_mae": float(np.nanmean(mae)) if not np.isnan(mae).all() else None,
+        "average_mfe": float(np.nanmean(mfe)) if not np.isnan(mfe).all() else None,
+    }
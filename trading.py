@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 # Trading Account
@@ -101,3 +101,38 @@ class PositionInDBBase(PositionBase):
 class Position(PositionInDBBase):
     pass
 
+# Bulk operations
+class OrderBulkCreate(BaseModel):
+    orders: List[OrderCreate]
+
+class PositionSyncItem(PositionBase):
+    external_id: str
+
+class PositionSync(BaseModel):
+    trading_account_id: int
+    positions: List[PositionSyncItem]
+    remove_missing: bool = False
+
+class BulkItemResult(BaseModel):
+    index: int
+    status: str  # "created", "updated", "failed"
+    id: Optional[int] = None
+    external_id: Optional[str] = None
+    error: Optional[str] = None
+
+class BulkResult(BaseModel):
+    created: int = 0
+    updated: int = 0
+    removed: int = 0
+    failed: int = 0
+    items: List[BulkItemResult] = []
+
+# Streaming
+class PriceTick(BaseModel):
+    symbol: str
+    bid: float
+    ask: Optional[float] = None
+    time: Optional[float] = None
+
+class PriceTickBatch(BaseModel):
+    ticks: List[PriceTick]
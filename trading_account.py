@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -22,3 +22,7 @@ class TradingAccount(Base):
     orders = relationship("Order", back_populates="trading_account")
     positions = relationship("Position", back_populates="trading_account")
 
+    __table_args__ = (
+        Index("ix_trading_accounts_user_id_created_at", "user_id", "created_at"),
+    )
+
@@ -0,0 +1,169 @@
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional, Set
+
+from app.db.models.order import Order
+from app.db.models.position import Position
+from app.db.models.trading_account import TradingAccount
+from app.schemas.trading import (
+    BulkItemResult,
+    BulkResult,
+    OrderCreate,
+    PositionSync,
+)
+
+ORDER_TYPES = {"market", "limit", "stop"}
+ORDER_SIDES = {"buy", "sell"}
+POSITION_SIDES = {"long", "short"}
+
+def _validate_order(order: OrderCreate, account_ids: Set[int]) -> Optional[str]:
+    """
+    Validate an order.
+
+    Args:
+        order: The order
+        account_ids: The trading accounts the user may trade on
+
+    Returns:
+        An error message, or None if the order is valid
+    """
+    if order.trading_account_id not in account_ids:
+        return "Trading account not found"
+    if order.order_type not in ORDER_TYPES:
+        return f"Invalid order type: {order.order_type}"
+    if order.side not in ORDER_SIDES:
+        return f"Invalid side: {order.side}"
+    if order.quantity <= 0:
+        return "Quantity must be positive"
+    if order.order_type != "market" and order.price is None:
+        return f"A {order.order_type} order requires a price"
+    return None
+
+class TradingBulkService:
+    def get_account_ids(self, db: Session, user_id: int, account_ids: Set[int]) -> Set[int]:
+        """
+        Get the given trading accounts that belong to a user.
+
+        Args:
+            db: The database session
+            user_id: The user ID
+            account_ids: The trading account IDs to check
+
+        Returns:
+            The IDs of the accounts owned by the user
+        """
+        if not account_ids:
+            return set()
+
+        rows = db.query(TradingAccount.id).filter(
+            TradingAccount.id.in_(account_ids),
+            TradingAccount.user_id == user_id,
+        ).all()
+        return {row[0] for row in rows}
+
+    def create_orders(self, db: Session, orders: List[OrderCreate], user_id: int) -> BulkResult:
+        """
+        Create many orders in one transaction.
+
+        Invalid orders are reported per item and do not prevent the valid
+        ones from being created.
+
+        Args:
+            db: The database session
+            orders: The orders
+            user_id: The user ID
+
+        Returns:
+            The per-item results
+        """
+        account_ids = self.get_account_ids(db, user_id, {order.trading_account_id for order in orders})
+
+        result = BulkResult()
+        created = []
+        for index, order in enumerate(orders):
+            error = _validate_order(order, account_ids)
+            if error:
+                result.items.append(BulkItemResult(index=index, status="failed", error=error))
+            else:
+                created.append((index, Order(**order.dict(), status="pending")))
+
+        # One flush inserts the whole batch
+        db.add_all([db_obj for _, db_obj in created])
+        db.commit()
+
+        for index, db_obj in created:
+            result.items.append(BulkItemResult(index=index, status="created", id=db_obj.id))
+
+        result.items.sort(key=lambda item: item.index)
+        result.created = len(created)
+        result.failed = len(orders) - len(created)
+        return result
+
+    def sync_positions(self, db: Session, sync: PositionSync, user_id: int) -> Optional[BulkResult]:
+        """
+        Upsert the positions of a trading account by their broker ID.
+
+        Args:
+            db: The database session
+            sync: The broker's current positions
+            user_id: The user ID
+
+        Returns:
+            The per-item results, or None if the account does not belong to the user
+        """
+        if not self.get_account_ids(db, user_id, {sync.trading_account_id}):
+            return None
+
+        # Load the account's positions once
+        existing: Dict[str, Position] = {
+            position.external_id: position
+            for position in db.query(Position).filter(
+                Position.trading_account_id == sync.trading_account_id,
+                Position.external_id.isnot(None),
+            )
+        }
+
+        result = BulkResult()
+        seen = set()
+        created = []
+        updates = []
+        for index, item in enumerate(sync.positions):
+            if item.external_id in seen:
+                result.items.append(BulkItemResult(index=index, status="failed", external_id=item.external_id, error="Duplicate external_id"))
+                continue
+            if item.side not in POSITION_SIDES:
+                result.items.append(BulkItemResult(index=index, status="failed", external_id=item.external_id, error=f"Invalid side: {item.side}"))
+                continue
+            if item.quantity <= 0:
+                result.items.append(BulkItemResult(index=index, status="failed", external_id=item.external_id, error="Quantity must be positive"))
+                continue
+            seen.add(item.external_id)
+
+            position = existing.get(item.external_id)
+            if position is None:
+                created.append((index, Position(**item.dict(), trading_account_id=sync.trading_account_id)))
+            else:
+                updates.append({"id": position.id, **item.dict()})
+                result.items.append(BulkItemResult(index=index, status="updated", id=position.id, external_id=item.external_id))
+
+        # Apply the whole batch with one executemany per statement type
+        if updates:
+            db.bulk_update_mappings(Position, updates)
+        db.add_all([position for _, position in created])
+
+        removed = [position.id for external_id, position in existing.items() if external_id not in seen]
+        if sync.remove_missing and removed:
+            db.query(Position).filter(Position.id.in_(removed)).delete(synchronize_session=False)
+            result.removed = len(removed)
+
+        db.commit()
+
+        for index, position in created:
+            result.items.append(BulkItemResult(index=index, status="created", id=position.id, external_id=position.external_id))
+
+        result.items.sort(key=lambda item: item.index)
+        result.created = len(created)
+        result.updated = len(updates)
+        result.failed = len(sync.positions) - len(created) - len(updates)
+        return result
+
+trading_bulk_service = TradingBulkService()
@@ -0,0 +1,112 @@
+import asyncio
+
+from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect, status
+from fastapi.concurrency import run_in_threadpool
+from jose import jwt, JWTError
+from typing import List, Optional
+
+from app.api.dependencies import get_current_active_superuser
+from app.core.config import settings
+from app.db.models.position import Position
+from app.db.models.trading_account import TradingAccount
+from app.db.models.user import User
+from app.db.session import SessionLocal
+from app.schemas.trading import PriceTickBatch
+from app.services.position_stream import get_open_positions, position_stream_hub
+from app.services.user_cache import user_cache
+
+router = APIRouter()
+
+def load_account_positions(token: str, trading_account_id: int) -> Optional[List[Position]]:
+    """
+    Authenticate a WebSocket client and load the account's positions.
+
+    Args:
+        token: The access token
+        trading_account_id: The trading account ID
+
+    Returns:
+        The open positions, or None if the token is invalid or the account
+        does not belong to the user
+    """
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError:
+        return None
+
+    user_id = payload.get("sub")
+    if user_id is None:
+        return None
+
+    db = SessionLocal()
+    try:
+        user = user_cache.get(db, user_id)
+        if user is None or not user.is_active:
+            return None
+
+        account = db.query(TradingAccount).filter(TradingAccount.id == trading_account_id).first()
+        if not account or account.user_id != user.id:
+            return None
+
+        return get_open_positions(db, trading_account_id)
+    finally:
+        db.close()
+
+@router.websocket("/accounts/{trading_account_id}/stream")
+async def stream_positions(
+    websocket: WebSocket,
+    trading_account_id: int,
+    token: str = Query(...),
+):
+    """
+    Stream price ticks and unrealized P&L of a trading account.
+
+    Browsers cannot set headers on WebSocket requests, so the access token
+    is passed as a query parameter. Frames are sent at most
+    POSITION_STREAM_FRAME_RATE times per second.
+    """
+    positions = await run_in_threadpool(load_account_positions, token, trading_account_id)
+    if positions is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    queue = position_stream_hub.subscribe(trading_account_id, positions)
+
+    # Detect disconnects even while no frames are being sent
+    receiver = asyncio.ensure_future(websocket.receive_text())
+    try:
+        while True:
+            sender = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+            if receiver in done:
+                # Clients have nothing to send, ignore any messages
+                receiver.result()
+                receiver = asyncio.ensure_future(websocket.receive_text())
+
+            if sender in done:
+                await websocket.send_json(sender.result())
+            else:
+                sender.cancel()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receiver.cancel()
+        position_stream_hub.unsubscribe(trading_account_id, queue)
+
+@router.post("/ticks")
+async def publish_ticks(
+    *,
+    ticks_in: PriceTickBatch,
+    current_user: User = Depends(get_current_active_superuser),
+):
+    """
+    Publish price ticks from a broker feed to the position streams.
+
+    Ticks reach only the streams served by the worker that receives them.
+    """
+    updated = 0
+    for tick in ticks_in.ticks:
+        updated += position_stream_hub.publish_tick(tick.symbol, tick.bid, tick.ask, tick.time)
+
+    return {"ticks": len(ticks_in.ticks), "updated": updated}
@@ -0,0 +1,139 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+from typing import Dict, Optional, Tuple
+import threading
+import time
+
+from app.core.config import settings
+from app.db.models.user import User
+
+class UserCache:
+    """
+    Short-lived in-process cache of authenticated users.
+
+    The cache is per process: `invalidate` only clears the entry in the
+    worker that handled the update, so a user who was deactivated or
+    changed stays valid on other workers for up to `USER_CACHE_TTL_SECONDS`.
+    Keep the TTL short, or set it to 0 where changes must apply everywhere
+    immediately.
+    """
+
+    def __init__(self, ttl_seconds: float = 30, max_entries: int = 10000):
+        """
+        Initialize the user cache.
+
+        Args:
+            ttl_seconds: How long a cached user is trusted (0 disables the cache)
+            max_entries: The maximum number of cached users
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[str, Tuple[float, User]] = {}
+        self._lock = threading.Lock()
+
+    def _snapshot(self, user: User) -> User:
+        """
+        Copy a user's column values into a detached instance.
+
+        Args:
+            user: The user loaded in a session
+
+        Returns:
+            A detached user that is never attached to a session itself
+        """
+        snapshot = User(**{column.key: getattr(user, column.key) for column in User.__table__.columns})
+        make_transient_to_detached(snapshot)
+        return snapshot
+
+    def get(self, db: Session, user_id) -> Optional[User]:
+        """
+        Get a user, from the cache if a fresh entry exists.
+
+        Cached users are merged into the session without loading, so the
+        returned user belongs to `db` like a queried one, without a query.
+
+        Args:
+            db: The database session
+            user_id: The user ID
+
+        Returns:
+            The user, or None if the user does not exist
+        """
+        key = str(user_id)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is not None and entry[0] > now:
+            return db.merge(entry[1], load=False)
+
+        user = db.query(User).filter(User.id == user_id).first()
+        if user is not None and self.ttl_seconds > 0:
+            self._set(key, user, now)
+
+        return user
+
+    async def get_async(self, db: AsyncSession, user_id) -> Optional[User]:
+        """
+        Get a user in an async session, from the cache if a fresh entry exists.
+
+        Args:
+            db: The async database session
+            user_id: The user ID
+
+        Returns:
+            The user, or None if the user does not exist
+        """
+        key = str(user_id)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is not None and entry[0] > now:
+            return await db.merge(entry[1], load=False)
+
+        user = await db.get(User, int(user_id))
+        if user is not None and self.ttl_seconds > 0:
+            self._set(key, user, now)
+
+        return user
+
+    def _set(self, key: str, user: User, now: float):
+        """
+        Cache a user.
+
+        Args:
+            key: The cache key
+            user: The user
+            now: The current monotonic time
+        """
+        snapshot = self._snapshot(user)
+
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                # Drop expired entries first, then the oldest ones
+                self._entries = {k: v for k, v in self._entries.items() if v[0] > now}
+                while len(self._entries) >= self.max_entries:
+                    self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (now + self.ttl_seconds, snapshot)
+
+    def invalidate(self, user_id):
+        """
+        Remove a user from the cache, e.g. after an update or deactivation.
+
+        Args:
+            user_id: The user ID
+        """
+        with self._lock:
+            self._entries.pop(str(user_id), None)
+
+    def clear(self):
+        """
+        Remove all users from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+
+user_cache = UserCache(settings.USER_CACHE_TTL_SECONDS)
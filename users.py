@@ -6,6 +6,7 @@ from app.api.dependencies import get_db, get_current_active_user, get_current_ac
 from app.db.models.user import User
 from app.schemas.user import User as UserSchema, UserCreate, UserUpdate
 from app.services.user import user_service
+from app.services.user_cache import user_cache
 
 router = APIRouter()
 
@@ -61,6 +62,7 @@ def update_user_me(
     Update own user.
     """
     user = user_service.update(db, db_obj=current_user, obj_in=user_in)
+    user_cache.invalidate(user.id)
     return user
 
 @router.get("/{user_id}", response_model=UserSchema)
@@ -99,5 +101,7 @@ def update_user(
             detail="The user with this id does not exist in the system",
         )
     user = user_service.update(db, db_obj=user, obj_in=user_in)
+    
+    # Drop the cached user so changes such as deactivation apply immediately
+    user_cache.invalidate(user.id)
     return user
-
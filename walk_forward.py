@@ -0,0 +1,370 @@
+import pandas as pd
+import numpy as np
+import itertools
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+
+from app.backtester.data.indicator_cache import fingerprint_series, sma, rsi
+from app.backtester.engine.backtest import Backtest
+from app.backtester.engine.performance import calculate_performance
+from app.backtester.strategies.factory import StrategyFactory
+
+def generate_windows(
+    start_date: datetime,
+    end_date: datetime,
+    in_sample_days: int,
+    out_of_sample_days: int,
+    step_days: Optional[int] = None,
+    anchored: bool = False,
+) -> List[Tuple[datetime, datetime, datetime, datetime]]:
+    """
+    Split a date range into in-sample and out-of-sample windows.
+
+    Windows are half-open, [start, end), so consecutive in-sample and
+    out-of-sample windows share a boundary but no bars.
+
+    Args:
+        start_date: The start date
+        end_date: The end date (exclusive)
+        in_sample_days: The length of each in-sample window in days
+        out_of_sample_days: The length of each out-of-sample window in days
+        step_days: The distance between consecutive windows in days
+            (defaults to out_of_sample_days so the out-of-sample windows tile)
+        anchored: Whether every in-sample window starts at start_date
+
+    Returns:
+        A list of (in_sample_start, in_sample_end, out_of_sample_start,
+        out_of_sample_end) tuples
+    """
+    in_sample = timedelta(days=in_sample_days)
+    out_of_sample = timedelta(days=out_of_sample_days)
+    step = timedelta(days=step_days or out_of_sample_days)
+
+    windows = []
+    fold_start = start_date
+    while fold_start + in_sample < end_date:
+        in_sample_start = start_date if anchored else fold_start
+        in_sample_end = fold_start + in_sample
+        out_of_sample_end = min(in_sample_end + out_of_sample, end_date)
+        windows.append((in_sample_start, in_sample_end, in_sample_end, out_of_sample_end))
+        fold_start += step
+
+    return windows
+
+def expand_parameter_grid(parameter_grid: Dict[str, List]) -> List[Dict]:
+    """
+    Expand a parameter grid into a list of parameter sets.
+
+    Args:
+        parameter_grid: A dictionary mapping parameter names to candidate values
+
+    Returns:
+        A list of parameter dictionaries
+    """
+    names = list(parameter_grid)
+    return [dict(zip(names, values)) for values in itertools.product(*parameter_grid.values())]
+
+def precompute_indicators(
+    data: pd.DataFrame,
+    strategy_type: str,
+    parameter_sets: List[Dict],
+) -> pd.DataFrame:
+    """
+    Compute the indicators needed by every parameter set once over the full history.
+
+    The strategies read these columns instead of recomputing them on every
+    bar, so the same rolling means and RSI values are shared by all folds
+    and parameter sets, and by later runs on the same data through the
+    indicator cache. Computing them over the full history also gives
+    each window a proper warm-up from the bars before it.
+
+    Args:
+        data: The market data
+        strategy_type: The type of strategy
+        parameter_sets: The parameter sets that will be evaluated
+
+    Returns:
+        A copy of the market data with the indicator columns added
+    """
+    columns = {}
+    close = data["close"].to_numpy(dtype=np.float64)
+    fingerprint = fingerprint_series(close)
+
+    if strategy_type == "moving_average":
+        windows = set()
+        for parameters in parameter_sets:
+            windows.add(parameters.get("short_window", 50))
+            windows.add(parameters.get("long_window", 200))
+        for window in sorted(windows):
+            columns[f"sma_{window}"] = sma(close, window, fingerprint)
+    elif strategy_type == "rsi":
+        for window in sorted({parameters.get("window", 14) for parameters in parameter_sets}):
+            columns[f"rsi_{window}"] = rsi(close, window, fingerprint)
+
+    return pd.concat([data, pd.DataFrame(columns, index=data.index)], axis=1)
+
+# Market data shared with worker processes, set once per worker
+_worker_data = None
+
+def _init_worker(data: pd.DataFrame):
+    """
+    Store the market data in a worker process.
+
+    Args:
+        data: The market data with precomputed indicators
+    """
+    global _worker_data
+    _worker_data = data
+
+def _slice(data: pd.DataFrame, start: datetime, end: datetime) -> pd.DataFrame:
+    """
+    Select the bars in [start, end).
+
+    Args:
+        data: The market data
+        start: The start date
+        end: The end date
+
+    Returns:
+        The bars in the window
+    """
+    return data[(data["date"] >= start) & (data["date"] < end)].reset_index(drop=True)
+
+def _run_window(
+    data: pd.DataFrame,
+    strategy_type: str,
+    parameters: Dict,
+    start: datetime,
+    end: datetime,
+    initial_capital: float,
+    commission: float,
+    slippage: float,
+) -> Dict:
+    """
+    Run a backtest on one window.
+
+    Args:
+        data: The market data
+        strategy_type: The type of strategy
+        parameters: The strategy parameters
+        start: The window start date
+        end: The window end date
+        initial_capital: The initial capital
+        commission: The commission per trade (percentage)
+        slippage: The slippage per trade (percentage)
+
+    Returns:
+        The backtest results
+    """
+    backtest = Backtest(
+        strategy=StrategyFactory.create_strategy(strategy_type, parameters),
+        data=_slice(data, start, end),
+        initial_capital=initial_capital,
+        commission=commission,
+        slippage=slippage,
+    )
+    return backtest.run()
+
+def _evaluate(task: Tuple, data: Optional[pd.DataFrame] = None) -> float:
+    """
+    Evaluate one parameter set on one in-sample window.
+
+    Args:
+        task: A tuple of (strategy_type, parameters, start, end,
+            initial_capital, commission, slippage, objective)
+        data: The market data (defaults to the worker's data)
+
+    Returns:
+        The value of the objective metric
+    """
+    strategy_type, parameters, start, end, initial_capital, commission, slippage, objective = task
+    data = _worker_data if data is None else data
+    results = _run_window(data, strategy_type, parameters, start, end, initial_capital, commission, slippage)
+    score = results["metrics"].get(objective)
+
+    return float(score) if score is not None and np.isfinite(score) else -np.inf
+
+class WalkForward:
+    """
+    Walk-forward optimization of a strategy's parameters.
+
+    Each out-of-sample fold is a separate backtest that starts flat, with
+    the previous fold's final equity as its cash. Positions still open at
+    the end of a fold are not carried over: they are valued at the fold's
+    last close, as if closed there without commission or slippage.
+
+    With a step shorter than the out-of-sample window the windows overlap,
+    and each fold's out-of-sample run starts where the previous one ended,
+    so every bar is traded once. A longer step would leave bars between
+    the folds untested and is rejected.
+    """
+
+    def __init__(
+        self,
+        strategy_type: str,
+        parameter_grid: Dict[str, List],
+        data: pd.DataFrame,
+        in_sample_days: int,
+        out_of_sample_days: int,
+        step_days: Optional[int] = None,
+        anchored: bool = False,
+        initial_capital: float = 10000.0,
+        commission: float = 0.0,
+        slippage: float = 0.0,
+        objective: str = "sharpe_ratio",
+        n_jobs: int = 1,
+    ):
+        """
+        Initialize the walk-forward optimization.
+
+        Args:
+            strategy_type: The type of strategy
+            parameter_grid: A dictionary mapping parameter names to candidate values
+            data: The historical market data
+            in_sample_days: The length of each in-sample window in days
+            out_of_sample_days: The length of each out-of-sample window in days
+            step_days: The distance between consecutive windows in days
+            anchored: Whether every in-sample window starts at the first bar
+            initial_capital: The initial capital
+            commission: The commission per trade (percentage)
+            slippage: The slippage per trade (percentage)
+            objective: The performance metric to maximize in-sample
+            n_jobs: The number of worker processes for the optimization
+        """
+        self.strategy_type = strategy_type
+        self.parameter_sets = expand_parameter_grid(parameter_grid)
+        self.data = data.assign(date=pd.to_datetime(data["date"])).sort_values("date").reset_index(drop=True)
+        self.in_sample_days = in_sample_days
+        self.out_of_sample_days = out_of_sample_days
+        self.step_days = step_days
+        self.anchored = anchored
+        self.initial_capital = initial_capital
+        self.commission = commission
+        self.slippage = slippage
+        self.objective = objective
+        self.n_jobs = n_jobs
+        self.results = None
+
+    def _optimize(self, data: pd.DataFrame, windows: List[Tuple]) -> List[Tuple[Dict, float]]:
+        """
+        Find the best parameter set for each in-sample window.
+
+        Args:
+            data: The market data with precomputed indicators
+            windows: The walk-forward windows
+
+        Returns:
+            A list of (best_parameters, best_score) tuples, one per window
+        """
+        tasks = [
+            (
+                self.strategy_type,
+                parameters,
+                in_sample_start,
+                in_sample_end,
+                self.initial_capital,
+                self.commission,
+                self.slippage,
+                self.objective,
+            )
+            for in_sample_start, in_sample_end, _, _ in windows
+            for parameters in self.parameter_sets
+        ]
+
+        # Evaluate every (window, parameter set) pair, in parallel if requested
+        if self.n_jobs > 1:
+            with ProcessPoolExecutor(
+                max_workers=self.n_jobs,
+                initializer=_init_worker,
+                initargs=(data,),
+            ) as executor:
+                scores = list(executor.map(_evaluate, tasks, chunksize=max(1, len(tasks) // (4 * self.n_jobs))))
+        else:
+            scores = [_evaluate(task, data) for task in tasks]
+
+        scores = np.array(scores).reshape(len(windows), len(self.parameter_sets))
+        best = scores.argmax(axis=1)
+
+        return [(self.parameter_sets[i], float(scores[fold, i])) for fold, i in enumerate(best)]
+
+    def run(self) -> Dict:
+        """
+        Run the walk-forward optimization.
+
+        Returns:
+            A dictionary with the per-fold results, the stitched
+            out-of-sample equity curve and trades, and its metrics
+        """
+        if self.step_days and self.step_days > self.out_of_sample_days:
+            raise ValueError("step_days cannot exceed out_of_sample_days, the stitched equity curve would have gaps")
+
+        # End one day after the last bar so the last bar is in the final window
+        windows = generate_windows(
+            self.data["date"].iloc[0],
+            self.data["date"].iloc[-1] + timedelta(days=1),
+            self.in_sample_days,
+            self.out_of_sample_days,
+            self.step_days,
+            self.anchored,
+        )
+        if not windows:
+            raise ValueError("Date range is too short for the requested in-sample window")
+
+        data = precompute_indicators(self.data, self.strategy_type, self.parameter_sets)
+        best = self._optimize(data, windows)
+
+        # Run each out-of-sample window from flat, with the equity carried over from the previous one
+        folds = []
+        equity_curves = []
+        trades = []
+        capital = self.initial_capital
+        previous_end = None
+        for (in_sample_start, in_sample_end, out_of_sample_start, out_of_sample_end), (parameters, score) in zip(windows, best):
+            # Overlapping windows only trade the bars after the previous fold
+            if previous_end is not None:
+                out_of_sample_start = max(out_of_sample_start, previous_end)
+            if out_of_sample_start >= out_of_sample_end:
+                continue
+            previous_end = out_of_sample_end
+
+            results = _run_window(
+                data,
+                self.strategy_type,
+                parameters,
+                out_of_sample_start,
+                out_of_sample_end,
+                capital,
+                self.commission,
+                self.slippage,
+            )
+
+            equity_curve = pd.DataFrame(results["equity_curve"])
+            if not equity_curve.empty:
+                capital = float(equity_curve["equity"].iloc[-1])
+                equity_curves.append(equity_curve)
+            if len(results["trades"]) > 0:
+                trades.append(pd.DataFrame(results["trades"]))
+
+            folds.append({
+                "in_sample_start": in_sample_start,
+                "in_sample_end": in_sample_end,
+                "out_of_sample_start": out_of_sample_start,
+                "out_of_sample_end": out_of_sample_end,
+                "parameters": parameters,
+                "in_sample_score": score,
+                "out_of_sample_metrics": results["metrics"],
+            })
+
+        equity_curve = pd.concat(equity_curves, ignore_index=True) if equity_curves else pd.DataFrame(columns=["date", "equity"])
+        trades = pd.concat(trades, ignore_index=True) if trades else pd.DataFrame()
+        metrics = calculate_performance(equity_curve.copy(), trades) if len(equity_curve) > 1 else {}
+
+        self.results = {
+            "folds": folds,
+            "equity_curve": equity_curve,
+            "trades": trades,
+            "metrics": metrics,
+        }
+
+        return self.results